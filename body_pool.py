@@ -0,0 +1,72 @@
+################################################################################
+#
+# body_pool.py - Rev 1.0
+# Copyright (C) 2026 by Joseph B. Attili, joe DOT aa2il AT gmail DOT com
+#
+# Pools of compiled sat bodies, propagators and observers.
+#
+# Parsing a TLE into an ephem body or a PROPAGATOR and setting up an ephem
+# Observer aren't free and we were doing them over & over for the same sats
+# and qths, e.g. once for every SATELLITE object and every time the window
+# slides.  These are built once and handed out from here.  A sat's body &
+# propagator are rebuilt only if its TLE changes.
+#
+# ephem objects carry state (e.g. obs.date) so the pooled observers are
+# only handed out to the gui thread - anyone else gets their own.
+#
+################################################################################
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+################################################################################
+
+import threading
+import ephem
+from propagator import PROPAGATOR
+
+################################################################################
+
+BODIES      = {}           # Sat name --> [tle, ephem body]
+PROPAGATORS = {}           # Sat name --> [tle, PROPAGATOR]
+OBSERVERS   = {}           # qth --> ephem Observer
+
+################################################################################
+
+# Function to return compiled ephem body for a sat
+def get_body(name,tle):
+    if name not in BODIES or BODIES[name][0]!=tle:
+        lines = tle.split('\n')
+        BODIES[name] = [tle, ephem.readtle(lines[0],lines[1],lines[2])]
+    return BODIES[name][1]
+
+# Function to return propagator for a single sat
+def get_propagator(name,tle):
+    if name not in PROPAGATORS or PROPAGATORS[name][0]!=tle:
+        PROPAGATORS[name] = [tle, PROPAGATOR([tle])]
+    return PROPAGATORS[name][1]
+
+# Function to create an observer at qth (lat, lon West-positive, alt m)
+def new_observer(qth):
+    obs = ephem.Observer()
+    obs.lat = str( qth[0] )
+    obs.lon = str( -qth[1] )
+    obs.elevation = qth[2]
+    obs.pressure=0
+    return obs
+
+# Function to return observer at qth
+def get_observer(qth):
+    if threading.current_thread() is not threading.main_thread():
+        return new_observer(qth)
+    key = tuple(qth)
+    if key not in OBSERVERS:
+        OBSERVERS[key] = new_observer(qth)
+    return OBSERVERS[key]
@@ -0,0 +1,241 @@
+################################################################################
+#
+# celestial.py - Rev 1.0
+# Copyright (C) 2026 by Joseph B. Attili, joe DOT aa2il AT gmail DOT com
+#
+# Rise & set of fixed celestial bodies, e.g. meteor shower radiants.
+#
+# A body at a fixed RA & Decl. crosses the horizon when its hour angle H is
+# +/- H0 where
+#
+#    cos(H0) = ( sin(h0) - sin(lat)*sin(dec) ) / ( cos(lat)*cos(dec) )
+#
+# and H is just the local sidereal time minus the RA.  Since sidereal time
+# runs at a constant rate, all of the rises & sets of all of the radiants
+# over any time span can be written down in one shot - no searching needed.
+# Radiants that never set have cos(H0)<-1 and are given back-to-back
+# "passes" from one lower culmination to the next.  Those that never rise
+# have cos(H0)>1 and have no passes at all.
+#
+# The RA & Decl. are J2000 and are precessed to the date.  Nutation &
+# aberration (< 1 arc-min) are ignored - the radiants aren't known anywhere
+# near that well anyway.
+#
+# Sky tracks of the Sun, Moon & radiants are also done in one shot.  The
+# apparent (topocentric) RA & Decl. of a body only change slowly so ephem is
+# called on a coarse grid, these are interpolated to the track times and
+# the az & el follow from the hour angle.  Even for the Moon, whose RA &
+# Decl. wobble by a deg or so each day from parallax, an hourly grid is good
+# to a few hundredths of a deg.  The Sun & Moon are even quicker from the
+# precomputed ephemeris (see ephemeris.py).
+#
+# The current positions of the Sun & Moon are wanted every second or so by
+# the sky plot & map.  Rather than asking ephem each time, the positions are
+# computed at the edges of fixed time buckets and interpolated in between
+# (see POSITION_CACHE).
+#
+################################################################################
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+################################################################################
+
+import numpy as np
+from datetime import datetime, timezone
+from constants import RAD2DEG,DEG2RAD
+from propagator import julian_date,theta_g,TWOPI,SECDAY,OMEGA_E
+from pass_finder import PASS_DTYPE
+from body_pool import get_observer
+from ephemeris import EPHEM_BODIES,body_observe
+
+################################################################################
+
+SIDEREAL_RATE = TWOPI*OMEGA_E/SECDAY   # Rad/sec, rate of change of sidereal time
+ARCSEC        = DEG2RAD/3600.
+RADEC_GRID_DT = 3600.                  # Secs, spacing of ephem samples for sky tracks
+
+################################################################################
+
+# Function to precess J2000 RA & Decl. (deg) to julian date jd (IAU 1976).
+# Returns RA & Decl. of date in radians.
+def precess(ra,dec,jd):
+
+    T     = (jd-2451545.0)/36525.
+    zeta  = ARCSEC*T*(2306.2181+T*(0.30188+0.017998*T))
+    z     = ARCSEC*T*(2306.2181+T*(1.09468+0.018203*T))
+    theta = ARCSEC*T*(2004.3109-T*(0.42665+0.041833*T))
+
+    ra  = DEG2RAD*np.asarray(ra,dtype=float) + zeta
+    dec = DEG2RAD*np.asarray(dec,dtype=float)
+    A = np.cos(dec)*np.sin(ra)
+    B = np.cos(theta)*np.cos(dec)*np.cos(ra) - np.sin(theta)*np.sin(dec)
+    C = np.sin(theta)*np.cos(dec)*np.cos(ra) + np.cos(theta)*np.sin(dec)
+
+    return np.mod(np.arctan2(A,B)+z,TWOPI), np.arcsin(C)
+
+# Function to find all the rises & sets between t1 & t2 of fixed bodies at
+# J2000 RA & Decl. ra & dec (deg) as seen from qth.  Bodies that are up at
+# t1 are picked up at their next rise.  h0 is the elevation (deg) taken as
+# the horizon.  Returns arrays of shape (nbodies,ntransits) of the rise,
+# upper culmination & set times (unix secs).  Missing transits are NaN.
+def radiant_transits(ra,dec,qth,t1,t2,h0=0.):
+
+    ra   = np.atleast_1d(ra).reshape(-1,1)
+    dec  = np.atleast_1d(dec).reshape(-1,1)
+    lat  = qth[0]*DEG2RAD
+    lon  = -qth[1]*DEG2RAD
+
+    # Positions of date - these move < 1 arc-min over a year
+    ra,dec = precess(ra,dec,julian_date(0.5*(t1+t2)))
+
+    # Half the time the radiant is above h0
+    cosH0 = ( np.sin(h0*DEG2RAD) - np.sin(lat)*np.sin(dec) ) / \
+            ( np.cos(lat)*np.cos(dec) )
+    H0 = np.arccos( np.clip(cosH0,-1.,1.) )
+
+    # First rise after t1 ...
+    H1    = np.mod( theta_g(julian_date(t1))+lon-ra, TWOPI )
+    trise = t1 + np.mod( -H0-H1, TWOPI )/SIDEREAL_RATE
+
+    # ... and all the ones after that
+    n     = int( np.ceil( (t2-t1)*SIDEREAL_RATE/TWOPI ) )+1
+    trise = trise + np.arange(n)*TWOPI/SIDEREAL_RATE
+    tca   = trise + H0/SIDEREAL_RATE
+    tset  = tca   + H0/SIDEREAL_RATE
+
+    bad = (trise>t2) | (cosH0>=1.)
+    trise[bad] = np.nan
+    tca[bad]   = np.nan
+    tset[bad]  = np.nan
+
+    return trise,tca,tset
+
+# Function to find passes of fixed bodies at J2000 RA & Decl. ra & dec (deg)
+# between t1 & t2.  Returns a pass table for each body.
+def radiant_passes(ra,dec,qth,t1,t2,h0=0.):
+
+    ra   = np.atleast_1d( np.asarray(ra,dtype=float) )
+    dec  = np.atleast_1d( np.asarray(dec,dtype=float) )
+    trise,tca,tset = radiant_transits(ra,dec,qth,t1,t2,h0)
+
+    # Peak elevation & rise/set azimuths are fixed for a fixed body
+    lat    = qth[0]*DEG2RAD
+    ra,dec = precess(ra,dec,julian_date(0.5*(t1+t2)))
+    max_el = 90.-np.abs(qth[0]-dec*RAD2DEG)
+    cosA   = ( np.sin(dec) - np.sin(lat)*np.sin(h0*DEG2RAD) ) / \
+             ( np.cos(lat)*np.cos(h0*DEG2RAD) )
+    az_aos = np.arccos( np.clip(cosA,-1.,1.) )*RAD2DEG
+
+    tables=[]
+    for i in range(len(ra)):
+        ok = ~np.isnan(trise[i])
+        table = np.zeros(np.count_nonzero(ok),dtype=PASS_DTYPE)
+        table['aos']    = trise[i,ok]
+        table['tca']    = tca[i,ok]
+        table['los']    = tset[i,ok]
+        table['max_el'] = max_el[i]
+        table['az_aos'] = az_aos[i]
+        table['az_los'] = 360.-az_aos[i]
+        for key in ['sunlit','orbit','dark']:
+            table[key] = np.nan
+        tables.append(table)
+
+    return tables
+
+# Function to find passes of a bunch of meteor showers (see meteor_showers.py)
+# over each qth.  All of the radiants are done at once.  Returns a dict of
+# pass tables keyed by shower code for each qth.
+def shower_passes(SHOWERS,names,qths,t1,t2):
+
+    names = [name for name in names if name in SHOWERS]
+    ra    = [float(SHOWERS[name].RA) for name in names]
+    dec   = [float(SHOWERS[name].DE) for name in names]
+
+    passes=[]
+    for qth in qths:
+        tables = radiant_passes(ra,dec,qth,t1,t2)
+        passes.append( dict( zip(names,tables) ) )
+
+    return passes
+
+# Function to compute az & el (deg) at unix times t of bodies at RA & Decl.
+# of date ra & dec (rad) as seen from qth
+def radiant_azel(ra,dec,qth,t):
+
+    lat = qth[0]*DEG2RAD
+    H   = theta_g(julian_date(t)) - qth[1]*DEG2RAD - ra
+    el  = np.arcsin( np.sin(lat)*np.sin(dec) + np.cos(lat)*np.cos(dec)*np.cos(H) )
+    az  = np.arctan2( -np.cos(dec)*np.sin(H),
+                      np.sin(dec)*np.cos(lat) - np.cos(dec)*np.cos(H)*np.sin(lat) )
+    return np.mod(az*RAD2DEG,360.), el*RAD2DEG
+
+# Function to compute az & el (deg) of an ephem body (Sun, Moon, FixedBody,
+# etc.) as seen from qth at unix times t
+def body_azel(body,qth,t,dt=RADEC_GRID_DT):
+
+    t  = np.atleast_1d( np.asarray(t,dtype=float) )
+
+    # The Sun & Moon come from the precomputed ephemeris
+    if body.name in EPHEM_BODIES:
+        obs = body_observe(body.name,t,qth)
+        return obs['azimuth'],obs['elevation']
+
+    tg = np.arange(t.min(),t.max()+2*dt,dt)
+
+    # Apparent RA & Decl. on the coarse grid
+    obs = get_observer(qth)
+    ra  = np.zeros(len(tg))
+    dec = np.zeros(len(tg))
+    for j,tt in enumerate(tg):
+        obs.date = datetime.fromtimestamp(tt,tz=timezone.utc)
+        body.compute(obs)
+        ra[j]  = body.ra
+        dec[j] = body.dec
+
+    ra  = np.interp(t,tg,np.unwrap(ra))
+    dec = np.interp(t,tg,dec)
+    return radiant_azel(ra,dec,qth,t)
+
+################################################################################
+
+# Cache of positions of slowly moving bodies.  Positions are computed at the
+# edges of time buckets of length interval (secs) & interpolated in between.
+# Entries are [az, el, lat, lon, illum] as from SATELLITE.current_radiant_position().
+class POSITION_CACHE:
+    def __init__(self,interval):
+        self.interval = interval
+        self.buckets  = {}               # key --> [bucket no., pos at start, pos at end]
+
+    # Function to return position of body key at unix time t.  func(t) does
+    # the actual computation.
+    def get(self,key,t,func):
+
+        k     = int( t//self.interval )
+        entry = self.buckets.get(key)
+        if entry==None or entry[0]!=k:
+            if entry!=None and entry[0]==k-1:
+                pos1 = entry[2]
+            else:
+                pos1 = func(k*self.interval)
+            entry = [k,pos1,func((k+1)*self.interval)]
+            self.buckets[key] = entry
+
+        # Interpolate - az & lon wrap around
+        s = t/self.interval - k
+        pos1,pos2 = np.array(entry[1]),np.array(entry[2])
+        dpos      = pos2-pos1
+        dpos[0]   = (dpos[0]+180.) % 360. - 180.
+        dpos[3]   = (dpos[3]+180.) % 360. - 180.
+        pos       = pos1 + s*dpos
+        pos[0]    = pos[0] % 360.
+        pos[3]    = (pos[3]+180.) % 360. - 180.
+
+        return pos.tolist()
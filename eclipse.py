@@ -0,0 +1,56 @@
+################################################################################
+#
+# eclipse.py - Rev 1.0
+# Copyright (C) 2026 by Joseph B. Attili, joe DOT aa2il AT gmail DOT com
+#
+# Sunlit/eclipse windows for all sats at once.
+#
+# Some birds (e.g. AO-07) have dead batteries and only work when they're in
+# the sun so it's handy to know when they go in & out of the earth's shadow.
+# The eclipse depth (see propagator.py) of every sat is sampled on a coarse
+# time grid to bracket each shadow entry & exit.  These are then refined all
+# together with the same bracketed root finder used for the passes (see
+# sunlit_windows in pass_finder.py - the passes get their sunlit fractions
+# from these windows too).  A LEO sat spends at least a half hour or so in
+# the sun and, if it's eclipsed at all, 10+ minutes in the shade so a
+# one-minute grid won't miss anything.
+#
+# Windows are returned as structured arrays (see SUNLIT_DTYPE) with times in
+# unix seconds.
+#
+################################################################################
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+################################################################################
+
+import numpy as np
+from pass_finder import sunlit_windows,CHUNK,SHADOW_TOL,SUNLIT_DTYPE
+
+################################################################################
+
+ECLIPSE_GRID_DT = 60        # Coarse grid spacing (secs) used to bracket shadow entry/exit
+
+################################################################################
+
+# Function to find the sunlit windows of all sats in prop between t1 & t2.
+# Windows that are underway at t1 or t2 are chopped there.  Returns a table
+# of windows for each sat.
+def find_sunlit_windows(prop,t1,t2,dt=ECLIPSE_GRID_DT,tol=SHADOW_TOL):
+
+    if prop.nsats==0:
+        return []
+
+    # Coarse look at the eclipse depths of all sats to bracket shadow entry & exit
+    tg = np.arange(t1,t2+dt,dt)
+    depth = np.hstack( [prop.eclipse(tg[i:i+CHUNK]) for i in range(0,len(tg),CHUNK)] )
+
+    return sunlit_windows(prop,tg,depth,t1,t2,tol)
@@ -0,0 +1,174 @@
+################################################################################
+#
+# eme.py - Rev 1.0
+# Copyright (C) 2026 by Joseph B. Attili, joe DOT aa2il AT gmail DOT com
+#
+# EME (moonbounce) window planner for a list of remote grids.
+#
+# An EME sked works when the Moon is above the horizon (or some min.
+# elevation) at both ends.  The Moon's position is evaluated once on a
+# coarse time grid from the precomputed ephemeris (see ephemeris.py) and
+# the elevation from every qth follows from that same set of positions.
+# Moonrises & moonsets at all of the qths are then refined together with
+# the same bracketed root finder used for the passes (see pass_finder.py)
+# and the mutual windows are just the intersections of my Moon windows with
+# those of each remote (see mutual.py).
+#
+# Each window is tagged with the Moon's declination - high dec. means long
+# windows for northern stations - and how far the Moon is from the Sun, since
+# sky noise goes way up when the Sun is near the beam.
+#
+################################################################################
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+################################################################################
+
+import time
+import numpy as np
+from constants import RAD2DEG
+from propagator import julian_date,topocentric
+from ephemeris import body_eci
+from pass_finder import refine
+from mutual import intersect_intervals
+
+################################################################################
+
+EME_GRID_DT = 300           # Coarse grid spacing (secs) used to bracket moonrise & moonset - the Moon is slow
+EME_TOL     = 1.            # Convergence tolerance on moonrise & moonset times (secs)
+SUN_SEP_MIN = 15.           # Deg, flag windows where the Moon is closer than this to the Sun
+
+# Moon window table
+MOON_DTYPE = np.dtype([('start',  'f8'),          # Unix secs
+                       ('end',    'f8')])
+
+# EME window table - dec & sun_sep are at the middle of the window
+EME_DTYPE = np.dtype([('start',    'f8'),         # Unix secs
+                      ('end',      'f8'),
+                      ('dec',      'f8'),         # Deg
+                      ('sun_sep',  'f8'),         # Deg
+                      ('near_sun', '?')])
+
+################################################################################
+
+# Function to find the windows when the Moon is up at each qth between t1 &
+# t2.  min_el can be a single value or one for each qth.  Windows that are
+# underway at t1 or t2 are chopped there.  Returns a table of windows for
+# each qth.
+def find_moon_windows(qths,t1,t2,min_el=0.,dt=EME_GRID_DT,tol=EME_TOL):
+
+    nqths  = len(qths)
+    min_el = np.broadcast_to( np.asarray(min_el,dtype=float), (nqths,) )
+
+    # topocentric() is happy with arrays of qths - one for each time
+    lat,lon,alt = np.array(qths,dtype=float).T
+    def elevation(pos,jd,iqth):
+        qth = (lat[iqth],lon[iqth],alt[iqth])
+        return topocentric(pos,np.zeros(pos.shape),jd,qth)['elevation']
+
+    # Coarse look at the Moon from all qths - the Moon is only evaluated once
+    tg    = np.arange(t1,t2+dt,dt)
+    jd    = julian_date(tg)
+    pos   = body_eci('Moon',tg)[0]
+    iqth  = np.arange(nqths).reshape(-1,1)
+    f     = elevation(pos,jd,iqth) - min_el[iqth]
+    up    = f>=0
+
+    # Refine all of the moonrises & moonsets in one shot
+    def elev(iqth,t):
+        return elevation(body_eci('Moon',t)[0],julian_date(t),iqth) - min_el[iqth]
+    iqth_r,kr = np.nonzero( ~up[:,:-1] &  up[:,1:] )
+    iqth_s,ks = np.nonzero(  up[:,:-1] & ~up[:,1:] )
+    iqth  = np.concatenate( (iqth_r,iqth_s) )
+    k     = np.concatenate( (kr,ks) )
+    troot = refine(elev,iqth,tg[k],tg[k+1],f[iqth,k],f[iqth,k+1],tol=tol)
+    nr    = len(kr)
+    rises = troot[:nr]
+    sets  = troot[nr:]
+
+    # Pair up moonrises & moonsets for each qth.  If the Moon is up at the
+    # ends of the grid, use the ends of the time span.
+    windows=[]
+    for i in range(nqths):
+        r = list( np.sort(rises[iqth_r==i]) )
+        s = list( np.sort(sets[iqth_s==i]) )
+        if up[i,0]:
+            r.insert(0,t1)
+        if up[i,-1]:
+            s.append(t2)
+        table = np.zeros(len(r),dtype=MOON_DTYPE)
+        table['start'] = np.clip(r,t1,t2)
+        table['end']   = np.clip(s,t1,t2)
+        windows.append( table[table['end']>table['start']] )
+
+    return windows
+
+# Function to find EME windows between qth and each of the remote qths
+# between t1 & t2.  min_el can be a single value or one for me & one for
+# the remotes.  Returns a table of windows for each remote.
+def find_eme_windows(qth,qths,t1,t2,min_el=0.):
+
+    min_el = np.atleast_1d( np.asarray(min_el,dtype=float) )
+    min_el = np.concatenate( ([min_el[0]], np.broadcast_to(min_el[-1],(len(qths),))) )
+    moon   = find_moon_windows([qth]+list(qths),t1,t2,min_el)
+    mine   = moon[0]
+
+    eme=[]
+    for theirs in moon[1:]:
+        w = intersect_intervals(mine['start'],mine['end'],theirs['start'],theirs['end'])
+        table = np.zeros(len(w),dtype=EME_DTYPE)
+        table['start'] = w['start']
+        table['end']   = w['end']
+        eme.append(table)
+
+    # Declination & Sun separation at the middle of all the windows at once
+    tmid = np.concatenate( [0.5*(w['start']+w['end']) for w in eme] )
+    if len(tmid)>0:
+        moon_pos = body_eci('Moon',tmid)[0]
+        sun_pos  = body_eci('Sun',tmid)[0]
+        rm  = np.sqrt( np.sum(moon_pos*moon_pos,axis=-1) )
+        rs  = np.sqrt( np.sum(sun_pos*sun_pos,axis=-1) )
+        dec = np.arcsin( moon_pos[:,2]/rm )*RAD2DEG
+        sep = np.arccos( np.clip( np.sum(moon_pos*sun_pos,axis=-1)/(rm*rs), -1., 1.) )*RAD2DEG
+        i=0
+        for w in eme:
+            n = len(w)
+            w['dec']      = dec[i:i+n]
+            w['sun_sep']  = sep[i:i+n]
+            w['near_sun'] = sep[i:i+n]<SUN_SEP_MIN
+            i+=n
+
+    return eme
+
+################################################################################
+
+# Function to list windows where the Moon is workable with a bunch of grids
+def list_eme_windows(P):
+
+    t1 = time.time()
+    t2 = t1 + P.NDAYS2*86400
+    windows = find_eme_windows(P.my_qth,P.eme_qths,t1,t2,P.EME_EL)
+
+    # Sort windows for all the grids together & print them
+    rows=[]
+    for grid,w in zip(P.EME_GRIDS,windows):
+        for start,end,dec,sep,near in w:
+            rows.append( (start,end,grid,dec,sep,near) )
+    rows.sort()
+
+    print('\nEME windows workable from',P.MY_GRID,'with min. elevation',P.EME_EL,'deg:\n')
+    print('%-8s %-20s %-10s %9s %6s %8s' % ('Grid','Start','End','Dur (min)','Dec','Sun Sep'))
+    for start,end,grid,dec,sep,near in rows:
+        print('%-8s %-20s %-10s %9.1f %6.1f %8.1f %s' %
+              (grid,time.strftime('%Y-%m-%d %H:%M:%S',time.localtime(start)),
+               time.strftime('%H:%M:%S',time.localtime(end)),(end-start)/60.,
+               dec,sep,'<-- Near Sun' if near else ''))
+    print('\n',len(rows),'windows found\n')
@@ -0,0 +1,255 @@
+################################################################################
+#
+# ephemeris.py - Rev 1.0
+# Copyright (C) 2026 by Joseph B. Attili, joe DOT aa2il AT gmail DOT com
+#
+# Compact Sun & Moon ephemeris for year-scale queries.
+#
+# For EME planning we want the Moon's position & phase over months at a
+# time.  Asking ephem for each point is slow so, once a year, ephem is used
+# to build a piecewise Chebyshev fit of the apparent geocentric position of
+# the Sun & Moon (the way the JPL ephemerides are done).  Each segment is
+# SEG_DAYS long with NCOEF coefficients for each of x, y, z & the
+# illumination (%).  These are stored in a small npz file for each year
+# and then evaluated for any number of times in one shot.  The positions
+# agree with ephem to about 0.001-0.003 deg, far better than needed for
+# pointing or rise & set times.
+#
+# Positions are in the equatorial frame of date - the same frame as the sat
+# ECI positions (see propagator.py) - so the az, el, range & range rate
+# from any qth come straight from topocentric().  The times of new & full
+# moon are also stored so the lunation (moon phase) is just a look-up.
+#
+################################################################################
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+################################################################################
+
+import os
+import calendar
+import numpy as np
+import ephem
+from numpy.polynomial import chebyshev
+from constants import RAD2DEG
+from propagator import julian_date,theta_g,topocentric,AU,SECDAY
+from pass_cache import CACHE_DIR
+from utilities import error_trap
+
+################################################################################
+
+EPHEM_VERSION = 1                  # Bump this if the fits change
+EPHEM_BODIES  = ['Sun','Moon']
+SEG_DAYS      = 4                  # Length of each Chebyshev segment (days)
+NCOEF         = 12                 # No. of Chebyshev coefficients per segment
+EPHEM_EPOCH   = 25567.5            # Unix epoch as an ephem date (days since 1899-12-31 12:00 UT)
+
+EPHEMERIDES   = {}                 # (body,year) --> EPHEMERIS
+
+################################################################################
+
+# Functions to convert between unix times & ephem dates
+def ephem_date(t):
+    return t/SECDAY + EPHEM_EPOCH
+
+def unix_time(d):
+    return (d-EPHEM_EPOCH)*SECDAY
+
+# Function to return start of a (UTC) year in unix secs
+def year_start(year):
+    return float( calendar.timegm((year,1,1,0,0,0)) )
+
+# Function to return (UTC) years of unix times t
+def years_of(t):
+    t     = np.asarray(t,dtype=float)
+    y0    = int( np.datetime64(int(np.min(t)),'s').astype('datetime64[Y]').astype(int) ) + 1970
+    y1    = int( np.datetime64(int(np.max(t)),'s').astype('datetime64[Y]').astype(int) ) + 1970
+    edges = [year_start(y) for y in range(y0+1,y1+1)]
+    return y0 + np.searchsorted(edges,t,side='right')
+
+################################################################################
+
+# Structure to hold the ephemeris of the Sun or Moon for a single year
+class EPHEMERIS:
+    def __init__(self,body,year,cache_dir=CACHE_DIR):
+
+        self.body  = body
+        self.year  = year
+        self.t0    = year_start(year)
+        self.seg   = SEG_DAYS*SECDAY
+        self.nseg  = int( np.ceil( (year_start(year+1)-self.t0)/self.seg ) )
+        self.fname = os.path.join( os.path.expanduser(cache_dir),
+                                   'ephem_%s_%d.npz' % (body.lower(),year) )
+
+        # Read ephemeris file, if we have one, otherwise generate it
+        self.coefs = None
+        try:
+            if os.path.exists(self.fname):
+                data = np.load(self.fname)
+                if int(data['version'])==EPHEM_VERSION and data['coefs'].shape==(self.nseg,NCOEF,4):
+                    self.coefs      = data['coefs']
+                    self.new_moons  = data['new_moons']
+                    self.full_moons = data['full_moons']
+                else:
+                    print('EPHEMERIS: Ignoring stale ephemeris file',self.fname)
+        except:
+            error_trap('EPHEMERIS: Unable to read ephemeris file '+self.fname)
+
+        if self.coefs is None:
+            self.generate()
+            self.save()
+
+        # Coefficients of the rates of change
+        self.dcoefs = chebyshev.chebder(self.coefs,axis=1)*2./self.seg
+        self.dcoefs = np.concatenate( (self.dcoefs,np.zeros((self.nseg,1,4))), axis=1 )
+
+    # Function to fit the ephemeris.  ephem is sampled at the Chebyshev nodes
+    # of each segment & the coefficients follow from a discrete cosine transform.
+    def generate(self):
+
+        print('EPHEMERIS: Generating',self.body,'ephemeris for',self.year,'...')
+        body = getattr(ephem,self.body)()
+        k    = np.arange(NCOEF)
+        x    = np.cos( np.pi*(k+0.5)/NCOEF )
+        t    = self.t0 + self.seg*( np.arange(self.nseg).reshape(-1,1) + 0.5*(x+1) )
+
+        vals = np.zeros( t.shape+(4,) )
+        for idx,tt in np.ndenumerate(t):
+            body.compute( ephem.Date(ephem_date(tt)) )
+            r  = body.earth_distance*AU
+            ra = body.g_ra
+            de = body.g_dec
+            vals[idx] = [r*np.cos(de)*np.cos(ra), r*np.cos(de)*np.sin(ra), r*np.sin(de),
+                         body.phase if self.body=='Moon' else 0.]
+
+        T          = np.cos( np.outer(k,np.arccos(x)) )
+        self.coefs = 2./NCOEF * np.einsum('dk,skc->sdc',T,vals)
+        self.coefs[:,0,:] *= 0.5
+
+        # Times of new & full moon, with one either side of the year
+        self.new_moons  = self.lunar_phases(ephem.next_new_moon)
+        self.full_moons = self.lunar_phases(ephem.next_full_moon)
+
+    # Function to find times of a lunar phase from just before to just after the year
+    def lunar_phases(self,next_phase):
+        times=[]
+        d = ephem.Date( ephem_date(self.t0) - 31 )
+        while True:
+            d = next_phase(d)
+            times.append( unix_time(d) )
+            if times[-1]>year_start(self.year+1):
+                break
+        return np.array(times)
+
+    # Function to save the ephemeris
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.fname),exist_ok=True)
+            with open(self.fname,'wb') as fp:
+                np.savez(fp,version=EPHEM_VERSION,coefs=self.coefs,
+                         new_moons=self.new_moons,full_moons=self.full_moons)
+        except:
+            error_trap('EPHEMERIS: Unable to write ephemeris file '+self.fname)
+
+    # Function to evaluate the fits at unix times t.  Returns arrays of
+    # shape t.shape+(4,) of x, y, z (km) & illumination (%) and of their
+    # rates of change (per sec).
+    def evaluate(self,t):
+
+        t    = np.asarray(t,dtype=float)
+        iseg = np.clip( ((t-self.t0)//self.seg).astype(int), 0, self.nseg-1 )
+        x    = 2.*(t-self.t0-iseg*self.seg)/self.seg - 1.
+
+        # Chebyshev polynomials at x
+        T = np.ones( x.shape+(NCOEF,) )
+        T[...,1] = x
+        for k in range(2,NCOEF):
+            T[...,k] = 2*x*T[...,k-1] - T[...,k-2]
+
+        vals  = np.einsum('...k,...kc->...c',T,self.coefs[iseg])
+        rates = np.einsum('...k,...kc->...c',T,self.dcoefs[iseg])
+
+        return vals,rates
+
+    # Function to compute geocentric ECI position & velocity (km, km/s) at unix times t
+    def eci(self,t):
+        vals,rates = self.evaluate(t)
+        return vals[...,:3],rates[...,:3]
+
+    # Function to return lunation (0=new, 0.5=full, 1=new) at unix times t
+    def lunation(self,t):
+        t   = np.asarray(t,dtype=float)
+        i   = np.clip( np.searchsorted(self.new_moons,t,side='right'), 1, len(self.new_moons)-1 )
+        pnm = self.new_moons[i-1]
+        nnm = self.new_moons[i]
+        return (t-pnm)/(nnm-pnm)
+
+################################################################################
+
+# Function to return ephemeris for a body & year
+def get_ephemeris(body,year):
+    key = (body,int(year))
+    if key not in EPHEMERIDES:
+        EPHEMERIDES[key] = EPHEMERIS(body,int(year))
+    return EPHEMERIDES[key]
+
+# Function to evaluate func(ephemeris,t) for unix times t that may span
+# several years
+def by_year(body,t,func):
+    t     = np.atleast_1d( np.asarray(t,dtype=float) )
+    years = years_of(t)
+    out   = None
+    for year in np.unique(years):
+        idx = years==year
+        val = func(get_ephemeris(body,year),t[idx])
+        if out is None:
+            out = np.zeros( t.shape+np.shape(val)[1:] )
+        out[idx] = val
+    return out
+
+# Function to compute geocentric ECI position & velocity (km, km/s) of the
+# Sun or Moon at unix times t
+def body_eci(body,t):
+    t    = np.atleast_1d( np.asarray(t,dtype=float) )
+    vals = by_year(body,t,lambda e,tt: np.concatenate(e.eci(tt),axis=-1))
+    return vals[:,0:3],vals[:,3:6]
+
+# Function to compute observables of the Sun or Moon as seen from qth at
+# unix times t.  Returns a dict with az, el, range & range rate (as from
+# topocentric()) as well as the sub-body point & the illumination (%).
+def body_observe(body,t,qth):
+
+    t     = np.atleast_1d( np.asarray(t,dtype=float) )
+    vals  = by_year(body,t,lambda e,tt: np.concatenate(e.evaluate(tt),axis=-1))
+    pos   = vals[:,0:3]
+    vel   = vals[:,4:7]
+    jd    = julian_date(t)
+
+    obs = topocentric(pos,vel,jd,qth)
+    r   = np.sqrt( np.sum(pos*pos,axis=-1) )
+    obs['latitude']  = np.arcsin(pos[:,2]/r)*RAD2DEG
+    obs['longitude'] = ( np.arctan2(pos[:,1],pos[:,0]) - theta_g(jd) )*RAD2DEG
+    obs['longitude'] = (obs['longitude']+180.) % 360. - 180.
+    obs['illum']     = vals[:,3]
+    return obs
+
+# Function to return lunation (0=new, 0.5=full, 1=new) at unix times t
+def moon_lunation(t):
+    return by_year('Moon',t,lambda e,tt: e.lunation(tt))
+
+# Function to return times of new & full moons in a year, sorted by time
+def moons_in_year(year):
+    e     = get_ephemeris('Moon',year)
+    t1,t2 = year_start(year),year_start(year+1)
+    moons = [(t,'new') for t in e.new_moons if t1<=t<t2] + \
+            [(t,'full') for t in e.full_moons if t1<=t<t2]
+    moons.sort()
+    return moons
@@ -31,6 +31,7 @@
 ################################################################################
 
 NDAYS1 = 15
+LOAD_NPROCS = None                  # No. processes used to compute passes at startup (None=all cores)
 COLORS=['b','g','r','c','m','y','k',
         'dodgerblue','lime','orange','aqua','indigo','gold','gray',
         'navy','limegreen','tomato','cyan','purple','yellow','dimgray']
@@ -68,7 +69,16 @@ from collections import OrderedDict
 from params import PARAMS
 from watchdog import WatchDog
 from rig_control import RigControl
-from sat_class import SATELLITE,USE_PYPREDICT
+from sat_class import SATELLITE,USE_PYPREDICT,get_tle,local_times
+from propagator import PROPAGATOR
+from pass_finder import pass_worker
+from pass_cache import PASS_CACHE
+from mutual import clipped_mutual_windows
+from celestial import shower_passes
+from tle_catalog import read_keps
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor,as_completed
+from concurrent.futures.process import BrokenProcessPool
 from mapping import MAPPING
 if USE_PYPREDICT:
     import predict
@@ -1087,17 +1097,224 @@ class SAT_GUI(QMainWindow):
         for isat in ['Moon','Sun']:
             if isat not in self.P.SATELLITE_LIST:
                 SAT_LIST.append(isat)
+
+        # Compute passes of the (artificial) sats
+        self.P.gui.status_bar.setText('Propagating orbits ...')
+        tles=OrderedDict()
+        for name in SAT_LIST[1:]:
+            if name not in CELESTIAL_BODY_LIST+METEOR_SHOWER_LIST:
+                tle=get_tle(self.P.CATALOG,name)
+                if tle:
+                    tles[name]=tle
+        t1 = time.mktime(date1.timetuple())
+        t2 = time.mktime(date2.timetuple())
+        qths = [self.P.my_qth]
+        if self.P.GRID2:
+            qths.append(self.P.other_qth)
+        passes = self.compute_passes(tles,qths,t1,t2)
+
+        # Rise & set of all the meteor shower radiants in one shot
+        showers = shower_passes(self.P.SHOWERS,
+                                [name for name in SAT_LIST if name in METEOR_SHOWER_LIST],
+                                qths,t1,t2)
+        for p,sh in zip(passes,showers):
+            p.update(sh)
+
+        # Keep these around so we can slide the window forward later on
+        self.sat_tles   = tles
+        self.pass_qths  = qths
+        self.SAT_LIST   = SAT_LIST
+        self.new_window = None
+        self.window_thread = None
+
         for isat in range(1,len(SAT_LIST) ):
             name=SAT_LIST[isat]
             self.P.gui.status_bar.setText('Loading data for '+name+' ...')
             self.Satellites[name]=SATELLITE(isat,name,self.P.my_qth,
-                                            date1,date2,self.P.TLE,self.P.SHOWERS)
+                                            date1,date2,self.P.CATALOG,self.P.SHOWERS,
+                                            passes=passes[0].get(name,[]))
             if self.P.GRID2:
                 self.Satellites2[name]=SATELLITE(isat,name,self.P.other_qth,
-                                                 date1,date2,self.P.TLE,self.P.SHOWERS)
+                                                 date1,date2,self.P.CATALOG,self.P.SHOWERS,
+                                                 passes=passes[1].get(name,[]))
                 sat2=self.Satellites2[name]
+        self.compute_mutual_windows()
                 
         
+    # Compute passes for all the sats over a list of qths.  Passes we've seen
+    # before are pulled from the on-disk cache.  The rest are dealt out to a
+    # pool of processes and the results collected as they arrive.  The pool
+    # is forked since spawning would re-run pySat.py in each worker.  Where
+    # fork isn't available (e.g. Windows) or in the background, the passes
+    # are computed serially & the gui is left alone.
+    def compute_passes(self,tles,qths,t1,t2,background=False):
+
+        # See what needs to be computed - sats missing the same span at the
+        # same qths are lumped together so they can be propagated together
+        caches = [PASS_CACHE(qth) for qth in qths]
+        groups = OrderedDict()
+        for name,tle in tles.items():
+            spans = [cache.missing(name,tle,t1,t2) for cache in caches]
+            iqths = tuple( [i for i,span in enumerate(spans) if span] )
+            if len(iqths)>0:
+                span = ( min([spans[i][0] for i in iqths]) , max([spans[i][1] for i in iqths]) )
+                groups.setdefault( (span,iqths) ,[]).append(name)
+        todo = [ (span,iqths,names) for (span,iqths),names in groups.items() ]
+        print('COMPUTE PASSES: Need to compute',sum([len(x[2]) for x in todo]),'sat passes')
+
+        # Each sat is propagated once for all of the qths that need it
+        def run(span,iqths,names):
+            return pass_worker([tles[name] for name in names],[qths[i] for i in iqths],
+                               span[0],span[1])
+        def store(span,iqths,names,result):
+            for iqth,pp in zip(iqths,result):
+                for name,p in zip(names,pp):
+                    caches[iqth].store(name,tles[name],span,p)
+
+        serial = background or 'fork' not in multiprocessing.get_all_start_methods()
+        if len(todo)>0 and serial:
+            for span,iqths,names in todo:
+                store(span,iqths,names,run(span,iqths,names))
+
+        elif len(todo)>0:
+            nprocs = min( LOAD_NPROCS or os.cpu_count() or 1 ,
+                          max([len(x[2]) for x in todo]) )
+            try:
+                ctx = multiprocessing.get_context('fork')
+                with ProcessPoolExecutor(max_workers=nprocs,mp_context=ctx) as pool:
+                    jobs={}
+                    for span,iqths,names in todo:
+                        for i in range(nprocs):
+                            group = names[i::nprocs]
+                            if len(group)>0:
+                                job = pool.submit(pass_worker,[tles[name] for name in group],
+                                                  [qths[i] for i in iqths],span[0],span[1])
+                                jobs[job] = (span,iqths,group)
+                    ndone=0
+                    for job in as_completed(jobs):
+                        span,iqths,group = jobs[job]
+                        store(span,iqths,group,job.result())
+                        ndone+=1
+                        self.P.gui.status_bar.setText('Computed passes for '+', '.join(group)+
+                                                      ' ('+str(ndone)+'/'+str(len(jobs))+') ...')
+                        self.P.app.processEvents()
+
+            except (BrokenProcessPool,OSError):
+                error_trap('GUI->COMPUTE PASSES: Process pool failed - computing passes serially')
+                for span,iqths,names in todo:
+                    store(span,iqths,names,run(span,iqths,names))
+
+        # Pull everything out of the cache
+        passes = []
+        for cache in caches:
+            cache.evict(t1)
+            cache.save()
+            passes.append( OrderedDict( [(name,cache.lookup(name,tle,t1,t2))
+                                         for name,tle in tles.items()] ) )
+
+        return passes
+        
+    # Function to find windows where each sat is workable from both grids.
+    # The passes we already have are clipped to the min. elevation so only
+    # the crossings need to be propagated.
+    def compute_mutual_windows(self):
+
+        self.mutual={}
+        if not self.P.GRID2:
+            return
+        names   = list(self.sat_tles.keys())
+        prop    = PROPAGATOR(list(self.sat_tles.values()))
+        windows = clipped_mutual_windows(prop,self.P.my_qth,self.P.other_qth,
+                                         [self.Satellites[name].passes for name in names],
+                                         [self.Satellites2[name].passes for name in names],
+                                         self.P.MUTUAL_EL)
+        self.mutual = dict( zip(names,windows) )
+        
+    # Function to slide the time window forward once the day rolls over.  The
+    # new passes are computed in the background and swapped in later on by
+    # apply_new_window.  Fresh keps are read in each time since we may have
+    # been running for weeks.  The pass cache is keyed by TLE so only the new
+    # day and sats with new TLEs need to be computed.
+    def slide_window(self):
+
+        date1 = datetime.now() - timedelta(days=NDAYS1)
+        if date1.date()<=self.start_date.date() or self.new_window or \
+           (self.window_thread and self.window_thread.is_alive()):
+            return
+        date2 = date1 + timedelta(days=self.P.NDAYS2+NDAYS1)
+        print('SLIDE WINDOW: Extending passes to',date1,date2)
+        self.window_thread = threading.Thread(target=self.compute_new_window,
+                                              args=(date1,date2),daemon=True)
+        self.window_thread.start()
+
+    # Worker thread to compute passes for new time window
+    def compute_new_window(self,date1,date2):
+
+        try:
+            catalog = read_keps(self.P.KEPS_FILE,self.P.KEPS_URL)
+        except OSError:
+            error_trap('GUI->COMPUTE NEW WINDOW: Unable to read keps - keeping the old TLEs')
+            catalog = self.P.CATALOG
+
+        try:
+            tles = OrderedDict()
+            for name,tle in self.sat_tles.items():
+                tles[name] = get_tle(catalog,name) or tle
+            t1 = time.mktime(date1.timetuple())
+            t2 = time.mktime(date2.timetuple())
+            passes = self.compute_passes(tles,self.pass_qths,t1,t2,background=True)
+
+            # The Sun, Moon & meteor showers don't have TLEs - just redo them
+            showers = shower_passes(self.P.SHOWERS,
+                                    [name for name in self.SAT_LIST if name in METEOR_SHOWER_LIST],
+                                    self.pass_qths,t1,t2)
+            for iqth,qth in enumerate(self.pass_qths):
+                passes[iqth].update(showers[iqth])
+                for isat in range(1,len(self.SAT_LIST)):
+                    name=self.SAT_LIST[isat]
+                    if name in CELESTIAL_BODY_LIST:
+                        passes[iqth][name]=SATELLITE(isat,name,qth,date1,date2,
+                                                     catalog,self.P.SHOWERS).passes
+
+            self.new_window = (date1,date2,catalog,tles,passes)
+        except:
+            error_trap('GUI->COMPUTE NEW WINDOW: Unable to compute passes')
+    
+    # Function to swap in the passes for the new time window.  The existing
+    # SATELLITE objects are updated in place since the gui holds on to them,
+    # e.g. the sat we're tracking.
+    def apply_new_window(self):
+
+        if not self.new_window:
+            return
+        date1,date2,catalog,tles,passes = self.new_window
+        print('APPLY NEW WINDOW:',date1,date2)
+        self.P.CATALOG = catalog
+        self.sat_tles  = tles
+        
+        Sats=[self.Satellites]
+        if self.P.GRID2:
+            Sats.append(self.Satellites2)
+        for iqth,Satellites in enumerate(Sats):
+            for name,Sat in Satellites.items():
+                if name in tles and tles[name]!=Sat.tle:
+                    print('APPLY NEW WINDOW: New TLE for',name)
+                    Sat.set_tle(tles[name])
+                if name in passes[iqth]:
+                    Sat.set_passes(passes[iqth][name])
+
+        self.start_date = date1
+        self.end_date   = date2
+        self.cal.setMinimumDate(self.start_date)
+        self.cal.setMaximumDate(self.end_date)
+        self.compute_mutual_windows()
+
+        # Redraw passes
+        self.fig.clf()
+        self.now=None
+        self.draw_passes()
+        self.new_window = None
+        
     # Plot passes for all sats
     def draw_passes(self):
 
@@ -1120,11 +1337,30 @@ class SAT_GUI(QMainWindow):
             c2='w'
             self.ax.plot(Sat.t2,Sat.y2,'*',color=c2,markersize=12)
 
+            # Show passes that are in the earth's shadow (solid) or partly
+            # in the shadow (dashed) and those we might see with the naked eye
+            tt,yy = Sat.segments(Sat.eclipsed())
+            self.ax.plot(tt,yy,'-',linewidth=2,color='k')
+            tt,yy = Sat.segments(Sat.part_eclipsed())
+            self.ax.plot(tt,yy,'--',linewidth=2,color='k')
+            vis = Sat.visual()
+            self.ax.plot(local_times(Sat.passes['aos'][vis]),
+                         np.full(np.count_nonzero(vis),Sat.isat),'o',color='y',markersize=8)
+
             if self.P.GRID2:
                 Sat2=self.Satellites2[name]
                 c3='k'
                 self.ax.plot(Sat2.t,Sat2.y,'-',label=name,linewidth=4,color=c3)
 
+                # Show when the sat is workable from both grids
+                if name in self.mutual:
+                    w  = self.mutual[name]
+                    ts = local_times(w['start'])
+                    te = local_times(w['end'])
+                    tt = np.stack( (ts,ts,te,te), axis=1 ).ravel()
+                    yy = np.tile( [np.nan,Sat.isat,Sat.isat,np.nan], len(w) )
+                    self.ax.plot(tt,yy,'-',linewidth=2,color='r')
+
         # Beautify the x-labels
         self.fig.autofmt_xdate()
         myFmt = mdates.DateFormatter('%H:%M')
@@ -1382,27 +1618,28 @@ class SAT_GUI(QMainWindow):
                     
             else:
                 self.transit = Sat.next_transit(ttt)
+
+            # There might not be a pass in the span we look ahead
+            if self.transit is None:
+                self.SatName.setText( sat )
+                for w in [self.AOS,self.LOS,self.PeakEl,self.SRng]:
+                    w.setText('')
+                self.status_bar.setText('No pass of '+sat+' found')
+                return
+
+            # Tabulate pass so the tracking loop doesn't have to propagate the orbit
+            Sat.make_track_table(self.transit.start,self.transit.end)
                 
             if USE_PYPREDICT:
                 
                 # Assemble data for sky track
-                t=self.transit.start
-                tt=[]
-                az=[]
-                el=[]
-                lats=[]
-                lons=[]
-                footprints=[]
-                while t<self.transit.end:
-                    obs=predict.observe(tle, self.P.my_qth,at=t)
-                    #print('obs=',obs)
-                    tt.append(t)
-                    az.append(obs['azimuth'])
-                    el.append(obs['elevation'])
-                    lats.append(obs['latitude'])
-                    lons.append(obs['longitude'])
-                    footprints.append(obs['footprint'])
-                    t+=10
+                tt=np.arange(self.transit.start,self.transit.end,10.)
+                obs=predict.observe_many(tle, self.P.my_qth,tt)
+                az=obs['azimuth']
+                el=obs['elevation']
+                lats=obs['latitude']
+                lons=obs['longitude']
+                footprints=obs['footprint']
 
                 # Debug
                 if False:
@@ -119,6 +119,13 @@ class MAPPING(QMainWindow):
         rev_mins=24.*60./revs
         print('rev per day=',revs,'\t',rev_mins)
         
+        # With pypredict, the whole track is computed in one shot
+        if USE_PYPREDICT:
+            t0  = time.mktime( tstart.timetuple() )
+            tt  = t0 + 60.*np.arange( int(npasses*rev_mins+2) )
+            obs = predict.observe_many(Sat.tle,self.P.my_qth,tt)
+            return obs['longitude'],obs['latitude'],obs['footprint']
+        
         lons=[]
         lats=[]
         footprints=[]
@@ -126,10 +133,7 @@ class MAPPING(QMainWindow):
             dt = timedelta(minutes=m)
             t = time.mktime( (tstart+dt).timetuple() )
             
-            if USE_PYPREDICT:
-                obs = predict.observe(Sat.tle,self.P.my_qth,t)
-            else:
-                obs = Sat.observe(t)
+            obs = Sat.observe(t)
                 
             lon=obs['longitude']
             lat=obs['latitude']
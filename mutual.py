@@ -0,0 +1,176 @@
+################################################################################
+#
+# mutual.py - Rev 1.0
+# Copyright (C) 2026 by Joseph B. Attili, joe DOT aa2il AT gmail DOT com
+#
+# Mutual visibility windows between two grids.
+#
+# A sat is workable between two stations when it is above the horizon (or
+# some min. elevation) at both ends.  The passes over each qth are sorted,
+# non-overlapping intervals so the windows are just the intersections of
+# the two sets of intervals.  These are found for all passes at once with a
+# couple of binary searches.
+#
+# For a min. elevation above the horizon, the passes we already have are
+# clipped to the part above min_el.  Each pass climbs to TCA and then falls
+# so there is one crossing either side of TCA.  These are refined for all
+# passes of all sats at once with the same root finder used for the passes
+# (see pass_finder.py) so only a handful of points per pass are propagated.
+#
+################################################################################
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+################################################################################
+
+import time
+import numpy as np
+from propagator import PROPAGATOR
+from pass_finder import find_passes_multi,refine
+
+################################################################################
+
+# Mutual window table - ipass1 & ipass2 index into the pass tables for each qth
+MUTUAL_DTYPE = np.dtype([('start',  'f8'),          # Unix secs
+                         ('end',    'f8'),
+                         ('ipass1', 'i8'),
+                         ('ipass2', 'i8')])
+
+################################################################################
+
+# Function to intersect two sets of sorted, non-overlapping intervals
+# [a1,b1] & [a2,b2].  Returns a table of the intersections sorted by time.
+def intersect_intervals(a1,b1,a2,b2):
+
+    a1 = np.asarray(a1,dtype=float)
+    b1 = np.asarray(b1,dtype=float)
+    a2 = np.asarray(a2,dtype=float)
+    b2 = np.asarray(b2,dtype=float)
+
+    # For each interval in set 1, the ones in set 2 that overlap it are
+    # those that end after it starts and start before it ends
+    lo = np.searchsorted(b2,a1,side='right')
+    hi = np.searchsorted(a2,b1,side='left')
+    n  = np.maximum(hi-lo,0)
+
+    # Form all of the overlapping pairs
+    i1 = np.repeat( np.arange(len(a1)), n )
+    i2 = np.repeat( lo, n ) + np.arange(n.sum()) - np.repeat( np.cumsum(n)-n, n )
+
+    start = np.maximum(a1[i1],a2[i2])
+    end   = np.minimum(b1[i1],b2[i2])
+    ok    = end>start
+
+    table = np.zeros(np.count_nonzero(ok),dtype=MUTUAL_DTYPE)
+    table['start']  = start[ok]
+    table['end']    = end[ok]
+    table['ipass1'] = i1[ok]
+    table['ipass2'] = i2[ok]
+    return table
+
+# Function to find mutual windows for a sat given its pass tables for each qth
+def mutual_windows(passes1,passes2):
+    return intersect_intervals(passes1['aos'],passes1['los'],
+                               passes2['aos'],passes2['los'])
+
+# Function to clip the passes of all sats in prop over qth to the part above
+# min_el.  passes is a list of pass tables, one for each sat.  Returns a list
+# of (start,end,ipass) for each sat where ipass indexes into its pass table.
+def clip_passes(prop,passes,qth,min_el=0.):
+
+    if min_el<=0:
+        return [(p['aos'],p['los'],np.arange(len(p))) for p in passes]
+
+    # Passes that get high enough from all the sats together
+    isat  = np.concatenate( [np.full(len(p),i,dtype=int) for i,p in enumerate(passes)] )
+    ipass = np.concatenate( [np.arange(len(p)) for p in passes] ).astype(int)
+    table = np.concatenate( passes ) if len(passes)>0 else np.zeros(0)
+    if len(table)==0:
+        return [(np.zeros(0),np.zeros(0),np.zeros(0,dtype=int)) for p in passes]
+    high  = table['max_el']>min_el
+    isat,ipass,table = isat[high],ipass[high],table[high]
+
+    # Refine the crossings either side of TCA.  If a pass starts or ends
+    # above min_el (e.g. chopped at the end of the window), keep its ends.
+    def elev(isat,t):
+        return prop.observe_pairs(isat,t,qth)['elevation'] - min_el
+    f_aos = elev(isat,table['aos'])
+    f_tca = table['max_el'] - min_el
+    f_los = elev(isat,table['los'])
+    rise  = refine(elev,isat,table['aos'],table['tca'],f_aos,f_tca)
+    fall  = refine(elev,isat,table['tca'],table['los'],f_tca,f_los)
+    start = np.where(f_aos<0,rise,table['aos'])
+    end   = np.where(f_los<0,fall,table['los'])
+
+    return [(start[isat==i],end[isat==i],ipass[isat==i]) for i in range(len(passes))]
+
+# Function to find mutual windows for all sats in prop with a min. elevation
+# at each end given their pass tables over each qth.  min_el can be a single
+# value or one for each qth.  ipass1 & ipass2 index into passes1 & passes2.
+# Returns a table of windows for each sat.
+def clipped_mutual_windows(prop,qth1,qth2,passes1,passes2,min_el=0.):
+
+    min_el = np.broadcast_to( np.asarray(min_el,dtype=float), (2,) )
+    clip1  = clip_passes(prop,passes1,qth1,min_el[0])
+    clip2  = clip_passes(prop,passes2,qth2,min_el[1])
+
+    windows=[]
+    for (start1,end1,ipass1),(start2,end2,ipass2) in zip(clip1,clip2):
+        table = intersect_intervals(start1,end1,start2,end2)
+        table['ipass1'] = ipass1[table['ipass1']]
+        table['ipass2'] = ipass2[table['ipass2']]
+        windows.append(table)
+    return windows
+
+# Function to find mutual windows for all sats in prop between t1 & t2 with
+# a min. elevation at each end.  min_el can be a single value or one for
+# each qth.  Returns a table of windows for each sat.
+def find_mutual_windows(prop,qth1,qth2,t1,t2,min_el=0.):
+    passes1,passes2 = find_passes_multi(prop,[qth1,qth2],t1,t2)
+    return clipped_mutual_windows(prop,qth1,qth2,passes1,passes2,min_el)
+
+################################################################################
+
+# Function to list windows where sats are workable with the other grid
+def list_mutual_windows(P):
+
+    if not P.GRID2:
+        print('LIST MUTUAL WINDOWS: Need to specify the other grid with -grid2')
+        return
+
+    # Gather TLEs for the sats we're interested in
+    tles={}
+    for name in P.SATELLITE_LIST:
+        tle = P.CATALOG.get(name)
+        if tle:
+            tles[name]=tle
+    prop = PROPAGATOR(list(tles.values()))
+
+    # Compute windows
+    t1 = time.time()
+    t2 = t1 + P.NDAYS2*86400
+    windows = find_mutual_windows(prop,P.my_qth,P.other_qth,t1,t2,P.MUTUAL_EL)
+
+    # Sort windows for all the sats together & print them
+    rows=[]
+    for name,w in zip(tles.keys(),windows):
+        for start,end in zip(w['start'],w['end']):
+            rows.append( (start,end,name) )
+    rows.sort()
+
+    print('\nWindows workable between',P.MY_GRID,'and',P.GRID2,
+          'with min. elevation',P.MUTUAL_EL,'deg:\n')
+    print('%-12s %-20s %-10s %s' % ('Sat','Start','End','Dur (min)'))
+    for start,end,name in rows:
+        print('%-12s %-20s %-10s %5.1f' %
+              (name,time.strftime('%Y-%m-%d %H:%M:%S',time.localtime(start)),
+               time.strftime('%H:%M:%S',time.localtime(end)),(end-start)/60.))
+    print('\n',len(rows),'windows found\n')
@@ -55,6 +55,16 @@ class PARAMS:
                               type=str,default=None)
         arg_proc.add_argument("-grid2", help="Show passes covering another grid",
                               type=str,default=None)
+        arg_proc.add_argument("-mutual_el", help="Min. elevation at both grids for mutual windows",
+                              type=float,default=0.)
+        arg_proc.add_argument('-list_mutual', action='store_true',
+                              help='List windows workable with -grid2 and exit')
+        arg_proc.add_argument("-eme", help="List EME (Moon) windows workable with these grids and exit",
+                              type=str,default=None,nargs='+')
+        arg_proc.add_argument("-eme_el", help="Min. Moon elevation for EME windows - mine [theirs]",
+                              type=float,default=[0.],nargs='+')
+        arg_proc.add_argument('-lookahead', action='store_true',
+                              help='Compensate Doppler for rig command latency')
         arg_proc.add_argument('-sdr', action='store_true',
                               help='Command SDR also')
         arg_proc.add_argument("-tstart", help="Start Time",
@@ -92,6 +102,10 @@ class PARAMS:
         self.SAT_MODE      = False
 
         self.GRID2         = args.grid2
+        self.MUTUAL_EL     = args.mutual_el
+        self.LIST_MUTUAL   = args.list_mutual
+        self.EME_GRIDS     = args.eme
+        self.EME_EL        = args.eme_el
             
         self.ROTOR_CONNECTION = args.rotor
         self.PORT2            = args.port2
@@ -102,6 +116,7 @@ class PARAMS:
                 self.PORT2==232
 
         self.USE_SDR          = args.sdr
+        self.LOOKAHEAD        = args.lookahead
         self.SDR_CONNECTION   = 'HAMLIB'
         self.PORT3            = 4575            # Needs to be same port SDR is listening on
 
@@ -0,0 +1,142 @@
+################################################################################
+#
+# pass_cache.py - Rev 1.0
+# Copyright (C) 2026 by Joseph B. Attili, joe DOT aa2il AT gmail DOT com
+#
+# On-disk cache of predicted passes.
+#
+# The passes only change when the TLEs or our location change so there's no
+# point in recomputing them every time we fire up.  The passes for each qth
+# are kept in a json file, by sat and by (UTC) day of AOS.  Each sat is
+# tagged with a key formed from its TLE epoch & checksums - if the TLE
+# changes, the passes for that sat are thrown out and recomputed.  Otherwise,
+# only the days we haven't seen before need to be computed.
+#
+################################################################################
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+################################################################################
+
+import os
+import json
+import zlib
+from pass_finder import pass_table
+from utilities import error_trap
+
+################################################################################
+
+CACHE_DIR     = '~/.cache/pySat'   # Where the pass cache lives
+CACHE_VERSION = 3                  # Bump this if the pass finder changes
+SECS_PER_DAY  = 86400
+
+################################################################################
+
+# Function to form cache key for a TLE from its epoch & checksums
+def tle_key(tle):
+    lines = tle.split('\n')
+    crc   = zlib.crc32( (lines[1]+lines[2]).encode() )
+    return lines[1][18:32].strip()+':'+lines[1][68:69]+lines[2][68:69]+':'+hex(crc)
+
+# Function to return day number of a unix time
+def day_of(t):
+    return int(t//SECS_PER_DAY)
+
+################################################################################
+
+# Structure to hold the cached passes for a single qth
+class PASS_CACHE:
+    def __init__(self,qth,cache_dir=CACHE_DIR):
+
+        self.qth   = [round(float(x),4) for x in qth]
+        self.fname = os.path.join( os.path.expanduser(cache_dir),
+                                   'passes_%.4f_%.4f_%.0f.json' % tuple(self.qth) )
+        self.sats  = {}
+        self.dirty = False
+
+        # Read cache file, if we have one
+        try:
+            if os.path.exists(self.fname):
+                with open(self.fname) as fp:
+                    data = json.load(fp)
+                if data['version']==CACHE_VERSION and data['qth']==self.qth:
+                    self.sats = data['sats']
+                else:
+                    print('PASS CACHE: Ignoring stale cache file',self.fname)
+        except:
+            error_trap('PASS CACHE: Unable to read cache file '+self.fname)
+            self.sats = {}
+
+    # Function to return entry for a sat, tossing it if the TLE has changed
+    def entry(self,name,tle):
+        key = tle_key(tle)
+        if name not in self.sats or self.sats[name]['tle']!=key:
+            self.sats[name] = {'tle':key, 'days':{}}
+            self.dirty = True
+        return self.sats[name]
+
+    # Function to return days spanned by passes that overlap [t1,t2].  We
+    # include the day before since a pass may start before midnight.
+    def days(self,t1,t2):
+        return range(day_of(t1)-1,day_of(t2)+1)
+
+    # Function to return span of time that needs to be computed for a sat
+    # to cover [t1,t2], or None if we already have everything
+    def missing(self,name,tle,t1,t2):
+        e    = self.entry(name,tle)
+        days = [d for d in self.days(t1,t2) if str(d) not in e['days']]
+        if len(days)==0:
+            return None
+        return (days[0]*SECS_PER_DAY, (days[-1]+1)*SECS_PER_DAY)
+
+    # Function to store the passes for a sat computed over span
+    def store(self,name,tle,span,passes):
+        e = self.entry(name,tle)
+        for d in range(day_of(span[0]),day_of(span[1])):
+            e['days'][str(d)] = []
+        for p in pass_table(passes).tolist():
+            if span[0]<=p[0]<span[1]:
+                e['days'][str(day_of(p[0]))].append( list(p) )
+        self.dirty = True
+
+    # Function to return the cached passes for a sat that overlap [t1,t2]
+    def lookup(self,name,tle,t1,t2):
+        e = self.entry(name,tle)
+        passes = []
+        for d in self.days(t1,t2):
+            for p in e['days'].get(str(d),[]):
+                if p[1]>t1 and p[0]<t2:
+                    passes.append(p)
+        return pass_table( sorted(passes) )
+
+    # Function to toss passes for days before t so the cache doesn't grow forever
+    def evict(self,t):
+        d0 = day_of(t)-1
+        for e in self.sats.values():
+            old = [d for d in e['days'].keys() if int(d)<d0]
+            for d in old:
+                del e['days'][d]
+                self.dirty = True
+
+    # Function to write cache to disk
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.fname),exist_ok=True)
+            tmp = self.fname+'.tmp'
+            with open(tmp,'w') as fp:
+                json.dump({'version':CACHE_VERSION, 'qth':self.qth,
+                           'sats':self.sats},fp)
+            os.replace(tmp,self.fname)
+            self.dirty = False
+        except:
+            error_trap('PASS CACHE: Unable to write cache file '+self.fname)
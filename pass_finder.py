@@ -0,0 +1,338 @@
+################################################################################
+#
+# pass_finder.py - Rev 1.0
+# Copyright (C) 2026 by Joseph B. Attili, joe DOT aa2il AT gmail DOT com
+#
+# Horizon-crossing pass finder for all sats at once.
+#
+# We used to step through the passes one at a time with ephem's next_pass,
+# nudging the start time by a second and retrying whenever it came back
+# empty-handed.  This could take forever and, for a few birds (e.g. AO-07),
+# get stuck going backwards.  Instead, the elevation of every sat is sampled
+# on a coarse time grid (see PROPAGATOR) to bracket each rise and set.  The
+# crossings are then refined with a bracketed root finder (Illinois flavor of
+# regula falsi) on el - min_el, which always converges and takes only a
+# handful of propagations per pass.  All of the brackets are refined together
+# so each iteration is a single vectorized call to the propagator.  The time
+# of closest approach is found the same way as the root of the range rate.
+#
+# The eclipse depths come along for free on the same grid so the shadow
+# entry & exit times are refined the same way (see also eclipse.py).  These
+# give the fraction of each pass that the sat is in sunlight (battery-dead
+# birds like AO-07 only work in the sun).  We also note whether we're in the
+# dark at TCA.  A sat that's lit up while we're in the dark is a visual pass.
+#
+# Passes are returned as structured arrays (see PASS_DTYPE) with times in
+# unix seconds and angles in degrees.
+#
+################################################################################
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+################################################################################
+
+import numpy as np
+from propagator import PROPAGATOR,julian_date,sun_elevation
+
+################################################################################
+
+PASS_GRID_DT = 60           # Coarse grid spacing (secs) used to bracket crossings
+GRID_PAD     = 3600         # Pad grid (secs) so passes straddling the ends are whole
+CHUNK        = 1440         # No. time samples to propagate at once
+ROOT_TOL     = 0.1          # Convergence tolerance on crossing times (secs)
+SHADOW_TOL   = 1.           # Convergence tolerance on shadow entry/exit times (secs)
+MAX_ITER     = 30           # Cap on root finder iterations
+GRAZE_EL     = 5.           # Check dips this close (deg) to min_el for grazing passes
+DARK_EL      = -12.         # We're in the dark when the sun is below this (deg)
+
+# Pass table - one row per pass.  sunlit & dark are NaN if we don't know.
+PASS_DTYPE = np.dtype([('aos',    'f8'),          # Unix secs
+                       ('los',    'f8'),
+                       ('tca',    'f8'),
+                       ('max_el', 'f8'),          # Deg
+                       ('az_aos', 'f8'),
+                       ('az_los', 'f8'),
+                       ('sunlit', 'f8'),          # Fraction of pass in sunlight
+                       ('orbit',  'f8'),          # Orbit no. at TCA
+                       ('dark',   'f8')])         # 1 if we're in the dark at TCA
+
+# Sunlit window table
+SUNLIT_DTYPE = np.dtype([('start',  'f8'),          # Unix secs
+                         ('end',    'f8')])
+
+################################################################################
+
+# Function to make a pass table from a list of rows (or another table)
+def pass_table(rows=[]):
+    if isinstance(rows,np.ndarray) and rows.dtype==PASS_DTYPE:
+        return rows
+    return np.array([tuple(row) for row in rows],dtype=PASS_DTYPE)
+
+################################################################################
+
+# Function to refine a set of brackets [a,b] containing a sign change of
+# func(isat,t) all at once.  Returns the roots.
+def refine(func,isat,a,b,fa,fb,tol=ROOT_TOL,max_iter=MAX_ITER):
+
+    a    = np.array(a,dtype=float)
+    b    = np.array(b,dtype=float)
+    fa   = np.array(fa,dtype=float)
+    fb   = np.array(fb,dtype=float)
+    c    = 0.5*(a+b)
+    side = np.zeros(len(a),dtype=int)
+    active = np.ones(len(a),dtype=bool)
+
+    for it in range(max_iter):
+        k = np.where(active)[0]
+        if len(k)==0:
+            break
+
+        # False position step - fall back to bisection if things are flat
+        den  = fb[k]-fa[k]
+        cnew = np.where(den!=0, (a[k]*fb[k]-b[k]*fa[k])/np.where(den!=0,den,1.),
+                        0.5*(a[k]+b[k]))
+        fc   = func(isat[k],cnew)
+        c[k] = cnew
+
+        # Root lies between a & c - move b.  If b was also moved last time,
+        # halve fa to keep the bracket shrinking from both sides (Illinois)
+        left = fc*fa[k]<0
+        kl   = k[left]
+        b[kl]  = cnew[left]
+        fb[kl] = fc[left]
+        fa[kl[side[kl]==-1]] *= 0.5
+        side[kl] = -1
+
+        # Root lies between c & b - move a
+        right = fc*fb[k]<0
+        kr    = k[right & ~left]
+        a[kr]  = cnew[right & ~left]
+        fa[kr] = fc[right & ~left]
+        fb[kr[side[kr]==1]] *= 0.5
+        side[kr] = 1
+
+        # Done?
+        done = (fc==0) | (np.abs(b[k]-a[k])<tol)
+        active[k[done]] = False
+
+    return c
+
+################################################################################
+
+# Function to find the sunlit windows of all sats in prop between t1 & t2
+# given the eclipse depths on the coarse time grid tg.  Each shadow entry &
+# exit is bracketed by the grid and they're all refined in one shot.
+# Windows that are underway at t1 or t2 are chopped there.  Returns a table
+# of windows for each sat.
+def sunlit_windows(prop,tg,depth,t1,t2,tol=SHADOW_TOL):
+
+    lit = depth<0
+    isat_r,kr = np.nonzero( ~lit[:,:-1] &  lit[:,1:] )
+    isat_s,ks = np.nonzero(  lit[:,:-1] & ~lit[:,1:] )
+    isat  = np.concatenate( (isat_r,isat_s) )
+    k     = np.concatenate( (kr,ks) )
+    troot = refine(prop.eclipse_pairs,isat,tg[k],tg[k+1],depth[isat,k],depth[isat,k+1],
+                   tol=tol)
+    nr    = len(kr)
+    rises = troot[:nr]
+    sets  = troot[nr:]
+
+    # Pair up sunrises & sunsets for each sat.  Sats that are in the sun at
+    # the ends of the grid get the ends of the time span.
+    windows=[]
+    for i in range(prop.nsats):
+        r = list( np.sort(rises[isat_r==i]) )
+        s = list( np.sort(sets[isat_s==i]) )
+        if lit[i,0]:
+            r.insert(0,t1)
+        if lit[i,-1]:
+            s.append(t2)
+        table = np.zeros(len(r),dtype=SUNLIT_DTYPE)
+        table['start'] = np.clip(r,t1,t2)
+        table['end']   = np.clip(s,t1,t2)
+        windows.append( table[table['end']>table['start']] )
+
+    return windows
+
+# Function to find fraction of each pass [aos[k],los[k]] that sat isat[k] is
+# in sunlight given the sunlit windows of each sat
+def sunlit_fraction(windows,isat,aos,los):
+    frac = np.zeros(len(aos))
+    for i in np.unique(isat):
+        k   = np.where(isat==i)[0]
+        w   = windows[i]
+        a   = aos[k].reshape(-1,1)
+        b   = los[k].reshape(-1,1)
+        lit = np.maximum( np.minimum(b,w['end'])-np.maximum(a,w['start']), 0 )
+        frac[k] = np.clip( np.sum(lit,axis=1)/(los[k]-aos[k]), 0, 1 )
+    return frac
+
+################################################################################
+
+# Function to find time of closest approach (TCA) of sat isat[k] during the
+# pass [aos[k],los[k]] for each k.  TCA is where the range rate goes through
+# zero.  Passes chopped at the ends of the time span may not have a zero
+# crossing so we use the higher end instead.  Returns the TCAs and the
+# observations at the ends of the passes.
+def find_tca(prop,qth,isat,aos,los):
+
+    isat = np.atleast_1d( np.asarray(isat,dtype=int) )
+    aos  = np.atleast_1d( np.asarray(aos,dtype=float) )
+    los  = np.atleast_1d( np.asarray(los,dtype=float) )
+    n    = len(aos)
+    ends = prop.observe_pairs(np.concatenate((isat,isat)),
+                              np.concatenate((aos,los)),qth)
+    rr_aos = ends['range_rate'][:n]
+    rr_los = ends['range_rate'][n:]
+
+    def rdot(isat,t):
+        return prop.observe_pairs(isat,t,qth)['range_rate']
+    tca = np.where(ends['elevation'][:n]>=ends['elevation'][n:],aos,los)
+    ok  = (rr_aos<0) & (rr_los>0)
+    tca[ok] = refine(rdot,isat[ok],aos[ok],los[ok],rr_aos[ok],rr_los[ok])
+
+    return tca,ends
+
+################################################################################
+
+# Function to find all passes of all sats in prop over qth between t1 & t2.
+# Returns a list of passes for each sat.
+def find_passes(prop,qth,t1,t2,dt=PASS_GRID_DT,min_el=0.):
+    return find_passes_multi(prop,[qth],t1,t2,dt,min_el)[0]
+
+# Function to find passes over several qths at once, e.g. for -grid2.  The
+# orbits are only propagated once on the coarse grid.  min_el can be a single
+# value or one for each qth.  Returns a list of passes for each sat for each qth.
+def find_passes_multi(prop,qths,t1,t2,dt=PASS_GRID_DT,min_el=0.):
+
+    min_els = np.broadcast_to( np.asarray(min_el,dtype=float), (len(qths),) )
+
+    # Coarse look at the elevations of all sats to bracket rises & sets
+    tg = np.arange(t1-GRID_PAD,t2+GRID_PAD+dt,dt)
+    nt = len(tg)
+    if prop.nsats==0:
+        return [ [] for qth in qths ]
+    els = [ [] for qth in qths ]
+    depth = []
+    for i in range(0,nt,CHUNK):
+        for iqth,obs in enumerate( prop.observe_qths(tg[i:i+CHUNK],qths) ):
+            els[iqth].append(obs['elevation'])
+        depth.append(obs['eclipse_depth'])
+    windows = sunlit_windows(prop,tg,np.hstack(depth),tg[0],tg[-1])
+
+    return [ refine_passes(prop,qth,t1,t2,tg,np.hstack(el)-mel,mel,windows)
+             for qth,el,mel in zip(qths,els,min_els) ]
+
+# Function to pick out the passes over qth given f = el - min_el on the
+# coarse time grid tg and refine them.  If we have the sunlit windows of the
+# sats, the sunlit fraction is filled in too.
+def refine_passes(prop,qth,t1,t2,tg,f,min_el,windows=None):
+
+    up = f>=0
+    isat_r,kr = np.nonzero( ~up[:,:-1] &  up[:,1:] )
+    isat_s,ks = np.nonzero(  up[:,:-1] & ~up[:,1:] )
+
+    # Refine all of the crossings in one shot
+    def elev(isat,t):
+        return prop.observe_pairs(isat,t,qth)['elevation']-min_el
+    isat = np.concatenate( (isat_r,isat_s) )
+    k    = np.concatenate( (kr,ks) )
+    troot = refine(elev,isat,tg[k],tg[k+1],f[isat,k],f[isat,k+1])
+    nr    = len(kr)
+    rises = troot[:nr]
+    sets  = troot[nr:]
+
+    # Short, grazing passes can slip between grid points.  Look for peaks
+    # just below min_el and see if the true peak (TCA) pokes above it
+    def rdot(isat,t):
+        return prop.observe_pairs(isat,t,qth)['range_rate']
+    isat_g,kg = np.nonzero( (f[:,1:-1]<0) & (f[:,1:-1]>-GRAZE_EL) &
+                            (f[:,1:-1]>=f[:,:-2]) & (f[:,1:-1]>=f[:,2:]) )
+    if len(kg)>0:
+        ta = tg[kg]
+        tb = tg[kg+2]
+        ends = rdot(np.concatenate((isat_g,isat_g)),np.concatenate((ta,tb)))
+        ok = (ends[:len(kg)]<0) & (ends[len(kg):]>0)
+        isat_g = isat_g[ok]
+        ta     = ta[ok]
+        tb     = tb[ok]
+        tpk = refine(rdot,isat_g,ta,tb,ends[:len(kg)][ok],ends[len(kg):][ok])
+        fpk = elev(isat_g,tpk)
+        up2 = fpk>=0
+        if np.any(up2):
+            isat_g = isat_g[up2]
+            tpk    = tpk[up2]
+            fpk    = fpk[up2]
+            fa     = elev(isat_g,ta[up2])
+            fb     = elev(isat_g,tb[up2])
+            rises  = np.concatenate( (rises,refine(elev,isat_g,ta[up2],tpk,fa,fpk)) )
+            sets   = np.concatenate( (sets,refine(elev,isat_g,tpk,tb[up2],fpk,fb)) )
+            isat_r = np.concatenate( (isat_r,isat_g) )
+            isat_s = np.concatenate( (isat_s,isat_g) )
+
+    # Pair up rises & sets for each sat.  Sats that are already up at the
+    # ends of the grid get the ends of the grid
+    aos  = []
+    los  = []
+    iaos = []
+    for i in range(prop.nsats):
+        r = list( np.sort(rises[isat_r==i]) )
+        s = list( np.sort(sets[isat_s==i]) )
+        if up[i,0]:
+            r.insert(0,tg[0])
+        if up[i,-1]:
+            s.append(tg[-1])
+        aos  += r
+        los  += s
+        iaos += [i]*len(r)
+    aos  = np.array(aos)
+    los  = np.array(los)
+    iaos = np.array(iaos,dtype=int)
+
+    # Keep the passes in the requested window
+    keep = (los>t1) & (aos<t2)
+    aos  = aos[keep]
+    los  = los[keep]
+    iaos = iaos[keep]
+    npasses = len(aos)
+    if npasses==0:
+        return [ pass_table() for i in range(prop.nsats) ]
+
+    # Find the peaks
+    tca,ends = find_tca(prop,qth,iaos,aos,los)
+    az_aos = ends['azimuth'][:npasses]
+    az_los = ends['azimuth'][npasses:]
+    peak = prop.observe_pairs(iaos,tca,qth)
+
+    table = np.zeros(npasses,dtype=PASS_DTYPE)
+    table['aos']    = aos
+    table['los']    = los
+    table['tca']    = tca
+    table['max_el'] = peak['elevation']
+    table['az_aos'] = az_aos
+    table['az_los'] = az_los
+    table['orbit']  = peak['orbit']
+    if windows is None:
+        table['sunlit'] = np.nan
+    else:
+        table['sunlit'] = sunlit_fraction(windows,iaos,aos,los)
+    table['dark']   = sun_elevation(julian_date(tca),qth)<=DARK_EL
+
+    return [ table[iaos==i] for i in range(prop.nsats) ]
+
+################################################################################
+
+# Worker for loading passes in a process pool - see load_sat_data.  Takes a
+# list of TLEs and a list of qths and returns the pass table for each sat
+# for each qth
+def pass_worker(tles,qths,t1,t2):
+    prop = PROPAGATOR(tles)
+    return find_passes_multi(prop,qths,t1,t2)
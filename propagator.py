@@ -0,0 +1,621 @@
+################################################################################
+#
+# propagator.py - Rev 1.0
+# Copyright (C) 2026 by Joseph B. Attili, joe DOT aa2il AT gmail DOT com
+#
+# Batch orbit propagator for all active satellites over a shared time grid.
+#
+# Rather than stepping through each pass one ephem sat.compute() at a time,
+# the TLEs for all the sats are loaded into numpy arrays and the SGP4 model is
+# evaluated for every sat and every time step in one shot.  The equations
+# are a straight port of the SGP4 code in pypredict (predict.c) so the results
+# agree with what we've been getting all along from predict and ephem.
+#
+# Only the near-earth (period < 225 min) SGP4 model is vectorized.  This
+# covers all of the LEO birds we work.  The odd deep-space object (e.g. a
+# GEO or HEO sat) falls back to ephem, one sample at a time.
+#
+################################################################################
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+################################################################################
+
+import numpy as np
+from copy import copy
+from datetime import datetime, timezone
+import ephem
+from constants import RAD2DEG,DEG2RAD
+
+################################################################################
+
+# These came from pawing through pypredict C code (WGS '72 for SGP4)
+TWOPI   = 2.*np.pi
+XKE     = 7.43669161E-2
+XKMPER  = 6.378137E3              # WGS 84 Earth radius km
+XMNPDA  = 1.44E3                  # Minutes per day
+SECDAY  = 8.6400E4                # Seconds per day
+AE      = 1.0
+CK2     = 5.413079E-4
+CK4     = 6.209887E-7
+XJ3     = -2.53881E-6
+S0      = 1.012229
+QOMS2T  = 1.880279E-09
+TOTHRD  = 2./3.
+FLAT    = 3.35281066474748E-3     # Flattening factor
+OMEGA_E = 1.00273790934           # Earth rotations/siderial day
+MFACTOR = 7.292115E-5
+CLIGHT  = 299792458.
+AU      = 1.49597870691E8         # Astronomical unit - km (IAU 76)
+SR      = 6.96000E5               # Solar radius - km (IAU 76)
+
+################################################################################
+
+# Function to convert unix time (secs) to julian date
+def julian_date(t):
+    return np.asarray(t,dtype=float)/SECDAY + 2440587.5
+
+# Function to compute julian date of Day 0.0 of a year - from predict.c
+def julian_date_of_year(year):
+    year = year-1
+    A = int(year/100)
+    B = 2-A+int(A/4)
+    i = int(365.25*year) + int(30.6001*14)
+    return i+1720994.5+B
+
+# Function to compute julian date of a TLE epoch (yyddd.dddddd)
+def julian_date_of_epoch(epoch):
+    year = int(epoch*1e-3)
+    day  = epoch - 1000.*year
+    if year<57:
+        year+=2000
+    else:
+        year+=1900
+    return julian_date_of_year(year)+day
+
+# Function to compute Greenwich Mean Sidereal Time (radians)
+def theta_g(jd):
+    UT  = np.mod(jd+0.5,1.)
+    jd  = jd-UT
+    TU  = (jd-2451545.0)/36525.
+    GMST= 24110.54841+TU*(8640184.812866+TU*(0.093104-TU*6.2E-6))
+    GMST= np.mod(GMST+SECDAY*OMEGA_E*UT,SECDAY)
+    return TWOPI*GMST/SECDAY
+
+# Function to compute difference between ET & UT (secs) - from predict.c
+def delta_et(year):
+    return 26.465+0.747622*(year-1950)+1.886913*np.sin(TWOPI*(year-1975)/33)
+
+# Function to compute ECI position (km) of the sun at julian dates jd - from
+# predict.c.  Returns an array of shape jd.shape+(3,)
+def sun_eci(jd):
+    mjd  = jd-2415020.0
+    year = 1900+mjd/365.25
+    T    = (mjd+delta_et(year)/SECDAY)/36525.
+    M    = DEG2RAD*np.mod(358.47583+np.mod(35999.04975*T,360.)-(0.000150+0.0000033*T)*T*T,360.)
+    L    = DEG2RAD*np.mod(279.69668+np.mod(36000.76892*T,360.)+0.0003025*T*T,360.)
+    e    = 0.01675104-(0.0000418+0.000000126*T)*T
+    C    = DEG2RAD*((1.919460-(0.004789+0.000014*T)*T)*np.sin(M)+
+                    (0.020094-0.000100*T)*np.sin(2*M)+0.000293*np.sin(3*M))
+    O    = DEG2RAD*np.mod(259.18-1934.142*T,360.)
+    Lsa  = np.mod(L+C-DEG2RAD*(0.00569-0.00479*np.sin(O)),TWOPI)
+    nu   = np.mod(M+C,TWOPI)
+    R    = AU*1.0000002*(1-e*e)/(1+e*np.cos(nu))
+    eps  = DEG2RAD*(23.452294-(0.0130125+(0.00000164-0.000000503*T)*T)*T+0.00256*np.cos(O))
+    return np.stack( (R*np.cos(Lsa),R*np.sin(Lsa)*np.cos(eps),R*np.sin(Lsa)*np.sin(eps)),
+                     axis=-1 )
+
+# Function to compute eclipse depth (deg) of ECI positions pos (km) with the
+# sun at ECI position sun (km) - from predict.c.  This is how far the sun is
+# behind the limb of the earth.  A sat is in the earth's shadow when the
+# depth is >= 0.  (predict also checks that the earth looks bigger than the
+# sun but that's true for anything closer than about 1.4 million km.)
+def eclipse_depth(pos,sun):
+    r        = np.sqrt( np.sum(pos*pos,axis=-1) )
+    rho      = np.sqrt( np.sum((sun-pos)**2,axis=-1) )
+    rsun     = np.sqrt( np.sum(sun*sun,axis=-1) )
+    sd_earth = np.arcsin( np.minimum(XKMPER/r,1.) )
+    sd_sun   = np.arcsin( np.minimum(SR/rho,1.) )
+    delta    = np.arccos( np.clip(-np.sum(sun*pos,axis=-1)/(rsun*r),-1.,1.) )
+    return (sd_earth-sd_sun-delta)*RAD2DEG
+
+# Function to parse a TLE - tle can be a 3-line string or list of lines
+def parse_tle(tle):
+    if isinstance(tle,str):
+        tle = tle.strip().split('\n')
+    line1 = tle[1].strip()
+    line2 = tle[2].strip()
+
+    el=dict()
+    el['name']    = tle[0].strip()
+    el['catnum']  = int( line1[2:7] )
+    el['epoch']   = 1000.*int( line1[18:20] ) + float( line1[20:32] )
+    el['xndt2o']  = float( line1[33:43] )
+    el['xndd6o']  = float( line1[44]+'.'+line1[45:50] ) * 10**int( line1[50:52] )
+    el['bstar']   = float( line1[53]+'.'+line1[54:59] ) * 10**int( line1[59:61] )
+    el['xincl']   = float( line2[8:16] )
+    el['xnodeo']  = float( line2[17:25] )
+    el['eo']      = float( '0.'+line2[26:33] )
+    el['omegao']  = float( line2[34:42] )
+    el['xmo']     = float( line2[43:51] )
+    el['xno']     = float( line2[52:63] )
+    el['revnum']  = int( line2[63:68] )
+
+    return el
+
+################################################################################
+
+# Class to propagate a batch of satellites
+class PROPAGATOR:
+    def __init__(self,tles):
+
+        # Parse all the TLEs
+        self.tles = list(tles)
+        self.nsats = len(self.tles)
+        els = [parse_tle(tle) for tle in self.tles]
+        self.names  = [el['name'] for el in els]
+
+        # Pre-process elements as in select_ephemeris() in predict.c
+        # All arrays are (nsats,1) so they broadcast against the time axis
+        def col(key,scale=1.):
+            return scale*np.array([el[key] for el in els],dtype=float).reshape(-1,1)
+        temp = TWOPI/XMNPDA/XMNPDA
+        self.xnodeo = col('xnodeo',DEG2RAD)
+        self.omegao = col('omegao',DEG2RAD)
+        self.xmo    = col('xmo',DEG2RAD)
+        self.xincl  = col('xincl',DEG2RAD)
+        self.eo     = col('eo')
+        self.xno    = col('xno',temp*XMNPDA)
+        self.bstar  = col('bstar',1./AE)
+        self.revnum = col('revnum')
+        self.jd_epoch = np.array([julian_date_of_epoch(el['epoch']) for el in els]).reshape(-1,1)
+
+        # Initialize SGP4 constants for every sat
+        self.sgp4_init()
+
+        # Deep-space sats are handed off to ephem
+        self.deep = TWOPI/self.xnodp[:,0]/XMNPDA >= 0.15625
+        self.bodies = dict()
+        for i in np.where(self.deep)[0]:
+            tle = self.tles[i]
+            if isinstance(tle,str):
+                tle = tle.strip().split('\n')
+            self.bodies[i] = ephem.readtle(tle[0],tle[1],tle[2])
+        if np.any(self.deep):
+            print('PROPAGATOR: Deep space sats handled by ephem:',
+                  [self.names[i] for i in self.bodies.keys()])
+
+    # Function to initialize the SGP4 model - from predict.c
+    def sgp4_init(self):
+
+        # Recover original mean motion (xnodp) and semimajor axis (aodp)
+        a1     = (XKE/self.xno)**TOTHRD
+        cosio  = np.cos(self.xincl)
+        theta2 = cosio*cosio
+        x3thm1 = 3*theta2-1.0
+        eosq   = self.eo*self.eo
+        betao2 = 1.0-eosq
+        betao  = np.sqrt(betao2)
+        del1   = 1.5*CK2*x3thm1/(a1*a1*betao*betao2)
+        ao     = a1*(1.0-del1*(0.5*TOTHRD+del1*(1.0+134.0/81.0*del1)))
+        delo   = 1.5*CK2*x3thm1/(ao*ao*betao*betao2)
+        xnodp  = self.xno/(1.0+delo)
+        aodp   = ao/(1.0-delo)
+
+        # For perigee less than 220 km, the equations are truncated
+        simple = (aodp*(1-self.eo)/AE) < (220/XKMPER+AE)
+
+        # For perigees below 156 km, the values of s and qoms2t are altered
+        perigee= (aodp*(1-self.eo)-AE)*XKMPER
+        s4     = np.where(perigee<=98.0,20.,perigee-78.0)
+        qoms24 = np.where(perigee<156.0,((120-s4)*AE/XKMPER)**4,QOMS2T)
+        s4     = np.where(perigee<156.0,s4/XKMPER+AE,S0)
+
+        pinvsq = 1/(aodp*aodp*betao2*betao2)
+        tsi    = 1/(aodp-s4)
+        eta    = aodp*self.eo*tsi
+        etasq  = eta*eta
+        eeta   = self.eo*eta
+        psisq  = np.abs(1-etasq)
+        coef   = qoms24*tsi**4
+        coef1  = coef/psisq**3.5
+        c2     = coef1*xnodp*(aodp*(1+1.5*etasq+eeta*(4+etasq))+
+                              0.75*CK2*tsi/psisq*x3thm1*(8+3*etasq*(8+etasq)))
+        c1     = self.bstar*c2
+        sinio  = np.sin(self.xincl)
+        a3ovk2 = -XJ3/CK2*AE**3
+        c3     = coef*tsi*a3ovk2*xnodp*AE*sinio/self.eo
+        x1mth2 = 1-theta2
+        c4     = 2*xnodp*coef1*aodp*betao2*(eta*(2+0.5*etasq)+self.eo*(0.5+2*etasq)-
+                   2*CK2*tsi/(aodp*psisq)*(-3*x3thm1*(1-2*eeta+etasq*(1.5-0.5*eeta))+
+                   0.75*x1mth2*(2*etasq-eeta*(1+etasq))*np.cos(2*self.omegao)))
+        c5     = 2*coef1*aodp*betao2*(1+2.75*(etasq+eeta)+eeta*etasq)
+        theta4 = theta2*theta2
+        temp1  = 3*CK2*pinvsq*xnodp
+        temp2  = temp1*CK2*pinvsq
+        temp3  = 1.25*CK4*pinvsq*pinvsq*xnodp
+        xmdot  = xnodp+0.5*temp1*betao*x3thm1+0.0625*temp2*betao*(13-78*theta2+137*theta4)
+        x1m5th = 1-5*theta2
+        omgdot = -0.5*temp1*x1m5th+0.0625*temp2*(7-114*theta2+395*theta4)+ \
+            temp3*(3-36*theta2+49*theta4)
+        xhdot1 = -temp1*cosio
+        xnodot = xhdot1+(0.5*temp2*(4-19*theta2)+2*temp3*(3-7*theta2))*cosio
+
+        # Stash everything we need for the time-dependent part
+        self.aodp   = aodp
+        self.xnodp  = xnodp
+        self.simple = simple
+        self.cosio  = cosio
+        self.sinio  = sinio
+        self.x3thm1 = x3thm1
+        self.x1mth2 = x1mth2
+        self.x7thm1 = 7*theta2-1
+        self.c1     = c1
+        self.c4     = c4
+        self.c5     = c5
+        self.eta    = eta
+        self.xmdot  = xmdot
+        self.omgdot = omgdot
+        self.xnodot = xnodot
+        self.omgcof = self.bstar*c3*np.cos(self.omegao)
+        self.xmcof  = -TOTHRD*coef*self.bstar*AE/eeta
+        self.xnodcf = 3.5*betao2*xhdot1*c1
+        self.t2cof  = 1.5*c1
+        self.xlcof  = 0.125*a3ovk2*sinio*(3+5*cosio)/(1+cosio)
+        self.aycof  = 0.25*a3ovk2*sinio
+        self.delmo  = (1+eta*np.cos(self.xmo))**3
+        self.sinmo  = np.sin(self.xmo)
+
+        c1sq        = c1*c1
+        self.d2     = 4*aodp*tsi*c1sq
+        temp        = self.d2*tsi*c1/3
+        self.d3     = (17*aodp+s4)*temp
+        self.d4     = 0.5*temp*aodp*tsi*(221*aodp+31*s4)*c1
+        self.t3cof  = self.d2+2*c1sq
+        self.t4cof  = 0.25*(3*self.d3+c1*(12*self.d2+10*c1sq))
+        self.t5cof  = 0.2*(3*self.d4+12*c1*self.d3+6*self.d2*self.d2+15*c1sq*(2*self.d2+c1sq))
+
+    # Function to compute ECI position (km) and velocity (km/s) of all sats
+    # at unix times t.  Returns arrays of shape (nsats,ntimes,3)
+    def eci(self,t):
+        jd = julian_date( np.atleast_1d(t) ).reshape(1,-1)
+        return self.sgp4(jd)
+
+    # Function to return a propagator for a subset of the sats.  Sats can be
+    # repeated - this is how we evaluate (sat,time) pairs in one shot
+    def subset(self,idx):
+        sub = copy(self)
+        for key,val in vars(self).items():
+            if isinstance(val,np.ndarray) and val.ndim==2:
+                setattr(sub,key,val[idx])
+        sub.nsats = len(idx)
+        return sub
+
+    # The SGP4 model - from predict.c.  jd must broadcast against the (nsats,1)
+    # element arrays
+    def sgp4(self,jd):
+
+        tsince = (jd-self.jd_epoch)*XMNPDA
+
+        # Update for secular gravity and atmospheric drag
+        xmdf   = self.xmo+self.xmdot*tsince
+        omgadf = self.omegao+self.omgdot*tsince
+        xnoddf = self.xnodeo+self.xnodot*tsince
+        tsq    = tsince*tsince
+        xnode  = xnoddf+self.xnodcf*tsq
+        tempa  = 1-self.c1*tsince
+        tempe  = self.bstar*self.c4*tsince
+        templ  = self.t2cof*tsq
+
+        # The extra terms are dropped for the "simple" sats
+        full   = ~self.simple
+        delomg = self.omgcof*tsince
+        delm   = self.xmcof*((1+self.eta*np.cos(xmdf))**3-self.delmo)
+        temp   = np.where(full,delomg+delm,0.)
+        xmp    = xmdf+temp
+        omega  = omgadf-temp
+        tcube  = tsq*tsince
+        tfour  = tsince*tcube
+        tempa  = np.where(full,tempa-self.d2*tsq-self.d3*tcube-self.d4*tfour,tempa)
+        tempe  = np.where(full,tempe+self.bstar*self.c5*(np.sin(xmp)-self.sinmo),tempe)
+        templ  = np.where(full,templ+self.t3cof*tcube+tfour*(self.t4cof+tsince*self.t5cof),templ)
+
+        a      = self.aodp*tempa**2
+        e      = self.eo-tempe
+        xl     = xmp+omega+xnode+self.xnodp*templ
+        beta   = np.sqrt(1-e*e)
+        xn     = XKE/a**1.5
+
+        # Long period periodics
+        axn    = e*np.cos(omega)
+        temp   = 1/(a*beta*beta)
+        xll    = temp*self.xlcof*axn
+        aynl   = temp*self.aycof
+        xlt    = xl+xll
+        ayn    = e*np.sin(omega)+aynl
+
+        # Solve Kepler's Equation - fixed no. of iterations since we're vectorized
+        capu   = np.mod(xlt-xnode,TWOPI)
+        epw    = capu
+        for i in range(10):
+            sinepw = np.sin(epw)
+            cosepw = np.cos(epw)
+            temp3  = axn*sinepw
+            temp4  = ayn*cosepw
+            temp5  = axn*cosepw
+            temp6  = ayn*sinepw
+            epw    = (capu-temp4+temp3-epw)/(1-temp5-temp6)+epw
+        sinepw = np.sin(epw)
+        cosepw = np.cos(epw)
+        temp3  = axn*sinepw
+        temp4  = ayn*cosepw
+        temp5  = axn*cosepw
+        temp6  = ayn*sinepw
+
+        # Short period preliminary quantities
+        ecose  = temp5+temp6
+        esine  = temp3-temp4
+        elsq   = axn*axn+ayn*ayn
+        temp   = 1-elsq
+        pl     = a*temp
+        r      = a*(1-ecose)
+        temp1  = 1/r
+        rdot   = XKE*np.sqrt(a)*esine*temp1
+        rfdot  = XKE*np.sqrt(pl)*temp1
+        temp2  = a*temp1
+        betal  = np.sqrt(temp)
+        temp3  = 1/(1+betal)
+        cosu   = temp2*(cosepw-axn+ayn*esine*temp3)
+        sinu   = temp2*(sinepw-ayn-axn*esine*temp3)
+        u      = np.arctan2(sinu,cosu)
+        sin2u  = 2*sinu*cosu
+        cos2u  = 2*cosu*cosu-1
+        temp   = 1/pl
+        temp1  = CK2*temp
+        temp2  = temp1*temp
+
+        # Update for short periodics
+        rk     = r*(1-1.5*temp2*betal*self.x3thm1)+0.5*temp1*self.x1mth2*cos2u
+        uk     = u-0.25*temp2*self.x7thm1*sin2u
+        xnodek = xnode+1.5*temp2*self.cosio*sin2u
+        xinck  = self.xincl+1.5*temp2*self.cosio*self.sinio*cos2u
+        rdotk  = rdot-xn*temp1*self.x1mth2*sin2u
+        rfdotk = rfdot+xn*temp1*(self.x1mth2*cos2u+1.5*self.x3thm1)
+
+        # Orientation vectors
+        sinuk  = np.sin(uk)
+        cosuk  = np.cos(uk)
+        sinik  = np.sin(xinck)
+        cosik  = np.cos(xinck)
+        sinnok = np.sin(xnodek)
+        cosnok = np.cos(xnodek)
+        xmx    = -sinnok*cosik
+        xmy    = cosnok*cosik
+        ux     = xmx*sinuk+cosnok*cosuk
+        uy     = xmy*sinuk+sinnok*cosuk
+        uz     = sinik*sinuk
+        vx     = xmx*cosuk-cosnok*sinuk
+        vy     = xmy*cosuk-sinnok*sinuk
+        vz     = sinik*cosuk
+
+        # Position and velocity - scaled to km and km/sec
+        pos = XKMPER*np.stack( (rk*ux,rk*uy,rk*uz), axis=-1 )
+        vel = (XKMPER*XMNPDA/SECDAY)*np.stack( (rdotk*ux+rfdotk*vx,
+                                                  rdotk*uy+rfdotk*vy,
+                                                  rdotk*uz+rfdotk*vz), axis=-1 )
+
+        # Orbit number
+        age   = jd-self.jd_epoch
+        orbit = np.floor((self.xno*XMNPDA/TWOPI+age*self.bstar*AE)*age+
+                         self.xmo/TWOPI)+self.revnum
+
+        return pos,vel,orbit
+
+    # Function to observe all sats from qth at unix times t
+    # Returns a dict with the same fields as SATELLITE.observe() but
+    # each entry is an array of shape (nsats,ntimes)
+    def observe(self,t,qth):
+        return self.observe_qths(t,[qth])[0]
+
+    # Function to observe all sats from several qths at unix times t.  The
+    # orbits are only propagated once and then viewed from each qth.
+    # Returns a list of dicts, one for each qth
+    def observe_qths(self,t,qths):
+
+        t   = np.atleast_1d( np.asarray(t,dtype=float) )
+        jd  = julian_date(t).reshape(1,-1)
+        pos,vel,orbit = self.sgp4(jd)
+        geo = geodetic(pos,jd)
+        depth = eclipse_depth(pos,sun_eci(jd))
+
+        obs_list=[]
+        for qth in qths:
+            obs = observables(pos,vel,orbit,jd,qth,geo,depth)
+
+            # Deep space sats are done the slow way
+            for i,sat in self.bodies.items():
+                d = ephem_observe(sat,t,qth)
+                for key in d.keys():
+                    obs[key][i] = d[key]
+            obs['doppler'] = -1e8*obs['range_rate']*1000./CLIGHT
+            obs_list.append(obs)
+
+        return obs_list
+
+    # Function to observe sat isat[k] at time t[k] for each k
+    # Returns a dict of 1-D arrays
+    def observe_pairs(self,isat,t,qth):
+
+        isat = np.atleast_1d( np.asarray(isat,dtype=int) )
+        t    = np.atleast_1d( np.asarray(t,dtype=float) )
+        jd   = julian_date(t).reshape(-1,1)
+        pos,vel,orbit = self.subset(isat).sgp4(jd)
+        obs = observables(pos,vel,orbit,jd,qth)
+        for key in obs.keys():
+            obs[key] = obs[key][:,0]
+
+        # Deep space sats are done the slow way
+        for k in np.where( self.deep[isat] )[0]:
+            d = ephem_observe(self.bodies[isat[k]],t[k:k+1],qth)
+            for key in obs.keys():
+                obs[key][k] = d[key][0]
+        obs['doppler'] = -1e8*obs['range_rate']*1000./CLIGHT
+
+        return obs
+
+    # Function to compute eclipse depth (deg) of all sats at unix times t.
+    # Sats are in the earth's shadow where the depth is >= 0.  Returns an
+    # array of shape (nsats,ntimes)
+    def eclipse(self,t):
+
+        t  = np.atleast_1d( np.asarray(t,dtype=float) )
+        jd = julian_date(t).reshape(1,-1)
+        pos,vel,orbit = self.sgp4(jd)
+        depth = eclipse_depth(pos,sun_eci(jd))
+
+        # Deep space sats are done the slow way
+        for i,sat in self.bodies.items():
+            depth[i] = ephem_eclipse(sat,t)
+
+        return depth
+
+    # Function to compute eclipse depth of sat isat[k] at time t[k] for each k
+    def eclipse_pairs(self,isat,t):
+
+        isat = np.atleast_1d( np.asarray(isat,dtype=int) )
+        t    = np.atleast_1d( np.asarray(t,dtype=float) )
+        jd   = julian_date(t).reshape(-1,1)
+        pos,vel,orbit = self.subset(isat).sgp4(jd)
+        depth = eclipse_depth(pos,sun_eci(jd))[:,0]
+
+        # Deep space sats are done the slow way
+        for k in np.where( self.deep[isat] )[0]:
+            depth[k] = ephem_eclipse(self.bodies[isat[k]],t[k:k+1])[0]
+
+        return depth
+
+################################################################################
+
+# Function to compute all of the observables from ECI state vectors.  The
+# sub-sat point doesn't depend on qth so it can be passed in via geo.  The
+# eclipse depth is only included if it is passed in.
+def observables(pos,vel,orbit,jd,qth,geo=None,depth=None):
+
+    obs = topocentric(pos,vel,jd,qth)
+    if geo==None:
+        geo = geodetic(pos,jd)
+    lat,lon,alt = geo
+    obs['latitude']  = lat
+    obs['longitude'] = lon
+    obs['altitude']  = alt
+    obs['footprint'] = 12756.33*np.arccos(XKMPER/(XKMPER+alt))
+    obs['orbit']     = orbit*np.ones(alt.shape)
+    if depth is not None:
+        obs['eclipse_depth'] = np.array(depth)
+
+    return obs
+
+# Function to compute observer ECI position & velocity - qth=(lat,lon(W),alt(m))
+def observer_eci(qth,jd):
+    lat = qth[0]*DEG2RAD
+    lon = -qth[1]*DEG2RAD
+    alt = 1e-3*qth[2]
+    theta = np.mod(theta_g(jd)+lon,TWOPI)               # LMST
+    c     = 1/np.sqrt(1+FLAT*(FLAT-2)*np.sin(lat)**2)
+    sq    = (1-FLAT)**2*c
+    achcp = (XKMPER*c+alt)*np.cos(lat)
+    pos = np.stack( (achcp*np.cos(theta), achcp*np.sin(theta),
+                     (XKMPER*sq+alt)*np.sin(lat)*np.ones(theta.shape)), axis=-1)
+    vel = np.stack( (-MFACTOR*pos[...,1], MFACTOR*pos[...,0],
+                     np.zeros(theta.shape)), axis=-1)
+    return pos,vel,theta
+
+# Function to compute elevation (deg) of the sun as seen from qth at julian dates jd
+def sun_elevation(jd,qth):
+    sun = sun_eci(jd)
+    return topocentric(sun,np.zeros(sun.shape),jd,qth)['elevation']
+
+# Function to compute az, el, range & range rate of ECI positions as seen from qth
+def topocentric(pos,vel,jd,qth):
+
+    obs_pos,obs_vel,theta = observer_eci(qth,jd)
+    rng   = pos-obs_pos
+    rgvel = vel-obs_vel
+    r     = np.linalg.norm(rng,axis=-1)
+
+    lat   = qth[0]*DEG2RAD
+    sin_lat   = np.sin(lat)
+    cos_lat   = np.cos(lat)
+    sin_theta = np.sin(theta)
+    cos_theta = np.cos(theta)
+    top_s = sin_lat*cos_theta*rng[...,0]+sin_lat*sin_theta*rng[...,1]-cos_lat*rng[...,2]
+    top_e = -sin_theta*rng[...,0]+cos_theta*rng[...,1]
+    top_z = cos_lat*cos_theta*rng[...,0]+cos_lat*sin_theta*rng[...,1]+sin_lat*rng[...,2]
+
+    az    = np.mod( np.arctan2(top_e,-top_s), TWOPI )
+    el    = np.arcsin(top_z/r)
+    rdot  = np.sum(rng*rgvel,axis=-1)/r
+
+    return dict(azimuth     = az*RAD2DEG,
+                elevation   = el*RAD2DEG,
+                slant_range = r,
+                range_rate  = rdot)
+
+# Function to compute geodetic lat, lon (deg) and alt (km) of ECI positions
+def geodetic(pos,jd):
+    theta = np.arctan2(pos[...,1],pos[...,0])
+    lon   = np.mod(theta-theta_g(jd)+np.pi,TWOPI)-np.pi
+    r     = np.sqrt(pos[...,0]**2+pos[...,1]**2)
+    e2    = FLAT*(2-FLAT)
+    lat   = np.arctan2(pos[...,2],r)
+    for i in range(5):
+        phi = lat
+        c   = 1/np.sqrt(1-e2*np.sin(phi)**2)
+        lat = np.arctan2(pos[...,2]+XKMPER*c*e2*np.sin(phi),r)
+    alt = r/np.cos(lat)-XKMPER*c
+    return lat*RAD2DEG,lon*RAD2DEG,alt
+
+# Function to observe a single sat using ephem at unix times t - the slow way
+def ephem_observe(sat,t,qth):
+    obs = ephem.Observer()
+    obs.lat = str( qth[0] )
+    obs.lon = str( -qth[1] )
+    obs.elevation = qth[2]
+    obs.pressure=0
+
+    keys=['azimuth','elevation','slant_range','range_rate',
+          'latitude','longitude','altitude','footprint','orbit','eclipse_depth']
+    d = dict([(key,np.zeros(len(t))) for key in keys])
+    for j,tt in enumerate(t):
+        obs.date = datetime.fromtimestamp(tt,tz=timezone.utc)
+        sat.compute(obs)
+        alt = 1e-3*sat.elevation
+        d['azimuth'][j]     = sat.az*RAD2DEG
+        d['elevation'][j]   = sat.alt*RAD2DEG
+        d['slant_range'][j] = sat.range*0.001
+        d['range_rate'][j]  = sat.range_velocity*0.001
+        d['latitude'][j]    = sat.sublat*RAD2DEG
+        d['longitude'][j]   = sat.sublong*RAD2DEG
+        d['altitude'][j]    = alt
+        d['footprint'][j]   = 12756.33*np.arccos(XKMPER/(XKMPER+alt))
+        d['orbit'][j]       = sat.orbit
+        d['eclipse_depth'][j] = 1. if sat.eclipsed else -1.
+    return d
+
+# Function to check if a single sat is eclipsed using ephem at unix times t.
+# ephem only tells us if the sat is eclipsed, not by how much, so the
+# "depth" is just +/-1 deg (as in ephem_observe)
+def ephem_eclipse(sat,t):
+    depth = np.zeros(len(t))
+    for j,tt in enumerate(t):
+        sat.compute( datetime.fromtimestamp(tt,tz=timezone.utc) )
+        depth[j] = 1. if sat.eclipsed else -1.
+    return depth
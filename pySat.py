@@ -92,6 +92,9 @@ from pprint import pprint
 
 from params import PARAMS
 from watchdog import WatchDog
+from tle_catalog import TLE_CATALOG
+from mutual import list_mutual_windows
+from eme import list_eme_windows
 from rig_control import RigControl
 from sat_class import SATELLITE
 from gui import SAT_GUI
@@ -366,6 +369,16 @@ if P.GRID2:
     P.other_qth = (lat2,-lon2,0)
     print('Other QTH:',P.GRID2,P.other_qth)
 
+# EME planning - list Moon windows workable with a bunch of grids & quit.
+# We don't need any of the sat stuff for this.
+if P.EME_GRIDS:
+    P.eme_qths=[]
+    for grid in P.EME_GRIDS:
+        lat2, lon2 = locator_to_latlong(grid)
+        P.eme_qths.append( (lat2,-lon2,0) )
+    list_eme_windows(P)
+    sys.exit(0)
+
 ################################################################################
 
 # Function to fetch data from satnogs
@@ -543,6 +556,14 @@ else:
 if P.PLATFORM=='Windows':
     html=html.replace('\r','')
 P.TLE=html.replace('\n\n','\n').split('\n')
+P.CATALOG=TLE_CATALOG(P.TLE)
+
+# Where to get fresh keps when the pass window slides forward (see gui.py)
+P.KEPS_FILE=os.path.expanduser(URL2)
+if P.INTERNET:
+    P.KEPS_URL=URL1
+else:
+    P.KEPS_URL=None
 #print('TLE=',P.TLE)
 #sys.exit(0)
 print(" ")
@@ -550,6 +571,11 @@ P.MEM.take_snapshot('... After TLE')
 
 # Get meteor shower info also    
 P.SHOWERS = get_meteor_showers()
+
+# List windows where sats are workable from both grids & quit
+if P.LIST_MUTUAL:
+    list_mutual_windows(P)
+    sys.exit(0)
     
 # Open UDP client
 if P.UDP_CLIENT:
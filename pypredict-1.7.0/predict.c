@@ -168,7 +168,7 @@ typedef struct observation {
 
 } observation;
 
-struct	{
+struct	sat_st {
 	   char line1[70];       // First line of TLE
 	   char line2[70];       // Second line of TLE
 	   char name[25];        // Spacecraft Name
@@ -189,7 +189,7 @@ struct	{
 	   long orbitnum;        // Orbit Number
 	}  sat;
 
-struct	{
+struct	qth_st {
        char callsign[17];    // Observation Position Call Sign
 	   double stnlat;        // Observation Position Latitude
 	   double stnlong;       // Observation Position Longitude
@@ -280,26 +280,86 @@ geodetic_t obs_geodetic;
 
 tle_t tle;
 
+/* Values SGP4() keeps from its initialization for later calls */
+
+typedef struct	{
+		   double  aodp, aycof, c1, c4, c5, cosio, d2, d3, d4, delmo,
+			   omgcof, eta, omgdot, sinio, xnodp, sinmo, t2cof, t3cof,
+			   t4cof, t5cof, x1mth2, x3thm1, x7thm1, xmcof, xmdot,
+			   xnodcf, xnodot, xlcof;
+		}  sgp4_t;
+
+/* Values SDP4() keeps from its initialization for later calls */
+
+typedef struct	{
+		   double  x3thm1, c1, x1mth2, c4, xnodcf, t2cof, xlcof,
+			   aycof, x7thm1;
+		   deep_arg_t deep_arg;
+		}  sdp4_t;
+
+/* Values Deep() keeps between calls - lunar-solar terms, resonance
+   terms and the state of the resonance integrator */
+
+typedef struct	{
+		   double  thgr, xnq, xqncl, omegaq, zmol, zmos, savtsn, ee2,
+			   e3, xi2, xl2, xl3, xl4, xgh2, xgh3, xgh4, xh2, xh3,
+			   sse, ssi, ssg, xi3, se2, si2, sl2, sgh2, sh2, se3,
+			   si3, sl3, sgh3, sh3, sl4, sgh4, ssl, ssh, d3210,
+			   d3222, d4410, d4422, d5220, d5232, d5421, d5433, del1,
+			   del2, del3, fasx2, fasx4, fasx6, xlamo, xfact, xni,
+			   atime, stepp, stepn, step2, preep, pl, sghs, xli,
+			   d2201, d2211, sghl, sh1, pinc, pe, shs, zsingl,
+			   zcosgl, zsinhl, zcoshl, zsinil, zcosil;
+		}  deep_t;
+
+/* Everything the tracking code works on for one satellite & groundstation
+   pair: the TLE & QTH, the SGP4/SDP4 state and flags, and the results of
+   the last Calc().  Each caller has its own so several can be propagated at
+   once from different threads.  Squint angles aren't supported (see
+   MakeObservation) so they aren't kept here. */
+
+typedef struct	{
+		   struct sat_st sat;        /* Parsed TLE */
+		   struct qth_st qth;        /* Groundstation */
+		   geodetic_t obs_geodetic;  /* Groundstation for SGP4/SDP4 code */
+		   tle_t tle;                /* TLE as pre-processed by PreCalc() */
+		   int flags;                /* SGP4/SDP4 flags */
+		   sgp4_t sgp4;
+		   sdp4_t sdp4;
+		   deep_t deep;
+
+		   double  daynum, tsince, jul_epoch, jul_utc, eclipse_depth,
+			   sat_azi, sat_ele, sat_range, sat_range_rate,
+			   sat_lat, sat_lon, sat_alt, sat_vel, phase,
+			   sun_azi, sun_ele, fm, fk, age, aostime, lostime,
+			   eci_x, eci_y, eci_z, eci_vx, eci_vy, eci_vz,
+			   beta_angle, eci_sun_x, eci_sun_y, eci_sun_z,
+			   eci_obs_x, eci_obs_y, eci_obs_z;
+		   char	   ephem[5], sat_sun_status, findsun;
+		   int	   iaz, iel, ma256, isplat, isplong;
+		   long	   rv, irk;
+		}  predict_t;
+
 /* Functions for testing and setting/clearing flags used in SGP4/SDP4 code */
 
-int isFlagSet(int flag)
+int isFlagSet(predict_t *p, int flag)
 {
-	return (Flags&flag);
+	return (p->flags&flag);
 }
 
-int isFlagClear(int flag)
+int isFlagClear(predict_t *p, int flag)
 {
-	return (~Flags&flag);
+	return (~p->flags&flag);
 }
 
-void SetFlag(int flag)
+void SetFlag(predict_t *p, int flag)
 {
-	Flags|=flag;
+	p->flags|=flag;
 }
 
-void ClearFlag(int flag)
+void ClearFlag(predict_t *p, int flag)
 {
-	Flags&=~flag;
+	p->flags&=~flag;
 }
 
 /* Remaining SGP4/SDP4 code follows... */
@@ -788,13 +848,15 @@ int Sat_Eclipsed(vector_t *pos, vector_t *sol, double *depth)
 	}
 }
 
-void select_ephemeris(tle_t *tle)
+void select_ephemeris(predict_t *p)
 {
 	/* Selects the apropriate ephemeris type to be used */
 	/* for predictions according to the data in the TLE */
 	/* It also processes values in the tle set so that  */
 	/* they are apropriate for the sgp4/sdp4 routines   */
 
+	tle_t *tle=&p->tle;
+
 	double ao, xnodp, dd1, dd2, delo, temp, a1, del1, r1;
 
 	/* Preprocess tle set */
@@ -824,15 +886,15 @@ void select_ephemeris(tle_t *tle)
 
 	if (twopi/xnodp/xmnpda>=0.15625)
 	{
-		SetFlag(DEEP_SPACE_EPHEM_FLAG);
+		SetFlag(p, DEEP_SPACE_EPHEM_FLAG);
 	}
 	else
 	{
-		ClearFlag(DEEP_SPACE_EPHEM_FLAG);
+		ClearFlag(p, DEEP_SPACE_EPHEM_FLAG);
 	}
 }
 
-void SGP4(double tsince, tle_t * tle, vector_t * pos, vector_t * vel)
+void SGP4(predict_t *p, double tsince, vector_t * pos, vector_t * vel)
 {
 	/* This function is used to calculate the position and velocity */
 	/* of near-earth (period < 225 minutes) satellites. tsince is   */
@@ -841,9 +903,8 @@ void SGP4(double tsince, tle_t * tle, vector_t * pos, vector_t * vel)
 	/* are vector_t structures returning ECI satellite position and */
 	/* velocity. Use Convert_Sat_State() to convert to km and km/s. */
 
-	static double aodp, aycof, c1, c4, c5, cosio, d2, d3, d4, delmo,
-	omgcof, eta, omgdot, sinio, xnodp, sinmo, t2cof, t3cof, t4cof,
-	t5cof, x1mth2, x3thm1, x7thm1, xmcof, xmdot, xnodcf, xnodot, xlcof;
+	tle_t *tle=&p->tle;
+	sgp4_t *sgp4=&p->sgp4;
 
 	double cosuk, sinuk, rfdotk, vx, vy, vz, ux, uy, uz, xmy, xmx, cosnok,
 	sinnok, cosik, sinik, rdotk, xinck, xnodek, uk, rk, cos2u, sin2u,
@@ -859,25 +920,25 @@ void SGP4(double tsince, tle_t * tle, vector_t * pos, vector_t * vel)
 
 	/* Initialization */
 
-	if (isFlagClear(SGP4_INITIALIZED_FLAG))
+	if (isFlagClear(p, SGP4_INITIALIZED_FLAG))
 	{
-		SetFlag(SGP4_INITIALIZED_FLAG);
+		SetFlag(p, SGP4_INITIALIZED_FLAG);
 
 		/* Recover original mean motion (xnodp) and   */
 		/* semimajor axis (aodp) from input elements. */
 
 		a1=pow(xke/tle->xno,tothrd);
-		cosio=cos(tle->xincl);
-		theta2=cosio*cosio;
-		x3thm1=3*theta2-1.0;
+		sgp4->cosio=cos(tle->xincl);
+		theta2=sgp4->cosio*sgp4->cosio;
+		sgp4->x3thm1=3*theta2-1.0;
 		eosq=tle->eo*tle->eo;
 		betao2=1.0-eosq;
 		betao=sqrt(betao2);
-		del1=1.5*ck2*x3thm1/(a1*a1*betao*betao2);
+		del1=1.5*ck2*sgp4->x3thm1/(a1*a1*betao*betao2);
 		ao=a1*(1.0-del1*(0.5*tothrd+del1*(1.0+134.0/81.0*del1)));
-		delo=1.5*ck2*x3thm1/(ao*ao*betao*betao2);
-		xnodp=tle->xno/(1.0+delo);
-		aodp=ao/(1.0-delo);
+		delo=1.5*ck2*sgp4->x3thm1/(ao*ao*betao*betao2);
+		sgp4->xnodp=tle->xno/(1.0+delo);
+		sgp4->aodp=ao/(1.0-delo);
 
 		/* For perigee less than 220 kilometers, the "simple"     */
 		/* flag is set and the equations are truncated to linear  */
@@ -885,14 +946,14 @@ void SGP4(double tsince, tle_t * tle, vector_t * pos, vector_t * vel)
 		/* anomaly.  Also, the c3 term, the delta omega term, and */
 		/* the delta m term are dropped.                          */
 
-		if ((aodp*(1-tle->eo)/ae)<(220/xkmper+ae))
+		if ((sgp4->aodp*(1-tle->eo)/ae)<(220/xkmper+ae))
 		{
-		    SetFlag(SIMPLE_FLAG);
+		    SetFlag(p, SIMPLE_FLAG);
 		}
 
 		else
 		{
-		    ClearFlag(SIMPLE_FLAG);
+		    ClearFlag(p, SIMPLE_FLAG);
 		}
 
 		/* For perigees below 156 km, the      */
@@ -900,7 +961,7 @@ void SGP4(double tsince, tle_t * tle, vector_t * pos, vector_t * vel)
 
 		s4=s;
 		qoms24=qoms2t;
-		perigee=(aodp*(1-tle->eo)-ae)*xkmper;
+		perigee=(sgp4->aodp*(1-tle->eo)-ae)*xkmper;
 
 		if (perigee<156.0)
 		{
@@ -917,93 +978,93 @@ void SGP4(double tsince, tle_t * tle, vector_t * pos, vector_t * vel)
 			s4=s4/xkmper+ae;
 		}
 
-		pinvsq=1/(aodp*aodp*betao2*betao2);
-		tsi=1/(aodp-s4);
-		eta=aodp*tle->eo*tsi;
-		etasq=eta*eta;
-		eeta=tle->eo*eta;
+		pinvsq=1/(sgp4->aodp*sgp4->aodp*betao2*betao2);
+		tsi=1/(sgp4->aodp-s4);
+		sgp4->eta=sgp4->aodp*tle->eo*tsi;
+		etasq=sgp4->eta*sgp4->eta;
+		eeta=tle->eo*sgp4->eta;
 		psisq=fabs(1-etasq);
 		coef=qoms24*pow(tsi,4);
 		coef1=coef/pow(psisq,3.5);
-		c2=coef1*xnodp*(aodp*(1+1.5*etasq+eeta*(4+etasq))+0.75*ck2*tsi/psisq*x3thm1*(8+3*etasq*(8+etasq)));
-		c1=tle->bstar*c2;
-		sinio=sin(tle->xincl);
+		c2=coef1*sgp4->xnodp*(sgp4->aodp*(1+1.5*etasq+eeta*(4+etasq))+0.75*ck2*tsi/psisq*sgp4->x3thm1*(8+3*etasq*(8+etasq)));
+		sgp4->c1=tle->bstar*c2;
+		sgp4->sinio=sin(tle->xincl);
 		a3ovk2=-xj3/ck2*pow(ae,3);
-		c3=coef*tsi*a3ovk2*xnodp*ae*sinio/tle->eo;
-		x1mth2=1-theta2;
+		c3=coef*tsi*a3ovk2*sgp4->xnodp*ae*sgp4->sinio/tle->eo;
+		sgp4->x1mth2=1-theta2;
 
-		c4=2*xnodp*coef1*aodp*betao2*(eta*(2+0.5*etasq)+tle->eo*(0.5+2*etasq)-2*ck2*tsi/(aodp*psisq)*(-3*x3thm1*(1-2*eeta+etasq*(1.5-0.5*eeta))+0.75*x1mth2*(2*etasq-eeta*(1+etasq))*cos(2*tle->omegao)));
-		c5=2*coef1*aodp*betao2*(1+2.75*(etasq+eeta)+eeta*etasq);
+		sgp4->c4=2*sgp4->xnodp*coef1*sgp4->aodp*betao2*(sgp4->eta*(2+0.5*etasq)+tle->eo*(0.5+2*etasq)-2*ck2*tsi/(sgp4->aodp*psisq)*(-3*sgp4->x3thm1*(1-2*eeta+etasq*(1.5-0.5*eeta))+0.75*sgp4->x1mth2*(2*etasq-eeta*(1+etasq))*cos(2*tle->omegao)));
+		sgp4->c5=2*coef1*sgp4->aodp*betao2*(1+2.75*(etasq+eeta)+eeta*etasq);
 
 		theta4=theta2*theta2;
-		temp1=3*ck2*pinvsq*xnodp;
+		temp1=3*ck2*pinvsq*sgp4->xnodp;
 		temp2=temp1*ck2*pinvsq;
-		temp3=1.25*ck4*pinvsq*pinvsq*xnodp;
-		xmdot=xnodp+0.5*temp1*betao*x3thm1+0.0625*temp2*betao*(13-78*theta2+137*theta4);
+		temp3=1.25*ck4*pinvsq*pinvsq*sgp4->xnodp;
+		sgp4->xmdot=sgp4->xnodp+0.5*temp1*betao*sgp4->x3thm1+0.0625*temp2*betao*(13-78*theta2+137*theta4);
 		x1m5th=1-5*theta2;
-		omgdot=-0.5*temp1*x1m5th+0.0625*temp2*(7-114*theta2+395*theta4)+temp3*(3-36*theta2+49*theta4);
-		xhdot1=-temp1*cosio;
-		xnodot=xhdot1+(0.5*temp2*(4-19*theta2)+2*temp3*(3-7*theta2))*cosio;
-		omgcof=tle->bstar*c3*cos(tle->omegao);
-		xmcof=-tothrd*coef*tle->bstar*ae/eeta;
-		xnodcf=3.5*betao2*xhdot1*c1;
-		t2cof=1.5*c1;
-		xlcof=0.125*a3ovk2*sinio*(3+5*cosio)/(1+cosio);
-		aycof=0.25*a3ovk2*sinio;
-		delmo=pow(1+eta*cos(tle->xmo),3);
-		sinmo=sin(tle->xmo);
-		x7thm1=7*theta2-1;
-
-		if (isFlagClear(SIMPLE_FLAG))
+		sgp4->omgdot=-0.5*temp1*x1m5th+0.0625*temp2*(7-114*theta2+395*theta4)+temp3*(3-36*theta2+49*theta4);
+		xhdot1=-temp1*sgp4->cosio;
+		sgp4->xnodot=xhdot1+(0.5*temp2*(4-19*theta2)+2*temp3*(3-7*theta2))*sgp4->cosio;
+		sgp4->omgcof=tle->bstar*c3*cos(tle->omegao);
+		sgp4->xmcof=-tothrd*coef*tle->bstar*ae/eeta;
+		sgp4->xnodcf=3.5*betao2*xhdot1*sgp4->c1;
+		sgp4->t2cof=1.5*sgp4->c1;
+		sgp4->xlcof=0.125*a3ovk2*sgp4->sinio*(3+5*sgp4->cosio)/(1+sgp4->cosio);
+		sgp4->aycof=0.25*a3ovk2*sgp4->sinio;
+		sgp4->delmo=pow(1+sgp4->eta*cos(tle->xmo),3);
+		sgp4->sinmo=sin(tle->xmo);
+		sgp4->x7thm1=7*theta2-1;
+
+		if (isFlagClear(p, SIMPLE_FLAG))
 		{
-			c1sq=c1*c1;
-			d2=4*aodp*tsi*c1sq;
-			temp=d2*tsi*c1/3;
-			d3=(17*aodp+s4)*temp;
-			d4=0.5*temp*aodp*tsi*(221*aodp+31*s4)*c1;
-			t3cof=d2+2*c1sq;
-			t4cof=0.25*(3*d3+c1*(12*d2+10*c1sq));
-			t5cof=0.2*(3*d4+12*c1*d3+6*d2*d2+15*c1sq*(2*d2+c1sq));
+			c1sq=sgp4->c1*sgp4->c1;
+			sgp4->d2=4*sgp4->aodp*tsi*c1sq;
+			temp=sgp4->d2*tsi*sgp4->c1/3;
+			sgp4->d3=(17*sgp4->aodp+s4)*temp;
+			sgp4->d4=0.5*temp*sgp4->aodp*tsi*(221*sgp4->aodp+31*s4)*sgp4->c1;
+			sgp4->t3cof=sgp4->d2+2*c1sq;
+			sgp4->t4cof=0.25*(3*sgp4->d3+sgp4->c1*(12*sgp4->d2+10*c1sq));
+			sgp4->t5cof=0.2*(3*sgp4->d4+12*sgp4->c1*sgp4->d3+6*sgp4->d2*sgp4->d2+15*c1sq*(2*sgp4->d2+c1sq));
 		}
 	}
 
 	/* Update for secular gravity and atmospheric drag. */
-	xmdf=tle->xmo+xmdot*tsince;
-	omgadf=tle->omegao+omgdot*tsince;
-	xnoddf=tle->xnodeo+xnodot*tsince;
+	xmdf=tle->xmo+sgp4->xmdot*tsince;
+	omgadf=tle->omegao+sgp4->omgdot*tsince;
+	xnoddf=tle->xnodeo+sgp4->xnodot*tsince;
 	omega=omgadf;
 	xmp=xmdf;
 	tsq=tsince*tsince;
-	xnode=xnoddf+xnodcf*tsq;
-	tempa=1-c1*tsince;
-	tempe=tle->bstar*c4*tsince;
-	templ=t2cof*tsq;
+	xnode=xnoddf+sgp4->xnodcf*tsq;
+	tempa=1-sgp4->c1*tsince;
+	tempe=tle->bstar*sgp4->c4*tsince;
+	templ=sgp4->t2cof*tsq;
 
-	if (isFlagClear(SIMPLE_FLAG))
+	if (isFlagClear(p, SIMPLE_FLAG))
 	{
-		delomg=omgcof*tsince;
-		delm=xmcof*(pow(1+eta*cos(xmdf),3)-delmo);
+		delomg=sgp4->omgcof*tsince;
+		delm=sgp4->xmcof*(pow(1+sgp4->eta*cos(xmdf),3)-sgp4->delmo);
 		temp=delomg+delm;
 		xmp=xmdf+temp;
 		omega=omgadf-temp;
 		tcube=tsq*tsince;
 		tfour=tsince*tcube;
-		tempa=tempa-d2*tsq-d3*tcube-d4*tfour;
-		tempe=tempe+tle->bstar*c5*(sin(xmp)-sinmo);
-		templ=templ+t3cof*tcube+tfour*(t4cof+tsince*t5cof);
+		tempa=tempa-sgp4->d2*tsq-sgp4->d3*tcube-sgp4->d4*tfour;
+		tempe=tempe+tle->bstar*sgp4->c5*(sin(xmp)-sgp4->sinmo);
+		templ=templ+sgp4->t3cof*tcube+tfour*(sgp4->t4cof+tsince*sgp4->t5cof);
 	}
 
-	a=aodp*pow(tempa,2);
+	a=sgp4->aodp*pow(tempa,2);
 	e=tle->eo-tempe;
-	xl=xmp+omega+xnode+xnodp*templ;
+	xl=xmp+omega+xnode+sgp4->xnodp*templ;
 	beta=sqrt(1-e*e);
 	xn=xke/pow(a,1.5);
 
 	/* Long period periodics */
 	axn=e*cos(omega);
 	temp=1/(a*beta*beta);
-	xll=temp*xlcof*axn;
-	aynl=temp*aycof;
+	xll=temp*sgp4->xlcof*axn;
+	aynl=temp*sgp4->aycof;
 	xlt=xl+xll;
 	ayn=e*sin(omega)+aynl;
 
@@ -1054,12 +1115,12 @@ void SGP4(double tsince, tle_t * tle, vector_t * pos, vector_t * vel)
 	temp2=temp1*temp;
 
 	/* Update for short periodics */
-	rk=r*(1-1.5*temp2*betal*x3thm1)+0.5*temp1*x1mth2*cos2u;
-	uk=u-0.25*temp2*x7thm1*sin2u;
-	xnodek=xnode+1.5*temp2*cosio*sin2u;
-	xinck=tle->xincl+1.5*temp2*cosio*sinio*cos2u;
-	rdotk=rdot-xn*temp1*x1mth2*sin2u;
-	rfdotk=rfdot+xn*temp1*(x1mth2*cos2u+1.5*x3thm1);
+	rk=r*(1-1.5*temp2*betal*sgp4->x3thm1)+0.5*temp1*sgp4->x1mth2*cos2u;
+	uk=u-0.25*temp2*sgp4->x7thm1*sin2u;
+	xnodek=xnode+1.5*temp2*sgp4->cosio*sin2u;
+	xinck=tle->xincl+1.5*temp2*sgp4->cosio*sgp4->sinio*cos2u;
+	rdotk=rdot-xn*temp1*sgp4->x1mth2*sin2u;
+	rfdotk=rfdot+xn*temp1*(sgp4->x1mth2*cos2u+1.5*sgp4->x3thm1);
 
 	/* Orientation vectors */
 	sinuk=sin(uk);
@@ -1086,28 +1147,23 @@ void SGP4(double tsince, tle_t * tle, vector_t * pos, vector_t * vel)
 	vel->z=rdotk*uz+rfdotk*vz;
 
 	/* Phase in radians */
-	phase=xlt-xnode-omgadf+twopi;
+	p->phase=xlt-xnode-omgadf+twopi;
 
-	if (phase<0.0)
+	if (p->phase<0.0)
 	{
-		phase+=twopi;
+		p->phase+=twopi;
 	}
 
-	phase=FMod2p(phase);
+	p->phase=FMod2p(p->phase);
 }
 
-void Deep(int ientry, tle_t * tle, deep_arg_t * deep_arg)
+void Deep(predict_t *p, int ientry, deep_arg_t * deep_arg)
 {
 	/* This function is used by SDP4 to add lunar and solar */
 	/* perturbation effects to deep-space orbit objects.    */
 
-	static double thgr, xnq, xqncl, omegaq, zmol, zmos, savtsn, ee2, e3,
-	xi2, xl2, xl3, xl4, xgh2, xgh3, xgh4, xh2, xh3, sse, ssi, ssg, xi3,
-	se2, si2, sl2, sgh2, sh2, se3, si3, sl3, sgh3, sh3, sl4, sgh4, ssl,
-	ssh, d3210, d3222, d4410, d4422, d5220, d5232, d5421, d5433, del1,
-	del2, del3, fasx2, fasx4, fasx6, xlamo, xfact, xni, atime, stepp,
-	stepn, step2, preep, pl, sghs, xli, d2201, d2211, sghl, sh1, pinc,
-	pe, shs, zsingl, zcosgl, zsinhl, zcoshl, zsinil, zcosil;
+	tle_t *tle=&p->tle;
+	deep_t *deep=&p->deep;
 
 	double a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, ainv2, alfdp, aqnv,
 	sgh, sini2, sinis, sinok, sh, si, sil, day, betdp, dalf, bfact, c,
@@ -1124,45 +1180,45 @@ void Deep(int ientry, tle_t * tle, deep_arg_t * deep_arg)
 	switch (ientry)
 	{
 		case dpinit:  /* Entrance for deep space initialization */
-		thgr=ThetaG(tle->epoch,deep_arg);
+		deep->thgr=ThetaG(tle->epoch,deep_arg);
 		eq=tle->eo;
-		xnq=deep_arg->xnodp;
+		deep->xnq=deep_arg->xnodp;
 		aqnv=1/deep_arg->aodp;
-		xqncl=tle->xincl;
+		deep->xqncl=tle->xincl;
 		xmao=tle->xmo;
 		xpidot=deep_arg->omgdot+deep_arg->xnodot;
 		sinq=sin(tle->xnodeo);
 		cosq=cos(tle->xnodeo);
-		omegaq=tle->omegao;
+		deep->omegaq=tle->omegao;
 
 		/* Initialize lunar solar terms */
 		day=deep_arg->ds50+18261.5;  /* Days since 1900 Jan 0.5 */
 
-		if (day!=preep)
+		if (day!=deep->preep)
 		{
-			preep=day;
+			deep->preep=day;
 			xnodce=4.5236020-9.2422029E-4*day;
 			stem=sin(xnodce);
 			ctem=cos(xnodce);
-			zcosil=0.91375164-0.03568096*ctem;
-			zsinil=sqrt(1-zcosil*zcosil);
-			zsinhl=0.089683511*stem/zsinil;
-			zcoshl=sqrt(1-zsinhl*zsinhl);
+			deep->zcosil=0.91375164-0.03568096*ctem;
+			deep->zsinil=sqrt(1-deep->zcosil*deep->zcosil);
+			deep->zsinhl=0.089683511*stem/deep->zsinil;
+			deep->zcoshl=sqrt(1-deep->zsinhl*deep->zsinhl);
 			c=4.7199672+0.22997150*day;
 			gam=5.8351514+0.0019443680*day;
-			zmol=FMod2p(c-gam);
-			zx=0.39785416*stem/zsinil;
-			zy=zcoshl*ctem+0.91744867*zsinhl*stem;
+			deep->zmol=FMod2p(c-gam);
+			zx=0.39785416*stem/deep->zsinil;
+			zy=deep->zcoshl*ctem+0.91744867*deep->zsinhl*stem;
 			zx=AcTan(zx,zy);
 			zx=gam+zx-xnodce;
-			zcosgl=cos(zx);
-			zsingl=sin(zx);
-			zmos=6.2565837+0.017201977*day;
-			zmos=FMod2p(zmos);
+			deep->zcosgl=cos(zx);
+			deep->zsingl=sin(zx);
+			deep->zmos=6.2565837+0.017201977*day;
+			deep->zmos=FMod2p(deep->zmos);
 		    }
 
 		  /* Do solar terms */
-		  savtsn=1E20;
+		  deep->savtsn=1E20;
 		  zcosg=zcosgs;
 		  zsing=zsings;
 		  zcosi=zcosis;
@@ -1172,8 +1228,8 @@ void Deep(int ientry, tle_t * tle, deep_arg_t * deep_arg)
 		  cc=c1ss;
 		  zn=zns;
 		  ze=zes;
-		  zmo=zmos;
-		  xnoi=1/xnq;
+		  zmo=deep->zmos;
+		  xnoi=1/deep->xnq;
 
 		  /* Loop breaks when Solar terms are done a second */
 		  /* time, after Lunar terms are initialized        */
@@ -1227,73 +1283,73 @@ void Deep(int ientry, tle_t * tle, deep_arg_t * deep_arg)
 			sgh=s4*zn*(z31+z33-6);
 			sh=-zn*s2*(z21+z23);
 
-			if (xqncl<5.2359877E-2)
+			if (deep->xqncl<5.2359877E-2)
 			{
 				sh=0;
 			}
 
-			ee2=2*s1*s6;
-			e3=2*s1*s7;
-			xi2=2*s2*z12;
-			xi3=2*s2*(z13-z11);
-			xl2=-2*s3*z2;
-			xl3=-2*s3*(z3-z1);
-			xl4=-2*s3*(-21-9*deep_arg->eosq)*ze;
-			xgh2=2*s4*z32;
-			xgh3=2*s4*(z33-z31);
-			xgh4=-18*s4*ze;
-			xh2=-2*s2*z22;
-			xh3=-2*s2*(z23-z21);
-
-			if (isFlagSet(LUNAR_TERMS_DONE_FLAG))
+			deep->ee2=2*s1*s6;
+			deep->e3=2*s1*s7;
+			deep->xi2=2*s2*z12;
+			deep->xi3=2*s2*(z13-z11);
+			deep->xl2=-2*s3*z2;
+			deep->xl3=-2*s3*(z3-z1);
+			deep->xl4=-2*s3*(-21-9*deep_arg->eosq)*ze;
+			deep->xgh2=2*s4*z32;
+			deep->xgh3=2*s4*(z33-z31);
+			deep->xgh4=-18*s4*ze;
+			deep->xh2=-2*s2*z22;
+			deep->xh3=-2*s2*(z23-z21);
+
+			if (isFlagSet(p, LUNAR_TERMS_DONE_FLAG))
 			{
 				break;
 			}
 
 			/* Do lunar terms */
-			sse=se;
-			ssi=si;
-			ssl=sl;
-			ssh=sh/deep_arg->sinio;
-			ssg=sgh-deep_arg->cosio*ssh;
-			se2=ee2;
-			si2=xi2;
-			sl2=xl2;
-			sgh2=xgh2;
-			sh2=xh2;
-			se3=e3;
-			si3=xi3;
-			sl3=xl3;
-			sgh3=xgh3;
-			sh3=xh3;
-			sl4=xl4;
-			sgh4=xgh4;
-			zcosg=zcosgl;
-			zsing=zsingl;
-			zcosi=zcosil;
-			zsini=zsinil;
-			zcosh=zcoshl*cosq+zsinhl*sinq;
-			zsinh=sinq*zcoshl-cosq*zsinhl;
+			deep->sse=se;
+			deep->ssi=si;
+			deep->ssl=sl;
+			deep->ssh=sh/deep_arg->sinio;
+			deep->ssg=sgh-deep_arg->cosio*deep->ssh;
+			deep->se2=deep->ee2;
+			deep->si2=deep->xi2;
+			deep->sl2=deep->xl2;
+			deep->sgh2=deep->xgh2;
+			deep->sh2=deep->xh2;
+			deep->se3=deep->e3;
+			deep->si3=deep->xi3;
+			deep->sl3=deep->xl3;
+			deep->sgh3=deep->xgh3;
+			deep->sh3=deep->xh3;
+			deep->sl4=deep->xl4;
+			deep->sgh4=deep->xgh4;
+			zcosg=deep->zcosgl;
+			zsing=deep->zsingl;
+			zcosi=deep->zcosil;
+			zsini=deep->zsinil;
+			zcosh=deep->zcoshl*cosq+deep->zsinhl*sinq;
+			zsinh=sinq*deep->zcoshl-cosq*deep->zsinhl;
 			zn=znl;
 			cc=c1l;
 			ze=zel;
-			zmo=zmol;
-			SetFlag(LUNAR_TERMS_DONE_FLAG);
+			zmo=deep->zmol;
+			SetFlag(p, LUNAR_TERMS_DONE_FLAG);
 		}
 
-		sse=sse+se;
-		ssi=ssi+si;
-		ssl=ssl+sl;
-		ssg=ssg+sgh-deep_arg->cosio/deep_arg->sinio*sh;
-		ssh=ssh+sh/deep_arg->sinio;
+		deep->sse=deep->sse+se;
+		deep->ssi=deep->ssi+si;
+		deep->ssl=deep->ssl+sl;
+		deep->ssg=deep->ssg+sgh-deep_arg->cosio/deep_arg->sinio*sh;
+		deep->ssh=deep->ssh+sh/deep_arg->sinio;
 
 		/* Geopotential resonance initialization for 12 hour orbits */
-		ClearFlag(RESONANCE_FLAG);
-		ClearFlag(SYNCHRONOUS_FLAG);
+		ClearFlag(p, RESONANCE_FLAG);
+		ClearFlag(p, SYNCHRONOUS_FLAG);
 
-		if (!((xnq<0.0052359877) && (xnq>0.0034906585)))
+		if (!((deep->xnq<0.0052359877) && (deep->xnq>0.0034906585)))
 		{
-			if ((xnq<0.00826) || (xnq>0.00924))
+			if ((deep->xnq<0.00826) || (deep->xnq>0.00924))
 			{
 			    return;
 			}
@@ -1303,7 +1359,7 @@ void Deep(int ientry, tle_t * tle, deep_arg_t * deep_arg)
 			    return;
 			}
 
-			SetFlag(RESONANCE_FLAG);
+			SetFlag(p, RESONANCE_FLAG);
 			eoc=eq*deep_arg->eosq;
 			g201=-0.306-(eq-0.64)*0.440;
 
@@ -1361,36 +1417,36 @@ void Deep(int ientry, tle_t * tle, deep_arg_t * deep_arg)
 			f523=deep_arg->sinio*(4.92187512*sini2*(-2-4*deep_arg->cosio+10*deep_arg->theta2)+6.56250012*(1+2*deep_arg->cosio-3*deep_arg->theta2));
 			f542=29.53125*deep_arg->sinio*(2-8*deep_arg->cosio+deep_arg->theta2*(-12+8*deep_arg->cosio+10*deep_arg->theta2));
 			f543=29.53125*deep_arg->sinio*(-2-8*deep_arg->cosio+deep_arg->theta2*(12+8*deep_arg->cosio-10*deep_arg->theta2));
-			xno2=xnq*xnq;
+			xno2=deep->xnq*deep->xnq;
 			ainv2=aqnv*aqnv;
 			temp1=3*xno2*ainv2;
 			temp=temp1*root22;
-			d2201=temp*f220*g201;
-			d2211=temp*f221*g211;
+			deep->d2201=temp*f220*g201;
+			deep->d2211=temp*f221*g211;
 			temp1=temp1*aqnv;
 			temp=temp1*root32;
-			d3210=temp*f321*g310;
-			d3222=temp*f322*g322;
+			deep->d3210=temp*f321*g310;
+			deep->d3222=temp*f322*g322;
 			temp1=temp1*aqnv;
 			temp=2*temp1*root44;
-			d4410=temp*f441*g410;
-			d4422=temp*f442*g422;
+			deep->d4410=temp*f441*g410;
+			deep->d4422=temp*f442*g422;
 			temp1=temp1*aqnv;
 			temp=temp1*root52;
-			d5220=temp*f522*g520;
-			d5232=temp*f523*g532;
+			deep->d5220=temp*f522*g520;
+			deep->d5232=temp*f523*g532;
 			temp=2*temp1*root54;
-			d5421=temp*f542*g521;
-			d5433=temp*f543*g533;
-			xlamo=xmao+tle->xnodeo+tle->xnodeo-thgr-thgr;
+			deep->d5421=temp*f542*g521;
+			deep->d5433=temp*f543*g533;
+			deep->xlamo=xmao+tle->xnodeo+tle->xnodeo-deep->thgr-deep->thgr;
 			bfact=deep_arg->xmdot+deep_arg->xnodot+deep_arg->xnodot-thdt-thdt;
-			bfact=bfact+ssl+ssh+ssh;
+			bfact=bfact+deep->ssl+deep->ssh+deep->ssh;
 		}
 
 		else
 		{
-			SetFlag(RESONANCE_FLAG);
-			SetFlag(SYNCHRONOUS_FLAG);
+			SetFlag(p, RESONANCE_FLAG);
+			SetFlag(p, SYNCHRONOUS_FLAG);
 
 			/* Synchronous resonance terms initialization */
 			g200=1+deep_arg->eosq*(-2.5+0.8125*deep_arg->eosq);
@@ -1400,36 +1456,36 @@ void Deep(int ientry, tle_t * tle, deep_arg_t * deep_arg)
 			f311=0.9375*deep_arg->sinio*deep_arg->sinio*(1+3*deep_arg->cosio)-0.75*(1+deep_arg->cosio);
 			f330=1+deep_arg->cosio;
 			f330=1.875*f330*f330*f330;
-			del1=3*xnq*xnq*aqnv*aqnv;
-			del2=2*del1*f220*g200*q22;
-			del3=3*del1*f330*g300*q33*aqnv;
-			del1=del1*f311*g310*q31*aqnv;
-			fasx2=0.13130908;
-			fasx4=2.8843198;
-			fasx6=0.37448087;
-			xlamo=xmao+tle->xnodeo+tle->omegao-thgr;
+			deep->del1=3*deep->xnq*deep->xnq*aqnv*aqnv;
+			deep->del2=2*deep->del1*f220*g200*q22;
+			deep->del3=3*deep->del1*f330*g300*q33*aqnv;
+			deep->del1=deep->del1*f311*g310*q31*aqnv;
+			deep->fasx2=0.13130908;
+			deep->fasx4=2.8843198;
+			deep->fasx6=0.37448087;
+			deep->xlamo=xmao+tle->xnodeo+tle->omegao-deep->thgr;
 			bfact=deep_arg->xmdot+xpidot-thdt;
-			bfact=bfact+ssl+ssg+ssh;
+			bfact=bfact+deep->ssl+deep->ssg+deep->ssh;
 		}
 
-		xfact=bfact-xnq;
+		deep->xfact=bfact-deep->xnq;
 
 		/* Initialize integrator */
-		xli=xlamo;
-		xni=xnq;
-		atime=0;
-		stepp=720;
-		stepn=-720;
-		step2=259200;
+		deep->xli=deep->xlamo;
+		deep->xni=deep->xnq;
+		deep->atime=0;
+		deep->stepp=720;
+		deep->stepn=-720;
+		deep->step2=259200;
 
 		return;
 
 		case dpsec:  /* Entrance for deep space secular effects */
-		deep_arg->xll=deep_arg->xll+ssl*deep_arg->t;
-		deep_arg->omgadf=deep_arg->omgadf+ssg*deep_arg->t;
-		deep_arg->xnode=deep_arg->xnode+ssh*deep_arg->t;
-		deep_arg->em=tle->eo+sse*deep_arg->t;
-		deep_arg->xinc=tle->xincl+ssi*deep_arg->t;
+		deep_arg->xll=deep_arg->xll+deep->ssl*deep_arg->t;
+		deep_arg->omgadf=deep_arg->omgadf+deep->ssg*deep_arg->t;
+		deep_arg->xnode=deep_arg->xnode+deep->ssh*deep_arg->t;
+		deep_arg->em=tle->eo+deep->sse*deep_arg->t;
+		deep_arg->xinc=tle->xincl+deep->ssi*deep_arg->t;
 
 		if (deep_arg->xinc<0)
 		{
@@ -1438,107 +1494,107 @@ void Deep(int ientry, tle_t * tle, deep_arg_t * deep_arg)
 			deep_arg->omgadf=deep_arg->omgadf-pi;
 		}
 
-		if (isFlagClear(RESONANCE_FLAG))
+		if (isFlagClear(p, RESONANCE_FLAG))
 		{
 		      return;
 		}
 
 		do
 		{
-			if ((atime==0) || ((deep_arg->t>=0) && (atime<0)) || ((deep_arg->t<0) && (atime>=0)))
+			if ((deep->atime==0) || ((deep_arg->t>=0) && (deep->atime<0)) || ((deep_arg->t<0) && (deep->atime>=0)))
 			{
 				/* Epoch restart */
 
 				if (deep_arg->t>=0)
 				{
-					delt=stepp;
+					delt=deep->stepp;
 				}
 				else
 				{
-					delt=stepn;
+					delt=deep->stepn;
 				}
 
-				atime=0;
-				xni=xnq;
-				xli=xlamo;
+				deep->atime=0;
+				deep->xni=deep->xnq;
+				deep->xli=deep->xlamo;
 			}
 
 			else
 			{
-				if (fabs(deep_arg->t)>=fabs(atime))
+				if (fabs(deep_arg->t)>=fabs(deep->atime))
 				{
 					if (deep_arg->t>0)
 					{
-						delt=stepp;
+						delt=deep->stepp;
 					}
 					else
 					{
-						delt=stepn;
+						delt=deep->stepn;
 					}
 				}
 			}
 
 			do
 			{
-				if (fabs(deep_arg->t-atime)>=stepp)
+				if (fabs(deep_arg->t-deep->atime)>=deep->stepp)
 				{
-					SetFlag(DO_LOOP_FLAG);
-					ClearFlag(EPOCH_RESTART_FLAG);
+					SetFlag(p, DO_LOOP_FLAG);
+					ClearFlag(p, EPOCH_RESTART_FLAG);
 				}
 
 				else
 				{
-					ft=deep_arg->t-atime;
-					ClearFlag(DO_LOOP_FLAG);
+					ft=deep_arg->t-deep->atime;
+					ClearFlag(p, DO_LOOP_FLAG);
 				}
 
-				if (fabs(deep_arg->t)<fabs(atime))
+				if (fabs(deep_arg->t)<fabs(deep->atime))
 				{
 					if (deep_arg->t>=0)
 					{
-						delt=stepn;
+						delt=deep->stepn;
 					}
 					else
 					{
-						delt=stepp;
+						delt=deep->stepp;
 					}
 
-					SetFlag(DO_LOOP_FLAG | EPOCH_RESTART_FLAG);
+					SetFlag(p, DO_LOOP_FLAG | EPOCH_RESTART_FLAG);
 				}
 
 				/* Dot terms calculated */
-				if (isFlagSet(SYNCHRONOUS_FLAG))
+				if (isFlagSet(p, SYNCHRONOUS_FLAG))
 				{
-					xndot=del1*sin(xli-fasx2)+del2*sin(2*(xli-fasx4))+del3*sin(3*(xli-fasx6));
-					xnddt=del1*cos(xli-fasx2)+2*del2*cos(2*(xli-fasx4))+3*del3*cos(3*(xli-fasx6));
+					xndot=deep->del1*sin(deep->xli-deep->fasx2)+deep->del2*sin(2*(deep->xli-deep->fasx4))+deep->del3*sin(3*(deep->xli-deep->fasx6));
+					xnddt=deep->del1*cos(deep->xli-deep->fasx2)+2*deep->del2*cos(2*(deep->xli-deep->fasx4))+3*deep->del3*cos(3*(deep->xli-deep->fasx6));
 				}
 
 				else
 				{
-					xomi=omegaq+deep_arg->omgdot*atime;
+					xomi=deep->omegaq+deep_arg->omgdot*deep->atime;
 					x2omi=xomi+xomi;
-					x2li=xli+xli;
-					xndot=d2201*sin(x2omi+xli-g22)+d2211*sin(xli-g22)+d3210*sin(xomi+xli-g32)+d3222*sin(-xomi+xli-g32)+d4410*sin(x2omi+x2li-g44)+d4422*sin(x2li-g44)+d5220*sin(xomi+xli-g52)+d5232*sin(-xomi+xli-g52)+d5421*sin(xomi+x2li-g54)+d5433*sin(-xomi+x2li-g54);
-					xnddt=d2201*cos(x2omi+xli-g22)+d2211*cos(xli-g22)+d3210*cos(xomi+xli-g32)+d3222*cos(-xomi+xli-g32)+d5220*cos(xomi+xli-g52)+d5232*cos(-xomi+xli-g52)+2*(d4410*cos(x2omi+x2li-g44)+d4422*cos(x2li-g44)+d5421*cos(xomi+x2li-g54)+d5433*cos(-xomi+x2li-g54));
+					x2li=deep->xli+deep->xli;
+					xndot=deep->d2201*sin(x2omi+deep->xli-g22)+deep->d2211*sin(deep->xli-g22)+deep->d3210*sin(xomi+deep->xli-g32)+deep->d3222*sin(-xomi+deep->xli-g32)+deep->d4410*sin(x2omi+x2li-g44)+deep->d4422*sin(x2li-g44)+deep->d5220*sin(xomi+deep->xli-g52)+deep->d5232*sin(-xomi+deep->xli-g52)+deep->d5421*sin(xomi+x2li-g54)+deep->d5433*sin(-xomi+x2li-g54);
+					xnddt=deep->d2201*cos(x2omi+deep->xli-g22)+deep->d2211*cos(deep->xli-g22)+deep->d3210*cos(xomi+deep->xli-g32)+deep->d3222*cos(-xomi+deep->xli-g32)+deep->d5220*cos(xomi+deep->xli-g52)+deep->d5232*cos(-xomi+deep->xli-g52)+2*(deep->d4410*cos(x2omi+x2li-g44)+deep->d4422*cos(x2li-g44)+deep->d5421*cos(xomi+x2li-g54)+deep->d5433*cos(-xomi+x2li-g54));
 				}
 
-				xldot=xni+xfact;
+				xldot=deep->xni+deep->xfact;
 				xnddt=xnddt*xldot;
 
-				if (isFlagSet(DO_LOOP_FLAG))
+				if (isFlagSet(p, DO_LOOP_FLAG))
 				{
-					xli=xli+xldot*delt+xndot*step2;
-					xni=xni+xndot*delt+xnddt*step2;
-					atime=atime+delt;
+					deep->xli=deep->xli+xldot*delt+xndot*deep->step2;
+					deep->xni=deep->xni+xndot*delt+xnddt*deep->step2;
+					deep->atime=deep->atime+delt;
 				}
-			} while (isFlagSet(DO_LOOP_FLAG) && isFlagClear(EPOCH_RESTART_FLAG));
-		} while (isFlagSet(DO_LOOP_FLAG) && isFlagSet(EPOCH_RESTART_FLAG));
+			} while (isFlagSet(p, DO_LOOP_FLAG) && isFlagClear(p, EPOCH_RESTART_FLAG));
+		} while (isFlagSet(p, DO_LOOP_FLAG) && isFlagSet(p, EPOCH_RESTART_FLAG));
 
-		deep_arg->xn=xni+xndot*ft+xnddt*ft*ft*0.5;
-		xl=xli+xldot*ft+xndot*ft*ft*0.5;
-		temp=-deep_arg->xnode+thgr+deep_arg->t*thdt;
+		deep_arg->xn=deep->xni+xndot*ft+xnddt*ft*ft*0.5;
+		xl=deep->xli+xldot*ft+xndot*ft*ft*0.5;
+		temp=-deep_arg->xnode+deep->thgr+deep_arg->t*thdt;
 
-		if (isFlagClear(SYNCHRONOUS_FLAG))
+		if (isFlagClear(p, SYNCHRONOUS_FLAG))
 		{
 			deep_arg->xll=xl+temp+temp;
 		}
@@ -1553,47 +1609,47 @@ void Deep(int ientry, tle_t * tle, deep_arg_t * deep_arg)
 		sinis=sin(deep_arg->xinc);
 		cosis=cos(deep_arg->xinc);
 
-		if (fabs(savtsn-deep_arg->t)>=30)
+		if (fabs(deep->savtsn-deep_arg->t)>=30)
 		{
-			savtsn=deep_arg->t;
-			zm=zmos+zns*deep_arg->t;
+			deep->savtsn=deep_arg->t;
+			zm=deep->zmos+zns*deep_arg->t;
 			zf=zm+2*zes*sin(zm);
 			sinzf=sin(zf);
 			f2=0.5*sinzf*sinzf-0.25;
 			f3=-0.5*sinzf*cos(zf);
-			ses=se2*f2+se3*f3;
-			sis=si2*f2+si3*f3;
-			sls=sl2*f2+sl3*f3+sl4*sinzf;
-			sghs=sgh2*f2+sgh3*f3+sgh4*sinzf;
-			shs=sh2*f2+sh3*f3;
-			zm=zmol+znl*deep_arg->t;
+			ses=deep->se2*f2+deep->se3*f3;
+			sis=deep->si2*f2+deep->si3*f3;
+			sls=deep->sl2*f2+deep->sl3*f3+deep->sl4*sinzf;
+			deep->sghs=deep->sgh2*f2+deep->sgh3*f3+deep->sgh4*sinzf;
+			deep->shs=deep->sh2*f2+deep->sh3*f3;
+			zm=deep->zmol+znl*deep_arg->t;
 			zf=zm+2*zel*sin(zm);
 			sinzf=sin(zf);
 			f2=0.5*sinzf*sinzf-0.25;
 			f3=-0.5*sinzf*cos(zf);
-			sel=ee2*f2+e3*f3;
-			sil=xi2*f2+xi3*f3;
-			sll=xl2*f2+xl3*f3+xl4*sinzf;
-			sghl=xgh2*f2+xgh3*f3+xgh4*sinzf;
-			sh1=xh2*f2+xh3*f3;
-			pe=ses+sel;
-			pinc=sis+sil;
-			pl=sls+sll;
+			sel=deep->ee2*f2+deep->e3*f3;
+			sil=deep->xi2*f2+deep->xi3*f3;
+			sll=deep->xl2*f2+deep->xl3*f3+deep->xl4*sinzf;
+			deep->sghl=deep->xgh2*f2+deep->xgh3*f3+deep->xgh4*sinzf;
+			deep->sh1=deep->xh2*f2+deep->xh3*f3;
+			deep->pe=ses+sel;
+			deep->pinc=sis+sil;
+			deep->pl=sls+sll;
 		}
 
-		pgh=sghs+sghl;
-		ph=shs+sh1;
-		deep_arg->xinc=deep_arg->xinc+pinc;
-		deep_arg->em=deep_arg->em+pe;
+		pgh=deep->sghs+deep->sghl;
+		ph=deep->shs+deep->sh1;
+		deep_arg->xinc=deep_arg->xinc+deep->pinc;
+		deep_arg->em=deep_arg->em+deep->pe;
 
-		if (xqncl>=0.2)
+		if (deep->xqncl>=0.2)
 		{
 			/* Apply periodics directly */
 			ph=ph/deep_arg->sinio;
 			pgh=pgh-deep_arg->cosio*ph;
 			deep_arg->omgadf=deep_arg->omgadf+pgh;
 			deep_arg->xnode=deep_arg->xnode+ph;
-			deep_arg->xll=deep_arg->xll+pl;
+			deep_arg->xll=deep_arg->xll+deep->pl;
 		}
 
 		else
@@ -1603,13 +1659,13 @@ void Deep(int ientry, tle_t * tle, deep_arg_t * deep_arg)
 			cosok=cos(deep_arg->xnode);
 			alfdp=sinis*sinok;
 			betdp=sinis*cosok;
-			dalf=ph*cosok+pinc*cosis*sinok;
-			dbet=-ph*sinok+pinc*cosis*cosok;
+			dalf=ph*cosok+deep->pinc*cosis*sinok;
+			dbet=-ph*sinok+deep->pinc*cosis*cosok;
 			alfdp=alfdp+dalf;
 			betdp=betdp+dbet;
 			deep_arg->xnode=FMod2p(deep_arg->xnode);
 			xls=deep_arg->xll+deep_arg->omgadf+cosis*deep_arg->xnode;
-			dls=pl+pgh-pinc*deep_arg->xnode*sinis;
+			dls=deep->pl+pgh-deep->pinc*deep_arg->xnode*sinis;
 			xls=xls+dls;
 			xnoh=deep_arg->xnode;
 			deep_arg->xnode=AcTan(alfdp,betdp);
@@ -1629,14 +1685,14 @@ void Deep(int ientry, tle_t * tle, deep_arg_t * deep_arg)
 				}
 			}
 
-			deep_arg->xll=deep_arg->xll+pl;
+			deep_arg->xll=deep_arg->xll+deep->pl;
 			deep_arg->omgadf=xls-deep_arg->xll-cos(deep_arg->xinc)*deep_arg->xnode;
 		}
 		return;
 	}
 }
 
-void SDP4(double tsince, tle_t * tle, vector_t * pos, vector_t * vel)
+void SDP4(predict_t *p, double tsince, vector_t * pos, vector_t * vel)
 {
 	/* This function is used to calculate the position and velocity */
 	/* of deep-space (period > 225 minutes) satellites. tsince is   */
@@ -1647,8 +1703,9 @@ void SDP4(double tsince, tle_t * tle, vector_t * pos, vector_t * vel)
 
 	int i;
 
-	static double x3thm1, c1, x1mth2, c4, xnodcf, t2cof, xlcof,
-	aycof, x7thm1;
+	tle_t *tle=&p->tle;
+	sdp4_t *sdp4=&p->sdp4;
+	deep_arg_t *deep_arg=&p->sdp4.deep_arg;
 
 	double a, axn, ayn, aynl, beta, betal, capu, cos2u, cosepw, cosik,
 	cosnok, cosu, cosuk, ecose, elsq, epw, esine, pl, theta4, rdot,
@@ -1657,38 +1714,36 @@ void SDP4(double tsince, tle_t * tle, vector_t * pos, vector_t * vel)
 	xlt, xmam, xmdf, xmx, xmy, xnoddf, xnodek, xll, a1, a3ovk2, ao, c2,
 	coef, coef1, x1m5th, xhdot1, del1, r, delo, eeta, eta, etasq,
 	perigee, psisq, tsi, qoms24, s4, pinvsq, temp, tempa, temp1,
-	temp2, temp3, temp4, temp5, temp6, bx, by, bz, cx, cy, cz;
-
-	static deep_arg_t deep_arg;
+	temp2, temp3, temp4, temp5, temp6;
 
 	/* Initialization */
 
-	if (isFlagClear(SDP4_INITIALIZED_FLAG))
+	if (isFlagClear(p, SDP4_INITIALIZED_FLAG))
 	{
-		SetFlag(SDP4_INITIALIZED_FLAG);
+		SetFlag(p, SDP4_INITIALIZED_FLAG);
 
 		/* Recover original mean motion (xnodp) and   */
 		/* semimajor axis (aodp) from input elements. */
 
 		a1=pow(xke/tle->xno,tothrd);
-		deep_arg.cosio=cos(tle->xincl);
-		deep_arg.theta2=deep_arg.cosio*deep_arg.cosio;
-		x3thm1=3*deep_arg.theta2-1;
-		deep_arg.eosq=tle->eo*tle->eo;
-		deep_arg.betao2=1-deep_arg.eosq;
-		deep_arg.betao=sqrt(deep_arg.betao2);
-		del1=1.5*ck2*x3thm1/(a1*a1*deep_arg.betao*deep_arg.betao2);
+		deep_arg->cosio=cos(tle->xincl);
+		deep_arg->theta2=deep_arg->cosio*deep_arg->cosio;
+		sdp4->x3thm1=3*deep_arg->theta2-1;
+		deep_arg->eosq=tle->eo*tle->eo;
+		deep_arg->betao2=1-deep_arg->eosq;
+		deep_arg->betao=sqrt(deep_arg->betao2);
+		del1=1.5*ck2*sdp4->x3thm1/(a1*a1*deep_arg->betao*deep_arg->betao2);
 		ao=a1*(1-del1*(0.5*tothrd+del1*(1+134/81*del1)));
-		delo=1.5*ck2*x3thm1/(ao*ao*deep_arg.betao*deep_arg.betao2);
-		deep_arg.xnodp=tle->xno/(1+delo);
-		deep_arg.aodp=ao/(1-delo);
+		delo=1.5*ck2*sdp4->x3thm1/(ao*ao*deep_arg->betao*deep_arg->betao2);
+		deep_arg->xnodp=tle->xno/(1+delo);
+		deep_arg->aodp=ao/(1-delo);
 
 		/* For perigee below 156 km, the values */
 		/* of s and qoms2t are altered.         */
 
 		s4=s;
 		qoms24=qoms2t;
-		perigee=(deep_arg.aodp*(1-tle->eo)-ae)*xkmper;
+		perigee=(deep_arg->aodp*(1-tle->eo)-ae)*xkmper;
 
 		if (perigee<156.0)
 		{
@@ -1705,84 +1760,84 @@ void SDP4(double tsince, tle_t * tle, vector_t * pos, vector_t * vel)
 			s4=s4/xkmper+ae;
 		}
 
-		pinvsq=1/(deep_arg.aodp*deep_arg.aodp*deep_arg.betao2*deep_arg.betao2);
-		deep_arg.sing=sin(tle->omegao);
-		deep_arg.cosg=cos(tle->omegao);
-		tsi=1/(deep_arg.aodp-s4);
-		eta=deep_arg.aodp*tle->eo*tsi;
+		pinvsq=1/(deep_arg->aodp*deep_arg->aodp*deep_arg->betao2*deep_arg->betao2);
+		deep_arg->sing=sin(tle->omegao);
+		deep_arg->cosg=cos(tle->omegao);
+		tsi=1/(deep_arg->aodp-s4);
+		eta=deep_arg->aodp*tle->eo*tsi;
 		etasq=eta*eta;
 		eeta=tle->eo*eta;
 		psisq=fabs(1-etasq);
 		coef=qoms24*pow(tsi,4);
 		coef1=coef/pow(psisq,3.5);
-		c2=coef1*deep_arg.xnodp*(deep_arg.aodp*(1+1.5*etasq+eeta*(4+etasq))+0.75*ck2*tsi/psisq*x3thm1*(8+3*etasq*(8+etasq)));
-		c1=tle->bstar*c2;
-		deep_arg.sinio=sin(tle->xincl);
+		c2=coef1*deep_arg->xnodp*(deep_arg->aodp*(1+1.5*etasq+eeta*(4+etasq))+0.75*ck2*tsi/psisq*sdp4->x3thm1*(8+3*etasq*(8+etasq)));
+		sdp4->c1=tle->bstar*c2;
+		deep_arg->sinio=sin(tle->xincl);
 		a3ovk2=-xj3/ck2*pow(ae,3);
-		x1mth2=1-deep_arg.theta2;
-		c4=2*deep_arg.xnodp*coef1*deep_arg.aodp*deep_arg.betao2*(eta*(2+0.5*etasq)+tle->eo*(0.5+2*etasq)-2*ck2*tsi/(deep_arg.aodp*psisq)*(-3*x3thm1*(1-2*eeta+etasq*(1.5-0.5*eeta))+0.75*x1mth2*(2*etasq-eeta*(1+etasq))*cos(2*tle->omegao)));
-		theta4=deep_arg.theta2*deep_arg.theta2;
-		temp1=3*ck2*pinvsq*deep_arg.xnodp;
+		sdp4->x1mth2=1-deep_arg->theta2;
+		sdp4->c4=2*deep_arg->xnodp*coef1*deep_arg->aodp*deep_arg->betao2*(eta*(2+0.5*etasq)+tle->eo*(0.5+2*etasq)-2*ck2*tsi/(deep_arg->aodp*psisq)*(-3*sdp4->x3thm1*(1-2*eeta+etasq*(1.5-0.5*eeta))+0.75*sdp4->x1mth2*(2*etasq-eeta*(1+etasq))*cos(2*tle->omegao)));
+		theta4=deep_arg->theta2*deep_arg->theta2;
+		temp1=3*ck2*pinvsq*deep_arg->xnodp;
 		temp2=temp1*ck2*pinvsq;
-		temp3=1.25*ck4*pinvsq*pinvsq*deep_arg.xnodp;
-		deep_arg.xmdot=deep_arg.xnodp+0.5*temp1*deep_arg.betao*x3thm1+0.0625*temp2*deep_arg.betao*(13-78*deep_arg.theta2+137*theta4);
-		x1m5th=1-5*deep_arg.theta2;
-		deep_arg.omgdot=-0.5*temp1*x1m5th+0.0625*temp2*(7-114*deep_arg.theta2+395*theta4)+temp3*(3-36*deep_arg.theta2+49*theta4);
-		xhdot1=-temp1*deep_arg.cosio;
-		deep_arg.xnodot=xhdot1+(0.5*temp2*(4-19*deep_arg.theta2)+2*temp3*(3-7*deep_arg.theta2))*deep_arg.cosio;
-		xnodcf=3.5*deep_arg.betao2*xhdot1*c1;
-		t2cof=1.5*c1;
-		xlcof=0.125*a3ovk2*deep_arg.sinio*(3+5*deep_arg.cosio)/(1+deep_arg.cosio);
-		aycof=0.25*a3ovk2*deep_arg.sinio;
-		x7thm1=7*deep_arg.theta2-1;
+		temp3=1.25*ck4*pinvsq*pinvsq*deep_arg->xnodp;
+		deep_arg->xmdot=deep_arg->xnodp+0.5*temp1*deep_arg->betao*sdp4->x3thm1+0.0625*temp2*deep_arg->betao*(13-78*deep_arg->theta2+137*theta4);
+		x1m5th=1-5*deep_arg->theta2;
+		deep_arg->omgdot=-0.5*temp1*x1m5th+0.0625*temp2*(7-114*deep_arg->theta2+395*theta4)+temp3*(3-36*deep_arg->theta2+49*theta4);
+		xhdot1=-temp1*deep_arg->cosio;
+		deep_arg->xnodot=xhdot1+(0.5*temp2*(4-19*deep_arg->theta2)+2*temp3*(3-7*deep_arg->theta2))*deep_arg->cosio;
+		sdp4->xnodcf=3.5*deep_arg->betao2*xhdot1*sdp4->c1;
+		sdp4->t2cof=1.5*sdp4->c1;
+		sdp4->xlcof=0.125*a3ovk2*deep_arg->sinio*(3+5*deep_arg->cosio)/(1+deep_arg->cosio);
+		sdp4->aycof=0.25*a3ovk2*deep_arg->sinio;
+		sdp4->x7thm1=7*deep_arg->theta2-1;
 
 		/* initialize Deep() */
 
-		Deep(dpinit,tle,&deep_arg);
+		Deep(p,dpinit,deep_arg);
 	}
 
 	/* Update for secular gravity and atmospheric drag */
-	xmdf=tle->xmo+deep_arg.xmdot*tsince;
-	deep_arg.omgadf=tle->omegao+deep_arg.omgdot*tsince;
-	xnoddf=tle->xnodeo+deep_arg.xnodot*tsince;
+	xmdf=tle->xmo+deep_arg->xmdot*tsince;
+	deep_arg->omgadf=tle->omegao+deep_arg->omgdot*tsince;
+	xnoddf=tle->xnodeo+deep_arg->xnodot*tsince;
 	tsq=tsince*tsince;
-	deep_arg.xnode=xnoddf+xnodcf*tsq;
-	tempa=1-c1*tsince;
-	tempe=tle->bstar*c4*tsince;
-	templ=t2cof*tsq;
-	deep_arg.xn=deep_arg.xnodp;
+	deep_arg->xnode=xnoddf+sdp4->xnodcf*tsq;
+	tempa=1-sdp4->c1*tsince;
+	tempe=tle->bstar*sdp4->c4*tsince;
+	templ=sdp4->t2cof*tsq;
+	deep_arg->xn=deep_arg->xnodp;
 
 	/* Update for deep-space secular effects */
-	deep_arg.xll=xmdf;
-	deep_arg.t=tsince;
+	deep_arg->xll=xmdf;
+	deep_arg->t=tsince;
 
-	Deep(dpsec, tle, &deep_arg);
+	Deep(p,dpsec,deep_arg);
 
-	xmdf=deep_arg.xll;
-	a=pow(xke/deep_arg.xn,tothrd)*tempa*tempa;
-	deep_arg.em=deep_arg.em-tempe;
-	xmam=xmdf+deep_arg.xnodp*templ;
+	xmdf=deep_arg->xll;
+	a=pow(xke/deep_arg->xn,tothrd)*tempa*tempa;
+	deep_arg->em=deep_arg->em-tempe;
+	xmam=xmdf+deep_arg->xnodp*templ;
 
 	/* Update for deep-space periodic effects */
-	deep_arg.xll=xmam;
+	deep_arg->xll=xmam;
 
-	Deep(dpper,tle,&deep_arg);
+	Deep(p,dpper,deep_arg);
 
-	xmam=deep_arg.xll;
-	xl=xmam+deep_arg.omgadf+deep_arg.xnode;
-	beta=sqrt(1-deep_arg.em*deep_arg.em);
-	deep_arg.xn=xke/pow(a,1.5);
+	xmam=deep_arg->xll;
+	xl=xmam+deep_arg->omgadf+deep_arg->xnode;
+	beta=sqrt(1-deep_arg->em*deep_arg->em);
+	deep_arg->xn=xke/pow(a,1.5);
 
 	/* Long period periodics */
-	axn=deep_arg.em*cos(deep_arg.omgadf);
+	axn=deep_arg->em*cos(deep_arg->omgadf);
 	temp=1/(a*beta*beta);
-	xll=temp*xlcof*axn;
-	aynl=temp*aycof;
+	xll=temp*sdp4->xlcof*axn;
+	aynl=temp*sdp4->aycof;
 	xlt=xl+xll;
-	ayn=deep_arg.em*sin(deep_arg.omgadf)+aynl;
+	ayn=deep_arg->em*sin(deep_arg->omgadf)+aynl;
 
 	/* Solve Kepler's Equation */
-	capu=FMod2p(xlt-deep_arg.xnode);
+	capu=FMod2p(xlt-deep_arg->xnode);
 	temp2=capu;
 	i=0;
 
@@ -1828,12 +1883,12 @@ void SDP4(double tsince, tle_t * tle, vector_t * pos, vector_t * vel)
 	temp2=temp1*temp;
 
 	/* Update for short periodics */
-	rk=r*(1-1.5*temp2*betal*x3thm1)+0.5*temp1*x1mth2*cos2u;
-	uk=u-0.25*temp2*x7thm1*sin2u;
-	xnodek=deep_arg.xnode+1.5*temp2*deep_arg.cosio*sin2u;
-	xinck=deep_arg.xinc+1.5*temp2*deep_arg.cosio*deep_arg.sinio*cos2u;
-	rdotk=rdot-deep_arg.xn*temp1*x1mth2*sin2u;
-	rfdotk=rfdot+deep_arg.xn*temp1*(x1mth2*cos2u+1.5*x3thm1);
+	rk=r*(1-1.5*temp2*betal*sdp4->x3thm1)+0.5*temp1*sdp4->x1mth2*cos2u;
+	uk=u-0.25*temp2*sdp4->x7thm1*sin2u;
+	xnodek=deep_arg->xnode+1.5*temp2*deep_arg->cosio*sin2u;
+	xinck=deep_arg->xinc+1.5*temp2*deep_arg->cosio*deep_arg->sinio*cos2u;
+	rdotk=rdot-deep_arg->xn*temp1*sdp4->x1mth2*sin2u;
+	rfdotk=rfdot+deep_arg->xn*temp1*(sdp4->x1mth2*cos2u+1.5*sdp4->x3thm1);
 
 	/* Orientation vectors */
 	sinuk=sin(uk);
@@ -1859,30 +1914,15 @@ void SDP4(double tsince, tle_t * tle, vector_t * pos, vector_t * vel)
 	vel->y=rdotk*uy+rfdotk*vy;
 	vel->z=rdotk*uz+rfdotk*vz;
 
-	/* Calculations for squint angle begin here... */
-
-	if (calc_squint)
-	{
-		bx=cos(alat)*cos(alon+deep_arg.omgadf);
-		by=cos(alat)*sin(alon+deep_arg.omgadf);
-		bz=sin(alat);
-		cx=bx;
-		cy=by*cos(xinck)-bz*sin(xinck);
-		cz=by*sin(xinck)+bz*cos(xinck);
-		ax=cx*cos(xnodek)-cy*sin(xnodek);
-		ay=cx*sin(xnodek)+cy*cos(xnodek);
-		az=cz;
-	}
-
 	/* Phase in radians */
-	phase=xlt-deep_arg.xnode-deep_arg.omgadf+twopi;
+	p->phase=xlt-deep_arg->xnode-deep_arg->omgadf+twopi;
 
-	if (phase<0.0)
+	if (p->phase<0.0)
 	{
-		phase+=twopi;
+		p->phase+=twopi;
 	}
 
-	phase=FMod2p(phase);
+	p->phase=FMod2p(p->phase);
 }
 
 void Calculate_User_PosVel(double time, geodetic_t *geodetic, vector_t *obs_pos, vector_t *obs_vel)
@@ -1973,12 +2013,6 @@ void Calculate_Obs(double time, vector_t *pos, vector_t *vel, geodetic_t *geodet
 	range.y=pos->y-obs_pos.y;
 	range.z=pos->z-obs_pos.z;
 
-	/* Save these values globally for calculating squint angles later... */
-
-	rx=range.x;
-	ry=range.y;
-	rz=range.z;
-
 	rgvel.x=vel->x-obs_vel.x;
 	rgvel.y=vel->y-obs_vel.y;
 	rgvel.z=vel->z-obs_vel.z;
@@ -2025,16 +2059,6 @@ void Calculate_Obs(double time, vector_t *pos, vector_t *vel, geodetic_t *geodet
 	obs_set->y=el;
 
 	/**** End bypass ****/
-
-	if (obs_set->y>=0.0)
-	{
-		SetFlag(VISIBLE_FLAG);
-	}
-	else
-	{
-		obs_set->y=el;  /* Reset to true elevation */
-		ClearFlag(VISIBLE_FLAG);
-	}
 }
 
 void Calculate_RADec(double time, vector_t *pos, vector_t *vel, geodetic_t *geodetic, vector_t *obs_set)
@@ -2216,31 +2240,31 @@ char KepCheck(char *line1, char *line2)
 	return (x ? 0 : 1);
 }
 
-void InternalUpdate(int x)
+void InternalUpdate(struct sat_st *sat)
 {
 	/* Updates data in TLE structure based on
 	   line1 and line2 stored in structure. */
 
 	double tempnum;
 
-	strncpy(sat.designator,SubString(sat.line1,9,16),8);
-	sat.designator[9]=0;
-	sat.catnum=atol(SubString(sat.line1,2,6));
-	sat.year=atoi(SubString(sat.line1,18,19));
-	sat.refepoch=atof(SubString(sat.line1,20,31));
-	tempnum=1.0e-5*atof(SubString(sat.line1,44,49));
-	sat.nddot6=tempnum/pow(10.0,(sat.line1[51]-'0'));
-	tempnum=1.0e-5*atof(SubString(sat.line1,53,58));
-	sat.bstar=tempnum/pow(10.0,(sat.line1[60]-'0'));
-	sat.setnum=atol(SubString(sat.line1,64,67));
-	sat.incl=atof(SubString(sat.line2,8,15));
-	sat.raan=atof(SubString(sat.line2,17,24));
-	sat.eccn=1.0e-07*atof(SubString(sat.line2,26,32));
-	sat.argper=atof(SubString(sat.line2,34,41));
-	sat.meanan=atof(SubString(sat.line2,43,50));
-	sat.meanmo=atof(SubString(sat.line2,52,62));
-	sat.drag=atof(SubString(sat.line1,33,42));
-	sat.orbitnum=atof(SubString(sat.line2,63,67));
+	strncpy(sat->designator,SubString(sat->line1,9,16),8);
+	sat->designator[9]=0;
+	sat->catnum=atol(SubString(sat->line1,2,6));
+	sat->year=atoi(SubString(sat->line1,18,19));
+	sat->refepoch=atof(SubString(sat->line1,20,31));
+	tempnum=1.0e-5*atof(SubString(sat->line1,44,49));
+	sat->nddot6=tempnum/pow(10.0,(sat->line1[51]-'0'));
+	tempnum=1.0e-5*atof(SubString(sat->line1,53,58));
+	sat->bstar=tempnum/pow(10.0,(sat->line1[60]-'0'));
+	sat->setnum=atol(SubString(sat->line1,64,67));
+	sat->incl=atof(SubString(sat->line2,8,15));
+	sat->raan=atof(SubString(sat->line2,17,24));
+	sat->eccn=1.0e-07*atof(SubString(sat->line2,26,32));
+	sat->argper=atof(SubString(sat->line2,34,41));
+	sat->meanan=atof(SubString(sat->line2,43,50));
+	sat->meanmo=atof(SubString(sat->line2,52,62));
+	sat->drag=atof(SubString(sat->line1,33,42));
+	sat->orbitnum=atof(SubString(sat->line2,63,67));
 }
 
 char *noradEvalue(double value)
@@ -2437,65 +2461,65 @@ double ReadBearing(char *input)
 	return bearing;
 }
 
-char ReadTLE(char *line0, char *line1, char *line2)
+char ReadTLE(predict_t *p, char *line0, char *line1, char *line2)
 {
 	int la, lb, lc;
 	char error_flags,a,b,c,d;
 
-	la = strnlen(line0,sizeof(sat.name));
-	lb = strnlen(line1,sizeof(sat.line1));
-	lc = strnlen(line2,sizeof(sat.line2));
-	a = ((la == 0) || (la >= sizeof(sat.name)));
-	b = ((lb == 0) || (lb >= sizeof(sat.line1)));
-	c = ((lc == 0) || (lc >= sizeof(sat.line2)));
+	la = strnlen(line0,sizeof(p->sat.name));
+	lb = strnlen(line1,sizeof(p->sat.line1));
+	lc = strnlen(line2,sizeof(p->sat.line2));
+	a = ((la == 0) || (la >= sizeof(p->sat.name)));
+	b = ((lb == 0) || (lb >= sizeof(p->sat.line1)));
+	c = ((lc == 0) || (lc >= sizeof(p->sat.line2)));
 	d = !KepCheck(line1, line2);
 	error_flags = (a << 3) | (b << 2) | (c << 1) | (d << 0);
 
 	if (error_flags == 0)
 	{
-		strncpy(sat.name,line0,sizeof(sat.name)-1);
-		strncpy(sat.line1,line1,sizeof(sat.line1)-1);
-		strncpy(sat.line2,line2,sizeof(sat.line2)-1);
-		InternalUpdate(0);
+		strncpy(p->sat.name,line0,sizeof(p->sat.name)-1);
+		strncpy(p->sat.line1,line1,sizeof(p->sat.line1)-1);
+		strncpy(p->sat.line2,line2,sizeof(p->sat.line2)-1);
+		InternalUpdate(&p->sat);
 	}
 
 	return error_flags;
 }
 
-char ReadQTH(double lat, double lon, long alt)
+char ReadQTH(predict_t *p, double lat, double lon, long alt)
 {
 	//TODO: add sanity checks
-	qth.stnlat = lat;
-	qth.stnlong = lon;
-	qth.stnalt = alt;
+	p->qth.stnlat = lat;
+	p->qth.stnlong = lon;
+	p->qth.stnalt = alt;
 
-	obs_geodetic.lat=qth.stnlat*deg2rad;
-	obs_geodetic.lon=-qth.stnlong*deg2rad;
-	obs_geodetic.alt=((double)qth.stnalt)/1000.0;
-	obs_geodetic.theta=0.0;
+	p->obs_geodetic.lat=p->qth.stnlat*deg2rad;
+	p->obs_geodetic.lon=-p->qth.stnlong*deg2rad;
+	p->obs_geodetic.alt=((double)p->qth.stnalt)/1000.0;
+	p->obs_geodetic.theta=0.0;
 
 	return 0;
 }
 
 
-char ReadQTHFile()
+char ReadQTHFile(predict_t *p)
 {
 	FILE *fd;
 
 	fd=fopen(qthfile,"r");
 	if (fd!=NULL)
 	{
-		fgets(qth.callsign,16,fd);
-		qth.callsign[strlen(qth.callsign)-1]=0;
-		fscanf(fd,"%lf", &qth.stnlat);
-		fscanf(fd,"%lf", &qth.stnlong);
-		fscanf(fd,"%d", &qth.stnalt);
+		fgets(p->qth.callsign,16,fd);
+		p->qth.callsign[strlen(p->qth.callsign)-1]=0;
+		fscanf(fd,"%lf", &p->qth.stnlat);
+		fscanf(fd,"%lf", &p->qth.stnlong);
+		fscanf(fd,"%d", &p->qth.stnalt);
 		fclose(fd);
 
-		obs_geodetic.lat=qth.stnlat*deg2rad;
-		obs_geodetic.lon=-qth.stnlong*deg2rad;
-		obs_geodetic.alt=((double)qth.stnalt)/1000.0;
-		obs_geodetic.theta=0.0;
+		p->obs_geodetic.lat=p->qth.stnlat*deg2rad;
+		p->obs_geodetic.lon=-p->qth.stnlong*deg2rad;
+		p->obs_geodetic.alt=((double)p->qth.stnalt)/1000.0;
+		p->obs_geodetic.theta=0.0;
 		return 0;
 	}
 	return -1;
@@ -2904,41 +2928,30 @@ void FindSun(double daynum)
 	sun_dec=Degrees(solar_rad.y);
 }
 
-void PreCalc(int x)
+void PreCalc(predict_t *p)
 {
 	/* This function copies TLE data from PREDICT's sat structure
 	   to the SGP4/SDP4's single dimensioned tle structure, and
 	   prepares the tracking code for the update. */
 
-	strcpy(tle.sat_name,sat.name);
-	strcpy(tle.idesg,sat.designator);
-	tle.catnr=sat.catnum;
-	tle.epoch=(1000.0*(double)sat.year)+sat.refepoch;
-	tle.xndt2o=sat.drag;
-	tle.xndd6o=sat.nddot6;
-	tle.bstar=sat.bstar;
-	tle.xincl=sat.incl;
-	tle.xnodeo=sat.raan;
-	tle.eo=sat.eccn;
-	tle.omegao=sat.argper;
-	tle.xmo=sat.meanan;
-	tle.xno=sat.meanmo;
-	tle.revnum=sat.orbitnum;
-
-	if (sat_db.squintflag)
-	{
-		calc_squint=1;
-		alat=deg2rad*sat_db.alat;
-		alon=deg2rad*sat_db.alon;
-	}
-	else
-	{
-		calc_squint=0;
-	}
+	strcpy(p->tle.sat_name,p->sat.name);
+	strcpy(p->tle.idesg,p->sat.designator);
+	p->tle.catnr=p->sat.catnum;
+	p->tle.epoch=(1000.0*(double)p->sat.year)+p->sat.refepoch;
+	p->tle.xndt2o=p->sat.drag;
+	p->tle.xndd6o=p->sat.nddot6;
+	p->tle.bstar=p->sat.bstar;
+	p->tle.xincl=p->sat.incl;
+	p->tle.xnodeo=p->sat.raan;
+	p->tle.eo=p->sat.eccn;
+	p->tle.omegao=p->sat.argper;
+	p->tle.xmo=p->sat.meanan;
+	p->tle.xno=p->sat.meanmo;
+	p->tle.revnum=p->sat.orbitnum;
 
 	/* Clear all flags */
 
-	ClearFlag(ALL_FLAGS);
+	ClearFlag(p, ALL_FLAGS);
 
 	/* Select ephemeris type.  This function will set or clear the
 	   DEEP_SPACE_EPHEM_FLAG depending on the TLE parameters of the
@@ -2946,10 +2959,10 @@ void PreCalc(int x)
 	   ephemeris functions SGP4 or SDP4, so this function must
 	   be called each time a new tle set is used. */
 
-	select_ephemeris(&tle);
+	select_ephemeris(p);
 }
 
-void Calc()
+void Calc(predict_t *p)
 {
 	/* This is the stuff we need to do repetitively while tracking. */
 
@@ -2979,35 +2992,35 @@ void Calc()
 	/* Satellite's predicted geodetic position */
 	geodetic_t sat_geodetic;
 
-	jul_utc=daynum+2444238.5;
+	p->jul_utc=p->daynum+2444238.5;
 
 	/* Convert satellite's epoch time to Julian  */
 	/* and calculate time since epoch in minutes */
 
-	jul_epoch=Julian_Date_of_Epoch(tle.epoch);
-	tsince=(jul_utc-jul_epoch)*xmnpda;
-	age=jul_utc-jul_epoch;
+	p->jul_epoch=Julian_Date_of_Epoch(p->tle.epoch);
+	p->tsince=(p->jul_utc-p->jul_epoch)*xmnpda;
+	p->age=p->jul_utc-p->jul_epoch;
 
 	/* Copy the ephemeris type in use to ephem string. */
 
-		if (isFlagSet(DEEP_SPACE_EPHEM_FLAG))
+		if (isFlagSet(p, DEEP_SPACE_EPHEM_FLAG))
 		{
-			strcpy(ephem,"SDP4");
+			strcpy(p->ephem,"SDP4");
 		}
 		else
 		{
-			strcpy(ephem,"SGP4");
+			strcpy(p->ephem,"SGP4");
 		}
 
 	/* Call NORAD routines according to deep-space flag. */
 
-	if (isFlagSet(DEEP_SPACE_EPHEM_FLAG))
+	if (isFlagSet(p, DEEP_SPACE_EPHEM_FLAG))
 	{
-		SDP4(tsince, &tle, &pos, &vel);
+		SDP4(p, p->tsince, &pos, &vel);
 	}
 	else
 	{
-		SGP4(tsince, &tle, &pos, &vel);
+		SGP4(p, p->tsince, &pos, &vel);
 	}
 
 	/* Scale position and velocity vectors to km and km/sec */
@@ -3017,134 +3030,127 @@ void Calc()
 	/* Calculate velocity of satellite */
 
 	Magnitude(&vel);
-	sat_vel=vel.w;
-	eci_x = pos.x;
-	eci_y = pos.y;
-	eci_z = pos.z;
-	eci_vx = vel.x;
-	eci_vy = vel.y;
-	eci_vz = vel.z;
+	p->sat_vel=vel.w;
+	p->eci_x = pos.x;
+	p->eci_y = pos.y;
+	p->eci_z = pos.z;
+	p->eci_vx = vel.x;
+	p->eci_vy = vel.y;
+	p->eci_vz = vel.z;
 
 	/** All angles in rads. Distance in km. Velocity in km/s **/
 	/* Calculate satellite Azi, Ele, Range and Range-rate */
 
-	Calculate_Obs(jul_utc, &pos, &vel, &obs_geodetic, &obs_set);
+	Calculate_Obs(p->jul_utc, &pos, &vel, &p->obs_geodetic, &obs_set);
 
-	Calculate_User_PosVel(jul_utc, &obs_geodetic, &obs_pos, &obs_vel);
+	Calculate_User_PosVel(p->jul_utc, &p->obs_geodetic, &obs_pos, &obs_vel);
 
-	eci_obs_x = obs_pos.x;
-	eci_obs_y = obs_pos.y;
-	eci_obs_z = obs_pos.z;
+	p->eci_obs_x = obs_pos.x;
+	p->eci_obs_y = obs_pos.y;
+	p->eci_obs_z = obs_pos.z;
 
 	/* Calculate satellite Lat North, Lon East and Alt. */
 
-	Calculate_LatLonAlt(jul_utc, &pos, &sat_geodetic);
-
-	/* Calculate squint angle */
-
-	if (calc_squint)
-	{
-		squint=(acos(-(ax*rx+ay*ry+az*rz)/obs_set.z))/deg2rad;
-	}
+	Calculate_LatLonAlt(p->jul_utc, &pos, &sat_geodetic);
 
 	/* Calculate solar position and satellite eclipse depth. */
 	/* Also set or clear the satellite eclipsed flag accordingly. */
 
-	Calculate_Solar_Position(jul_utc, &solar_vector);
+	Calculate_Solar_Position(p->jul_utc, &solar_vector);
 
-	eci_sun_x = solar_vector.x;
-	eci_sun_y = solar_vector.y;
-	eci_sun_z = solar_vector.z;
+	p->eci_sun_x = solar_vector.x;
+	p->eci_sun_y = solar_vector.y;
+	p->eci_sun_z = solar_vector.z;
 
 	Cross(&pos,&vel,&orbit_n_vector);
 
-	beta_angle = (pio2-Angle(&orbit_n_vector,&solar_vector))/deg2rad;
+	p->beta_angle = (pio2-Angle(&orbit_n_vector,&solar_vector))/deg2rad;
 
-	Calculate_Obs(jul_utc, &solar_vector, &zero_vector, &obs_geodetic, &solar_set);
+	Calculate_Obs(p->jul_utc, &solar_vector, &zero_vector, &p->obs_geodetic, &solar_set);
 
-	if (Sat_Eclipsed(&pos, &solar_vector, &eclipse_depth))
+	if (Sat_Eclipsed(&pos, &solar_vector, &p->eclipse_depth))
 	{
-		SetFlag(SAT_ECLIPSED_FLAG);
+		SetFlag(p, SAT_ECLIPSED_FLAG);
 	}
 	else
 	{
-		ClearFlag(SAT_ECLIPSED_FLAG);
+		ClearFlag(p, SAT_ECLIPSED_FLAG);
 	}
 
-	if (isFlagSet(SAT_ECLIPSED_FLAG))
+	if (isFlagSet(p, SAT_ECLIPSED_FLAG))
 	{
-		sat_sun_status=0;  /* Eclipse */
+		p->sat_sun_status=0;  /* Eclipse */
 	}
 	else
 	{
-		sat_sun_status=1; /* In sunlight */
+		p->sat_sun_status=1; /* In sunlight */
 	}
 
 	/* Convert satellite and solar data */
-	sat_azi=Degrees(obs_set.x);
-	sat_ele=Degrees(obs_set.y);
-	sat_range=obs_set.z;
-	sat_range_rate=obs_set.w;
-	sat_lat=Degrees(sat_geodetic.lat);
-	sat_lon=Degrees(sat_geodetic.lon);
-	sat_alt=sat_geodetic.alt;
-
-	fk=12756.33*acos(xkmper/(xkmper+sat_alt));
-	fm=fk/1.609344;
-
-	rv=(long)floor((tle.xno*xmnpda/twopi+age*tle.bstar*ae)*age+tle.xmo/twopi)+tle.revnum;
-
-	sun_azi=Degrees(solar_set.x);
-	sun_ele=Degrees(solar_set.y);
-
-	irk=(long)rint(sat_range);
-	isplat=(int)rint(sat_lat);
-	isplong=(int)rint(360.0-sat_lon);
-	iaz=(int)rint(sat_azi);
-	iel=(int)rint(sat_ele);
-	ma256=(int)rint(256.0*(phase/twopi));
-
-	if (sat_sun_status)
+	p->sat_azi=Degrees(obs_set.x);
+	p->sat_ele=Degrees(obs_set.y);
+	p->sat_range=obs_set.z;
+	p->sat_range_rate=obs_set.w;
+	p->sat_lat=Degrees(sat_geodetic.lat);
+	p->sat_lon=Degrees(sat_geodetic.lon);
+	p->sat_alt=sat_geodetic.alt;
+
+	p->fk=12756.33*acos(xkmper/(xkmper+p->sat_alt));
+	p->fm=p->fk/1.609344;
+
+	p->rv=(long)floor((p->tle.xno*xmnpda/twopi+p->age*p->tle.bstar*ae)*p->age+p->tle.xmo/twopi)+p->tle.revnum;
+
+	p->sun_azi=Degrees(solar_set.x);
+	p->sun_ele=Degrees(solar_set.y);
+
+	p->irk=(long)rint(p->sat_range);
+	p->isplat=(int)rint(p->sat_lat);
+	p->isplong=(int)rint(360.0-p->sat_lon);
+	p->iaz=(int)rint(p->sat_azi);
+	p->iel=(int)rint(p->sat_ele);
+	p->ma256=(int)rint(256.0*(p->phase/twopi));
+
+	if (p->sat_sun_status)
 	{
-		if (sun_ele<=-12.0 && rint(sat_ele)>=0.0)
+		if (p->sun_ele<=-12.0 && rint(p->sat_ele)>=0.0)
 		{
-			findsun='+';
+			p->findsun='+';
 		}
 		else
 		{
-			findsun='*';
+			p->findsun='*';
 		}
 	}
 	else
 	{
-		findsun=' ';
+		p->findsun=' ';
 	}
 }
 
-char AosHappens(int x)
+char AosHappens(predict_t *p)
 {
-	/* This function returns a 1 if the satellite pointed to by
-	   "x" can ever rise above the horizon of the ground station. */
+	/* This function returns a 1 if the satellite in "p" can
+	   ever rise above the horizon of the ground station. */
 
 	double lin, sma, apogee;
 
-	if (sat.meanmo==0.0)
+	if (p->sat.meanmo==0.0)
 	{
 		return 0;
 	}
 	else
 	{
-		lin=sat.incl;
+		lin=p->sat.incl;
 
 		if (lin>=90.0)
 		{
 			lin=180.0-lin;
 		}
 
-		sma=331.25*exp(log(1440.0/sat.meanmo)*(2.0/3.0));
-		apogee=sma*(1.0+sat.eccn)-xkmper;
+		sma=331.25*exp(log(1440.0/p->sat.meanmo)*(2.0/3.0));
+		apogee=sma*(1.0+p->sat.eccn)-xkmper;
 
-		if ((acos(xkmper/(apogee+xkmper))+(lin*deg2rad)) > fabs(qth.stnlat*deg2rad))
+		if ((acos(xkmper/(apogee+xkmper))+(lin*deg2rad)) > fabs(p->qth.stnlat*deg2rad))
 		{
 			return 1;
 		}
@@ -3155,10 +3161,10 @@ char AosHappens(int x)
 	}
 }
 
-char Decayed(int x, double time)
+char Decayed(predict_t *p, double time)
 {
 	/* This function returns a 1 if it appears that the
-	   satellite pointed to by 'x' has decayed at the
+	   satellite in 'p' has decayed at the
 	   time of 'time'.  If 'time' is 0.0, then the
 	   current date/time is used. */
 
@@ -3169,9 +3175,9 @@ char Decayed(int x, double time)
 		time=CurrentDaynum();
 	}
 
-	satepoch=DayNum(1,0,sat.year)+sat.refepoch;
+	satepoch=DayNum(1,0,p->sat.year)+p->sat.refepoch;
 
-	if (satepoch+((16.666666-sat.meanmo)/(10.0*fabs(sat.drag))) < time)
+	if (satepoch+((16.666666-p->sat.meanmo)/(10.0*fabs(p->sat.drag))) < time)
 	{
 		return 1;
 	}
@@ -3181,12 +3187,12 @@ char Decayed(int x, double time)
 	}
 }
 
-char Geostationary(int x)
+char Geostationary(predict_t *p)
 {
-	/* This function returns a 1 if the satellite pointed
-	   to by "x" appears to be in a geostationary orbit */
+	/* This function returns a 1 if the satellite in "p"
+	   appears to be in a geostationary orbit */
 
-	if (fabs(sat.meanmo-1.0027)<0.0002)
+	if (fabs(p->sat.meanmo-1.0027)<0.0002)
 	{
 		return 1;
 	}
@@ -3196,98 +3202,98 @@ char Geostationary(int x)
 	}
 }
 
-double FindAOS()
+double FindAOS(predict_t *p)
 {
 	/* This function finds and returns the time of AOS (aostime). */
 
 	int iterations = 0;
-	aostime=0.0;
+	p->aostime=0.0;
 
-	if (AosHappens(indx) && Geostationary(indx)==0 && Decayed(indx,daynum)==0)
+	if (AosHappens(p) && Geostationary(p)==0 && Decayed(p,p->daynum)==0)
 	{
-		Calc();
+		Calc(p);
 
 		/* Get the satellite in range */
 
-		while (sat_ele<-1.0)
+		while (p->sat_ele<-1.0)
 		{
-			daynum-=0.00035*(sat_ele*((sat_alt/8400.0)+0.46)-2.0);
-			Calc();
+			p->daynum-=0.00035*(p->sat_ele*((p->sat_alt/8400.0)+0.46)-2.0);
+			Calc(p);
 		}
 
 		/* Find AOS */
 
 		// TODO: FIX: We use a max on iterations here to avoid getting stuck when we no longer have an aos
-		while (aostime==0.0 && iterations < 100000)
+		while (p->aostime==0.0 && iterations < 100000)
 		{
-			if (fabs(sat_ele)<0.03)
+			if (fabs(p->sat_ele)<0.03)
 			{
-				aostime=daynum;
+				p->aostime=p->daynum;
 			}
 			else
 			{
-				daynum-=sat_ele*sqrt(sat_alt)/530000.0;
-				Calc();
+				p->daynum-=p->sat_ele*sqrt(p->sat_alt)/530000.0;
+				Calc(p);
 			}
 			iterations += 1;
 		}
 	}
 
-	return aostime;
+	return p->aostime;
 }
 
-double FindLOS()
+double FindLOS(predict_t *p)
 {
-	lostime=0.0;
+	p->lostime=0.0;
 
-	if (Geostationary(indx)==0 && AosHappens(indx)==1 && Decayed(indx,daynum)==0)
+	if (Geostationary(p)==0 && AosHappens(p)==1 && Decayed(p,p->daynum)==0)
 	{
-		Calc();
+		Calc(p);
 
 		do
 		{
-			daynum+=sat_ele*sqrt(sat_alt)/502500.0;
-			Calc();
+			p->daynum+=p->sat_ele*sqrt(p->sat_alt)/502500.0;
+			Calc(p);
 
-			if (fabs(sat_ele) < 0.03)
+			if (fabs(p->sat_ele) < 0.03)
 			{
-				lostime=daynum;
+				p->lostime=p->daynum;
 			}
 
-		} while (lostime==0.0);
+		} while (p->lostime==0.0);
 	}
 
-	return lostime;
+	return p->lostime;
 }
 
-double FindLOS2()
+double FindLOS2(predict_t *p)
 {
 	/* This function steps through the pass to find LOS.
-	   FindLOS() is called to "fine tune" and return the result. */
+	   FindLOS(p) is called to "fine tune" and return the result. */
 
 	do
 	{
-		daynum+=cos((sat_ele-1.0)*deg2rad)*sqrt(sat_alt)/25000.0;
-		Calc();
+		p->daynum+=cos((p->sat_ele-1.0)*deg2rad)*sqrt(p->sat_alt)/25000.0;
+		Calc(p);
 
-	} while (sat_ele>=0.0);
+	} while (p->sat_ele>=0.0);
 
-	return(FindLOS());
+	return(FindLOS(p));
 }
 
-double NextAOS()
+double NextAOS(predict_t *p)
 {
 	/* This function finds and returns the time of the next
 	   AOS for a satellite that is currently in range. */
 
-	aostime=0.0;
+	p->aostime=0.0;
 
-	if (AosHappens(indx) && Geostationary(indx)==0 && Decayed(indx,daynum)==0)
+	if (AosHappens(p) && Geostationary(p)==0 && Decayed(p,p->daynum)==0)
 	{
-		daynum=FindLOS2()+0.014;  /* Move to LOS + 20 minutes */
+		p->daynum=FindLOS2(p)+0.014;  /* Move to LOS + 20 minutes */
 	}
 
-	return (FindAOS());
+	return (FindAOS(p));
 }
 
 // This function was extracted from SingleTrack and shows a number of derived parameters related
@@ -3297,31 +3303,31 @@ double NextAOS()
 //       is convoluted and it's never come up in our usage.  FYI, the 'Edit Transponder Database'
 //       menu option is still marked "coming soon" :).  We'll add it back if there's demand.
 //
-int MakeObservation(double obs_time, struct observation * obs) {
+int MakeObservation(predict_t *p, double obs_time, struct observation * obs) {
     char geostationary=0, aoshappens=0, decayed=0, visibility=0, sunlit;
     double doppler100=0.0, delay;
 
-    PreCalc(0);
-    indx=0;
-
     if (sat_db.transponders>0)
     {
+        // We may be running without the GIL
+        PyGILState_STATE gil = PyGILState_Ensure();
         PyErr_SetString(PredictException, "pypredict does not support transponder definition.");
+        PyGILState_Release(gil);
         return -1;
     }
 
-    daynum=obs_time;
-    aoshappens=AosHappens(indx);
-    geostationary=Geostationary(indx);
-    decayed=Decayed(indx,0.0);
+    p->daynum=obs_time;
+    aoshappens=AosHappens(p);
+    geostationary=Geostationary(p);
+    decayed=Decayed(p,0.0);
 
     //Calcs
-    Calc();
-    fk=12756.33*acos(xkmper/(xkmper+sat_alt));
+    Calc(p);
+    p->fk=12756.33*acos(xkmper/(xkmper+p->sat_alt));
 
-    if (sat_sun_status)
+    if (p->sat_sun_status)
     {
-        if (sun_ele<=-12.0 && sat_ele>=0.0) {
+        if (p->sun_ele<=-12.0 && p->sat_ele>=0.0) {
             visibility='V';
         } else {
             visibility='D';
@@ -3330,13 +3336,10 @@ int MakeObservation(double obs_time, struct observation * obs) {
         visibility='N';
     }
     // gathering power seems much more useful than naked-eye visibility
-    sunlit = sat_sun_status;
-
-    doppler100=-100.0e06*((sat_range_rate*1000.0)/299792458.0);
-    delay=1000.0*((1000.0*sat_range)/299792458.0);
+    sunlit = p->sat_sun_status;
 
-    //TODO: Seems like FindSun(daynum) should go in here
-    FindMoon(daynum);
+    doppler100=-100.0e06*((p->sat_range_rate*1000.0)/299792458.0);
+    delay=1000.0*((1000.0*p->sat_range)/299792458.0);
 
     //printw(5+tshift,1,"Satellite     Direction     Velocity     Footprint    Altitude     Slant Range");
     //printw(6+tshift,1,"---------     ---------     --------     ---------    --------     -----------");
@@ -3345,40 +3348,40 @@ int MakeObservation(double obs_time, struct observation * obs) {
     //printw(16+bshift,1,"Eclipse Depth   Orbital Phase   Orbital Model   Squint Angle      AutoTracking");
     //printw(17+bshift,1,"-------------   -------------   -------------   ------------      ------------");
 
-    obs->norad_id = sat.catnum;
-    strncpy(&(obs->name), &(sat.name), sizeof(obs->name));
-    obs->epoch = (daynum+3651.0)*(86400.0); //See daynum=((start/86400.0)-3651.0);
-    obs->latitude = sat_lat;
-    obs->longitude = sat_lon;
-    obs->azimuth = sat_azi;
-    obs->elevation = sat_ele;
-    obs->orbital_velocity = 3600.0*sat_vel;
-    obs->footprint = fk;
-    obs->altitude = sat_alt;
-    obs->slant_range = sat_range;
-    obs->eclipse_depth = eclipse_depth/deg2rad;
-    obs->orbital_phase = 256.0*(phase/twopi);
-    strncpy(&(obs->orbital_model), &(ephem), sizeof(obs->orbital_model));
+    obs->norad_id = p->sat.catnum;
+    strncpy(&(obs->name), &(p->sat.name), sizeof(obs->name));
+    obs->epoch = (p->daynum+3651.0)*(86400.0); //See daynum=((start/86400.0)-3651.0);
+    obs->latitude = p->sat_lat;
+    obs->longitude = p->sat_lon;
+    obs->azimuth = p->sat_azi;
+    obs->elevation = p->sat_ele;
+    obs->orbital_velocity = 3600.0*p->sat_vel;
+    obs->footprint = p->fk;
+    obs->altitude = p->sat_alt;
+    obs->slant_range = p->sat_range;
+    obs->eclipse_depth = p->eclipse_depth/deg2rad;
+    obs->orbital_phase = 256.0*(p->phase/twopi);
+    strncpy(&(obs->orbital_model), &(p->ephem), sizeof(obs->orbital_model));
     obs->visibility = visibility;
     obs->sunlit = sunlit;
-    obs->orbit = rv;
+    obs->orbit = p->rv;
     obs->geostationary = geostationary;
     obs->has_aos = aoshappens;
     obs->decayed = decayed;
     obs->doppler = doppler100;
-    obs->eci_x = eci_x;
-    obs->eci_y = eci_y;
-    obs->eci_z = eci_z;
-    obs->eci_vx = eci_vx;
-    obs->eci_vy = eci_vy;
-    obs->eci_vz = eci_vz;
-    obs->eci_sun_x = eci_sun_x;
-    obs->eci_sun_y = eci_sun_y;
-    obs->eci_sun_z = eci_sun_z;
-    obs->eci_obs_x = eci_obs_x;
-    obs->eci_obs_y = eci_obs_y;
-    obs->eci_obs_z = eci_obs_z;
-    obs->beta_angle = beta_angle;
+    obs->eci_x = p->eci_x;
+    obs->eci_y = p->eci_y;
+    obs->eci_z = p->eci_z;
+    obs->eci_vx = p->eci_vx;
+    obs->eci_vy = p->eci_vy;
+    obs->eci_vz = p->eci_vz;
+    obs->eci_sun_x = p->eci_sun_x;
+    obs->eci_sun_y = p->eci_sun_y;
+    obs->eci_sun_z = p->eci_sun_z;
+    obs->eci_obs_x = p->eci_obs_x;
+    obs->eci_obs_y = p->eci_obs_y;
+    obs->eci_obs_z = p->eci_obs_z;
+    obs->beta_angle = p->beta_angle;
     return 0;
 }
 
@@ -3459,29 +3462,49 @@ PyObject * PythonifyObservation(observation * obs) {
 	);
 }
 
-char load(PyObject *args)
+void InitChecksums()
 {
-	//TODO: Not threadsafe, detect and raise warning?
+	/* Set up translation table for computing TLE checksums */
+
 	int x;
-	char *env=NULL;
 
-	/* Set up translation table for computing TLE checksums */
 	for (x=0; x<=255; val[x]=0, x++);
 	for (x='0'; x<='9'; val[x]=x-'0', x++);
 
 	val['-']=1;
+}
+
+char LoadDefaultQTH(predict_t *p)
+{
+	/* Reads predict's default groundstation location into p */
+
+	char *env=NULL;
+
+	env=getenv("HOME");
+	sprintf(qthfile,"%s/.predict/predict.qth",env);
+	if (ReadQTHFile(p) != 0)
+	{
+		PyErr_SetString(PredictException, "QTH file could not be loaded.");
+		return -1;
+	}
+	return 0;
+}
+
+char load(predict_t *p, PyObject *args)
+{
+	/* Loads the TLE, time & QTH into p */
 
 	double epoch;
 	const char *tle0, *tle1, *tle2;
 
 	if (!PyArg_ParseTuple(args, "(sss)|d(ddi)",
-		&tle0, &tle1, &tle2, &epoch, &qth.stnlat, &qth.stnlong, &qth.stnalt))
+		&tle0, &tle1, &tle2, &epoch, &p->qth.stnlat, &p->qth.stnlong, &p->qth.stnalt))
 	{
 		// PyArg_ParseTuple will set appropriate exception string
 		return -1;
 	};
 
-	if (ReadTLE(tle0,tle1,tle2) != 0)
+	if (ReadTLE(p,tle0,tle1,tle2) != 0)
 	{
 		PyErr_SetString(PredictException, "Unable to process TLE");
 		return -1;
@@ -3490,46 +3513,217 @@ char load(PyObject *args)
 	// If time isn't set, use current time.
 	if (PyObject_Length(args) < 2)
 	{
-		daynum=CurrentDaynum();
+		p->daynum=CurrentDaynum();
 	}
 	else
 	{
-		daynum=((epoch/86400.0)-3651.0);
+		p->daynum=((epoch/86400.0)-3651.0);
 	}
 
 	// If we haven't already set groundstation location, use predict's default.
 	if (PyObject_Length(args) < 3)
 	{
-		FILE *fd;
-		env=getenv("HOME");
-		sprintf(qthfile,"%s/.predict/predict.qth",env);
-		fd=fopen(qthfile,"r");
-		if (fd!=NULL)
+		return LoadDefaultQTH(p);
+	}
+	return ReadQTH(p, p->qth.stnlat, p->qth.stnlong, p->qth.stnalt);
+}
+
+static int AddObservation(predict_t *p, observation **obs, int *nobs, int *size)
+{
+	/* Makes an observation at p->daynum and appends it to a growing array */
+
+	if (*nobs == *size)
+	{
+		observation *tmp;
+
+		*size = (*size == 0) ? 64 : 2*(*size);
+		tmp = (observation *) realloc(*obs, (*size)*sizeof(observation));
+		if (tmp == NULL)
 		{
-			fgets(qth.callsign,16,fd);
-			qth.callsign[strlen(qth.callsign)-1]=0;
-			fscanf(fd,"%lf", &qth.stnlat);
-			fscanf(fd,"%lf", &qth.stnlong);
-			fscanf(fd,"%d", &qth.stnalt);
-			fclose(fd);
-		} else {
-			PyErr_SetString(PredictException, "QTH file could not be loaded.");
-			return -1;
+			return -2;
 		}
+		*obs = tmp;
 	}
-	obs_geodetic.lat=qth.stnlat*deg2rad;
-	obs_geodetic.lon=-qth.stnlong*deg2rad;
-	obs_geodetic.alt=((double)qth.stnalt)/1000.0;
-	obs_geodetic.theta=0.0;
 
+	memset(&(*obs)[*nobs], 0, sizeof(observation));
+	if (MakeObservation(p, p->daynum, &(*obs)[*nobs]) != 0)
+	{
+		return -1;
+	}
+	(*nobs)++;
 	return 0;
 }
 
+static int SearchTransit(predict_t *p, observation **obs, int *nobs, char *errbuff, PyObject **exc)
+{
+	/* Finds the next transit starting at p->daynum for the satellite in p
+	   and fills obs with the observations along it.  This is all plain C
+	   so it can run without the GIL.  On failure, returns -1 with a message
+	   in errbuff and the exception to raise in exc (NULL if MakeObservation
+	   already set one). */
+
+	int lastel=0, size=0, err;
+	observation first = { 0 };
+
+	*exc = NULL;
+	Calc(p);
+	if (MakeObservation(p, p->daynum, &first) != 0)
+	{
+		// MakeObservation will set appropriate exception string
+		return -1;
+	}
+
+	if (!AosHappens(p))
+	{
+		sprintf(errbuff, "%lu does not rise above horizon. No AOS.\n", p->sat.catnum);
+		*exc = NoTransitException;
+		return -1;
+	}
+
+	if (Geostationary(p)!=0)
+	{
+		sprintf(errbuff, "%lu is geostationary.  Does not transit.\n", p->sat.catnum);
+		*exc = PredictException;
+		return -1;
+	}
+
+	if (Decayed(p,p->daynum)!=0)
+	{
+		sprintf(errbuff, "%lu has decayed. Cannot calculate transit.\n", p->sat.catnum);
+		*exc = PredictException;
+		return -1;
+	}
+
+	/* Make Predictions */
+	p->daynum=FindAOS(p);
+
+	if (p->daynum == 0)
+	{
+		sprintf(errbuff, "%lu no longer rises above horizon. No AOS.\n", p->sat.catnum);
+		*exc = NoTransitException;
+		return -1;
+	}
+
+	/* Construct the pass */
+	while (p->iel>=0)
+	{
+		err = AddObservation(p, obs, nobs, &size);
+		if (err != 0)
+		{
+			goto add_failed;
+		}
+		lastel=p->iel;
+		p->daynum+=cos((p->sat_ele-1.0)*deg2rad)*sqrt(p->sat_alt)/25000.0;
+		Calc(p);
+	}
+
+	if (lastel!=0)
+	{
+		p->daynum=FindLOS(p);
+		//TODO: FindLOS can fail.  Detect and log warning that transit end is approximate.
+		if (p->daynum > 0) {
+			Calc(p);
+
+			err = AddObservation(p, obs, nobs, &size);
+			if (err != 0)
+			{
+				goto add_failed;
+			}
+		}
+	}
+
+	return 0;
+
+add_failed:
+	if (err == -2)
+	{
+		sprintf(errbuff, "Out of memory\n");
+		*exc = PyExc_MemoryError;
+	}
+	return -1;
+}
+
+static PyObject* PredictTransit(predict_t *p)
+{
+	/* Computes the next transit starting at p->daynum for the satellite
+	   in p.  The search runs with the GIL released. */
+
+	observation *obs = NULL;
+	int i, nobs=0, err;
+	char errbuff[100];
+	PyObject *exc, *py_obs;
+	PyObject* transit = NULL;
+	double now;
+
+	// Daynum2String isn't reentrant so this check is done holding the GIL
+	now=CurrentDaynum();
+
+	//TODO: Seems like this should be based on the freshness of the TLE, not wall clock.
+	if ((p->daynum<now-365.0) || (p->daynum>now+365.0))
+	{
+		sprintf(errbuff, "time %s too far from present\n", Daynum2String(p->daynum));
+		PyErr_SetString(PredictException, errbuff);
+		return NULL;
+	}
+
+	Py_BEGIN_ALLOW_THREADS
+	err = SearchTransit(p, &obs, &nobs, errbuff, &exc);
+	Py_END_ALLOW_THREADS
+
+	if (err != 0)
+	{
+		if (exc != NULL)
+		{
+			PyErr_SetString(exc, errbuff);
+		}
+		goto cleanup;
+	}
+
+	transit = PyList_New(0);
+	if (transit == NULL)
+	{
+		goto cleanup;
+	}
+
+	for (i=0; i<nobs; i++)
+	{
+		py_obs = PythonifyObservation(&obs[i]);
+		if (py_obs == NULL) {
+			//PythonifyObservation will set appropriate exception string
+			Py_CLEAR(transit);
+			goto cleanup;
+		}
+
+		if (PyList_Append(transit, py_obs) != 0)
+		{
+			Py_DECREF(py_obs);
+			Py_CLEAR(transit);
+			goto cleanup;
+		}
+		Py_DECREF(py_obs);
+	}
+
+cleanup:
+	free(obs);
+	return transit;
+}
+
 static PyObject* quick_find(PyObject* self, PyObject *args)
 {
 	struct observation obs = { 0 };
+	predict_t state = { 0 };
+	int err;
+
+	err = load(&state, args);
+	if (err == 0)
+	{
+		Py_BEGIN_ALLOW_THREADS
+		PreCalc(&state);
+		err = MakeObservation(&state, state.daynum, &obs);
+		Py_END_ALLOW_THREADS
+	}
 
-	if (load(args) != 0 || MakeObservation(daynum, &obs) != 0)
+	if (err != 0)
 	{
 		// load or MakeObservation will set appropriate exceptions if either fails.
 		return NULL;
@@ -3543,134 +3737,308 @@ static char quick_find_docs[] =
 
 static PyObject* quick_predict(PyObject* self, PyObject *args)
 {
-	double now;
-	int lastel=0;
-	char errbuff[100];
-	observation obs = { 0 };
+	PyObject* transit = NULL;
+	predict_t state = { 0 };
 
-	PyObject* transit = PyList_New(0);
-	if (transit == NULL)
+	if (load(&state, args) == 0)
 	{
-		goto cleanup_and_raise_exception;
+		// load will set the appropriate exception string if it fails.
+		PreCalc(&state);
+		transit = PredictTransit(&state);
 	}
 
-	now=CurrentDaynum();
+	return transit;
+}
+
+static char quick_predict_docs[] =
+    "quick_predict((tle_line0, tle_line1, tle_line2), time, (gs_lat, gs_lon, gs_alt))\n";
+
+/* Predictor object - a satellite & groundstation pair.  The TLE is parsed
+   and pre-processed for SGP4/SDP4 once, when the Predictor is created, and
+   kept here along with the QTH.  Each call works on its own copy of this
+   state so a Predictor is never changed after it's initialized. */
 
-	if (load(args) != 0)
+typedef struct {
+	PyObject_HEAD
+	char initialized;           // 0 until __init__ succeeds
+	predict_t state;            // TLE & QTH as left by PreCalc()
+} Predictor;
+
+static char LoadPredictor(Predictor *self, predict_t *p)
+{
+	/* Checks a Predictor has been initialized and copies its state into
+	   p.  Flags are as they were right after PreCalc() so SGP4/SDP4 will
+	   initialize on their first call. */
+
+	if (!self->initialized)
 	{
-		// load will set the appropriate exception string if it fails.
-		goto cleanup_and_raise_exception;
+		PyErr_SetString(PredictException, "Predictor not initialized");
+		return -1;
 	}
 
-	//TODO: Seems like this should be based on the freshness of the TLE, not wall clock.
-	if ((daynum<now-365.0) || (daynum>now+365.0))
+	*p=self->state;
+	return 0;
+}
+
+static int Predictor_init(Predictor *self, PyObject *args, PyObject *kwds)
+{
+	const char *tle0, *tle1, *tle2;
+	// One extra char so ReadTLE can still tell that a line is too long
+	char line0[sizeof(sat.name)+1], line1[sizeof(sat.line1)+1], line2[sizeof(sat.line2)+1];
+	predict_t state = { 0 };
+	double lat, lon;
+	int alt;
+	char err;
+
+	if (!PyArg_ParseTuple(args, "(sss)|(ddi)", &tle0, &tle1, &tle2, &lat, &lon, &alt))
 	{
-		sprintf(errbuff, "time %s too far from present\n", Daynum2String(daynum));
-		PyErr_SetString(PredictException, errbuff);
-		goto cleanup_and_raise_exception;
+		return -1;
 	}
 
-	PreCalc(0);
-	Calc();
-	if (MakeObservation(daynum, &obs) != 0)
+	// ReadTLE wants writable strings
+	strncpy(line0,tle0,sizeof(line0)-1);
+	strncpy(line1,tle1,sizeof(line1)-1);
+	strncpy(line2,tle2,sizeof(line2)-1);
+	line0[sizeof(line0)-1] = line1[sizeof(line1)-1] = line2[sizeof(line2)-1] = 0;
+
+	if (ReadTLE(&state,line0,line1,line2) != 0)
 	{
-		// MakeObservation will set appropriate exception string
-		goto cleanup_and_raise_exception;
+		PyErr_SetString(PredictException, "Unable to process TLE");
+		err = -1;
+	}
+	else if (PyTuple_Size(args) < 2)
+	{
+		err = LoadDefaultQTH(&state);
+	}
+	else
+	{
+		err = ReadQTH(&state, lat, lon, alt);
 	}
 
-	if (!AosHappens(0))
+	if (err == 0)
 	{
-		sprintf(errbuff, "%lu does not rise above horizon. No AOS.\n", sat.catnum);
-		PyErr_SetString(NoTransitException, errbuff);
-		goto cleanup_and_raise_exception;
+		PreCalc(&state);
+		self->state=state;
+		self->initialized=1;
 	}
 
-	if (Geostationary(0)!=0)
+	return err;
+}
+
+static double ParseTime(PyObject *args, char *ok)
+{
+	/* Returns the optional time argument (unix secs) as a daynum */
+
+	double epoch=0;
+
+	*ok = PyArg_ParseTuple(args, "|d", &epoch);
+	if (PyTuple_Size(args) < 1)
 	{
-		sprintf(errbuff, "%lu is geostationary.  Does not transit.\n", sat.catnum);
-		PyErr_SetString(PredictException, errbuff);
-		goto cleanup_and_raise_exception;
+		return CurrentDaynum();
 	}
+	return (epoch/86400.0)-3651.0;
+}
 
-	if (Decayed(indx,daynum)!=0)
+static PyObject* Predictor_observe(Predictor *self, PyObject *args)
+{
+	observation obs = { 0 };
+	predict_t state;
+	double t;
+	char ok, err;
+
+	t = ParseTime(args, &ok);
+	if (!ok)
 	{
-		sprintf(errbuff, "%lu has decayed. Cannot calculate transit.\n", sat.catnum);
-		PyErr_SetString(PredictException, errbuff);
-		goto cleanup_and_raise_exception;
+		return NULL;
 	}
 
-	/* Make Predictions */
-	daynum=FindAOS();
+	err = LoadPredictor(self, &state);
+	if (err == 0)
+	{
+		Py_BEGIN_ALLOW_THREADS
+		err = MakeObservation(&state, t, &obs);
+		Py_END_ALLOW_THREADS
+	}
 
-	if (daynum == 0)
+	if (err != 0)
 	{
-		sprintf(errbuff, "%lu no longer rises above horizon. No AOS.\n", sat.catnum);
-		PyErr_SetString(NoTransitException, errbuff);
-		goto cleanup_and_raise_exception;
+		return NULL;
 	}
+	return PythonifyObservation(&obs);
+}
 
-	/* Construct the pass */
-	PyObject * py_obs;
-	while (iel>=0)
+static char Predictor_observe_docs[] =
+    "observe([time]) -> observation at time (unix secs, default now)\n";
+
+static PyObject* Predictor_transit(Predictor *self, PyObject *args)
+{
+	PyObject* transit = NULL;
+	predict_t state;
+	double t;
+	char ok;
+
+	t = ParseTime(args, &ok);
+	if (!ok)
 	{
-		if (MakeObservation(daynum, &obs) != 0)
-		{
-			//MakeObservation will set appropriate exception string
-			goto cleanup_and_raise_exception;
-		}
+		return NULL;
+	}
 
-		py_obs = PythonifyObservation(&obs);
-		if (py_obs == NULL) {
-			//PythonifyObservation will set appropriate exception string
-			goto cleanup_and_raise_exception;
-		}
+	if (LoadPredictor(self, &state) == 0)
+	{
+		state.daynum=t;
+		transit = PredictTransit(&state);
+	}
 
-		if (PyList_Append(transit, py_obs) != 0)
-		{
-			Py_DECREF(py_obs);
-			goto cleanup_and_raise_exception;
-		}
-		Py_DECREF(py_obs);
-		lastel=iel;
-		daynum+=cos((sat_ele-1.0)*deg2rad)*sqrt(sat_alt)/25000.0;
-		Calc();
+	return transit;
+}
+
+static char Predictor_transit_docs[] =
+    "transit([time]) -> list of observations over the next transit after time (unix secs, default now)\n";
+
+/* Fields filled in by observe_many(), one double each, in this order */
+
+static const char *observe_fields[] = {
+	"epoch", "latitude", "longitude", "azimuth", "elevation", "slant_range",
+	"doppler", "altitude", "footprint", "orbital_velocity", "eclipse_depth",
+	"orbital_phase", "orbit", "sunlit", "geostationary", "has_aos", "decayed",
+	"eci_x", "eci_y", "eci_z", "eci_vx", "eci_vy", "eci_vz",
+	"eci_sun_x", "eci_sun_y", "eci_sun_z", "eci_obs_x", "eci_obs_y", "eci_obs_z",
+	"beta_angle"
+};
+
+#define NUM_OBSERVE_FIELDS 30
+
+static void PackObservation(observation *obs, double *row)
+{
+	/* Copies an observation into a row of doubles - see observe_fields */
+
+	row[0] = obs->epoch;
+	row[1] = obs->latitude;
+	row[2] = obs->longitude;
+	row[3] = obs->azimuth;
+	row[4] = obs->elevation;
+	row[5] = obs->slant_range;
+	row[6] = obs->doppler;
+	row[7] = obs->altitude;
+	row[8] = obs->footprint;
+	row[9] = obs->orbital_velocity;
+	row[10] = obs->eclipse_depth;
+	row[11] = obs->orbital_phase;
+	row[12] = (double) obs->orbit;
+	row[13] = (double) obs->sunlit;
+	row[14] = (double) obs->geostationary;
+	row[15] = (double) obs->has_aos;
+	row[16] = (double) obs->decayed;
+	row[17] = obs->eci_x;
+	row[18] = obs->eci_y;
+	row[19] = obs->eci_z;
+	row[20] = obs->eci_vx;
+	row[21] = obs->eci_vy;
+	row[22] = obs->eci_vz;
+	row[23] = obs->eci_sun_x;
+	row[24] = obs->eci_sun_y;
+	row[25] = obs->eci_sun_z;
+	row[26] = obs->eci_obs_x;
+	row[27] = obs->eci_obs_y;
+	row[28] = obs->eci_obs_z;
+	row[29] = obs->beta_angle;
+}
+
+static PyObject* Predictor_observe_many(Predictor *self, PyObject *args)
+{
+	PyObject *times_obj, *out_obj;
+	Py_buffer times, out;
+	observation obs = { 0 };
+	predict_t state;
+	Py_ssize_t i, n;
+	double *t, *row;
+	char err = 0;
+
+	if (!PyArg_ParseTuple(args, "OO", &times_obj, &out_obj))
+	{
+		return NULL;
 	}
 
-	if (lastel!=0)
+	if (PyObject_GetBuffer(times_obj, &times, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) != 0)
 	{
-		daynum=FindLOS();
-		//TODO: FindLOS can fail.  Detect and log warning that transit end is approximate.
-		if (daynum > 0) {
-			Calc();
+		return NULL;
+	}
+	if (PyObject_GetBuffer(out_obj, &out, PyBUF_C_CONTIGUOUS | PyBUF_WRITABLE) != 0)
+	{
+		PyBuffer_Release(&times);
+		return NULL;
+	}
 
-			if (MakeObservation(daynum, &obs) != 0)
-			{
-				goto cleanup_and_raise_exception;
-			}
+	n = times.len / sizeof(double);
+	if (times.itemsize != sizeof(double) || times.format == NULL ||
+		strchr(times.format, 'd') == NULL)
+	{
+		PyErr_SetString(PyExc_TypeError, "times must be a contiguous array of doubles");
+		err = -1;
+	}
+	else if (out.len < n * NUM_OBSERVE_FIELDS * (Py_ssize_t) sizeof(double))
+	{
+		PyErr_SetString(PyExc_ValueError, "output buffer too small");
+		err = -1;
+	}
 
-			py_obs = PythonifyObservation(&obs);
-			if (py_obs == NULL) {
-				goto cleanup_and_raise_exception;
-			}
+	if (err == 0)
+	{
+		t = (double *) times.buf;
+		row = (double *) out.buf;
 
-			if (PyList_Append(transit, py_obs) != 0)
+		err = LoadPredictor(self, &state);
+		if (err == 0)
+		{
+			// The buffers are ours until they're released so we can let go of the GIL
+			Py_BEGIN_ALLOW_THREADS
+			for (i=0; i<n && err==0; i++, row+=NUM_OBSERVE_FIELDS)
 			{
-				Py_DECREF(py_obs);
-				goto cleanup_and_raise_exception;
+				// Deep-space sats start afresh each time - otherwise the SDP4
+				// resonance integrator carries on from wherever the last one
+				// left it and results would depend on the order of the times
+				if (i > 0 && isFlagSet(&state, DEEP_SPACE_EPHEM_FLAG))
+				{
+					state=self->state;
+				}
+				err = MakeObservation(&state, (t[i]/86400.0)-3651.0, &obs);
+				PackObservation(&obs, row);
 			}
-			Py_DECREF(py_obs);
+			Py_END_ALLOW_THREADS
 		}
 	}
 
-	return transit;
+	PyBuffer_Release(&times);
+	PyBuffer_Release(&out);
 
-cleanup_and_raise_exception:
-	Py_XDECREF(transit);
-	return NULL;
+	if (err != 0)
+	{
+		return NULL;
+	}
+	Py_RETURN_NONE;
 }
 
-static char quick_predict_docs[] =
-    "quick_predict((tle_line0, tle_line1, tle_line2), time, (gs_lat, gs_lon, gs_alt))\n";
+static char Predictor_observe_many_docs[] =
+    "observe_many(times, out) -> fills out with an observation for each time (unix secs).\n"
+    "out is a writable buffer of len(times) rows of packed doubles, see OBSERVE_FIELDS\n";
+
+static PyMethodDef Predictor_methods[] = {
+    {"observe", (PyCFunction)Predictor_observe, METH_VARARGS, Predictor_observe_docs},
+    {"transit", (PyCFunction)Predictor_transit, METH_VARARGS, Predictor_transit_docs},
+    {"observe_many", (PyCFunction)Predictor_observe_many, METH_VARARGS, Predictor_observe_many_docs},
+    {NULL, NULL, 0, NULL}
+};
+
+static PyTypeObject PredictorType = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	.tp_name = "cpredict.Predictor",
+	.tp_basicsize = sizeof(Predictor),
+	.tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
+	.tp_doc = "Predictor((tle_line0, tle_line1, tle_line2), (gs_lat, gs_lon, gs_alt))",
+	.tp_methods = Predictor_methods,
+	.tp_init = (initproc)Predictor_init,
+	.tp_new = PyType_GenericNew,
+};
 
 static PyMethodDef pypredict_funcs[] = {
     {"quick_find"   , (PyCFunction)quick_find   , METH_VARARGS, quick_find_docs},
@@ -3695,6 +4063,13 @@ static PyMethodDef pypredict_funcs[] = {
 static PyObject * cpredictinit(void)
 {
 	PyObject *m;
+
+	InitChecksums();
+
+	if (PyType_Ready(&PredictorType) < 0) {
+		return NULL;
+	}
+
 #if PY_MAJOR_VERSION >= 3
 	m = PyModule_Create(&moduledef);
 #else
@@ -3715,6 +4090,19 @@ static PyObject * cpredictinit(void)
 	Py_INCREF(NoTransitException);
 	PyModule_AddObject(m, "NoTransitException", NoTransitException);
 
+	// Predictor handles
+	Py_INCREF(&PredictorType);
+	PyModule_AddObject(m, "Predictor", (PyObject *)&PredictorType);
+
+	// Fields filled in by Predictor.observe_many()
+	PyObject *fields = PyTuple_New(NUM_OBSERVE_FIELDS);
+	int x;
+	for (x=0; x<NUM_OBSERVE_FIELDS; x++)
+	{
+		PyTuple_SET_ITEM(fields, x, Py_BuildValue("s", observe_fields[x]));
+	}
+	PyModule_AddObject(m, "OBSERVE_FIELDS", fields);
+
 	return m;
 }
 
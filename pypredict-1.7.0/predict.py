@@ -2,15 +2,35 @@ import sys
 import os
 import time
 
+from bisect import bisect_left, bisect_right
 from collections import namedtuple
 from copy import copy
 from cpredict import PredictException
+from cpredict import Predictor as _Predictor
+from cpredict import OBSERVE_FIELDS
 from cpredict import quick_find as _quick_find
 from cpredict import quick_predict as _quick_predict
 
 
 SolarWindow = namedtuple("SolarWindow", ["start", "end"])
 
+# Predictors for the tle/qth pairs used by observe() & transits()
+MAX_PREDICTORS = 64
+_predictors = {}
+
+# Structured dtype of the arrays returned by observe_many() - built on first use so we
+# don't need numpy unless we're using it
+_observation_dtype = None
+
+
+def observation_dtype():
+    global _observation_dtype
+    if _observation_dtype is None:
+        import numpy as np
+
+        _observation_dtype = np.dtype([(name, "f8") for name in OBSERVE_FIELDS])
+    return _observation_dtype
+
 
 def quick_find(tle, at, qth):
     tle = massage_tle(tle)
@@ -62,88 +82,255 @@ def massage_qth(qth):
         raise PredictException(e)
 
 
-def observe(tle, qth, at=None):
-    if at is None:
-        at = time.time()
-    return quick_find(tle, at, qth)
+class Predictor:
+    """A satellite & groundstation pair.
 
+    The TLE is parsed and the SGP4/SDP4 model is set up once, when the Predictor is created,
+    rather than on every call.  Predictors can be used from several threads at once.
+    """
 
-def transits(tle, qth, ending_after=None, ending_before=None):
-    if ending_after is None:
-        ending_after = time.time()
-    ts = ending_after
-    while True:
-        transit = quick_predict(tle, ts, qth)
+    def __init__(self, tle, qth=None):
+        self.tle = massage_tle(tle)
+        self.qth = host_qth() if qth is None else massage_qth(qth)
+        self._predictor = _Predictor(self.tle, self.qth)
+
+    def observe(self, at=None):
+        if at is None:
+            at = time.time()
+        return self._predictor.observe(at)
+
+    def observe_many(self, times, out=None):
+        """Return observations at an array of times as a numpy structured array.
+
+        The observations are written straight into the array in a single call.  Fields are
+        those in OBSERVE_FIELDS.  If given, out must have this dtype and the same shape as times.
+        """
+        import numpy as np
+
+        times = np.ascontiguousarray(times, dtype=np.float64)
+        if out is None:
+            out = np.empty(times.shape, dtype=observation_dtype())
+        elif out.dtype != observation_dtype() or out.shape != times.shape:
+            raise ValueError("out must have observation_dtype() and the same shape as times")
+        self._predictor.observe_many(times, out)
+        return out
+
+    def transits(self, ending_after=None, ending_before=None):
+        if ending_after is None:
+            ending_after = time.time()
+        ts = ending_after
+        while True:
+            transit = self._predictor.transit(ts)
+            t = Transit(
+                self.tle,
+                self.qth,
+                start=transit[0]["epoch"],
+                end=transit[-1]["epoch"],
+                _samples=transit,
+                _predictor=self,
+            )
+            if ending_before is not None and t.end > ending_before:
+                break
+            if t.end > ending_after:
+                yield t
+            # Need to advance time cursor so predict doesn't yield same pass
+            ts = t.end + 60  # seconds seems to be sufficient
+
+    def active_transit(self, at=None):
+        if at is None:
+            at = time.time()
+        transit = self._predictor.transit(at)
         t = Transit(
-            tle,
-            qth,
+            self.tle,
+            self.qth,
             start=transit[0]["epoch"],
             end=transit[-1]["epoch"],
             _samples=transit,
+            _predictor=self,
         )
-        if ending_before is not None and t.end > ending_before:
-            break
-        if t.end > ending_after:
-            yield t
-        # Need to advance time cursor so predict doesn't yield same pass
-        ts = t.end + 60  # seconds seems to be sufficient
+        return t if t.start <= at <= t.end else None
+
+
+def get_predictor(tle, qth):
+    """Return a (shared) Predictor for a tle/qth pair."""
+    tle = massage_tle(tle)
+    qth = massage_qth(qth)
+    key = (tuple(tle), qth)
+    predictor = _predictors.get(key)
+    if predictor is None:
+        if len(_predictors) >= MAX_PREDICTORS:
+            _predictors.clear()
+        predictor = _predictors[key] = Predictor(tle, qth)
+    return predictor
+
+
+def observe(tle, qth, at=None):
+    return get_predictor(tle, qth).observe(at)
+
+
+def observe_many(tle, qth, times, out=None):
+    return get_predictor(tle, qth).observe_many(times, out)
+
+
+def transits(tle, qth, ending_after=None, ending_before=None):
+    return get_predictor(tle, qth).transits(ending_after, ending_before)
 
 
 def active_transit(tle, qth, at=None):
-    if at is None:
-        at = time.time()
-    transit = quick_predict(tle, at, qth)
-    t = Transit(
-        tle, qth, start=transit[0]["epoch"], end=transit[-1]["epoch"], _samples=transit
-    )
-    return t if t.start <= at <= t.end else None
+    return get_predictor(tle, qth).active_transit(at)
+
+
+class SampleCache:
+    """Observations of a satellite from a groundstation, kept sorted by time.
+
+    Shared by a transit and the transits derived from it (above(), prune()) so that no time is
+    ever propagated twice.
+    """
+
+    def __init__(self, predictor, samples=None):
+        self.predictor = predictor
+        self.epochs = []
+        self.samples = []
+        self.peaks = {}
+        for sample in samples or []:
+            self.add(sample["epoch"], sample)
+
+    def add(self, t, sample):
+        i = bisect_left(self.epochs, t)
+        if i < len(self.epochs) and self.epochs[i] == t:
+            return self.samples[i]
+        self.epochs.insert(i, t)
+        self.samples.insert(i, sample)
+        return sample
+
+    def at(self, t):
+        i = bisect_left(self.epochs, t)
+        if i < len(self.epochs) and self.epochs[i] == t:
+            return self.samples[i]
+        return self.add(t, self.predictor.observe(t))
+
+    def between(self, start, end):
+        """Return (times, samples) lying within [start, end]."""
+        i = bisect_left(self.epochs, start)
+        j = bisect_right(self.epochs, end)
+        return self.epochs[i:j], self.samples[i:j]
 
 
 class Transit:
     """A convenience class representing a pass of a satellite over a groundstation."""
 
-    def __init__(self, tle, qth, start, end, _samples=None):
+    def __init__(self, tle, qth, start, end, _samples=None, _predictor=None, _cache=None):
         self.tle = tle
         self.qth = qth
         self.start = start
         self.end = end
-        if _samples is None:
-            self._samples = []
+        if _predictor is None:
+            _predictor = get_predictor(tle, qth)
+        self._predictor = _predictor
+        if _cache is None:
+            _cache = SampleCache(_predictor, _samples)
         else:
-            self._samples = [s for s in _samples if start <= s["epoch"] <= end]
+            for sample in _samples or []:
+                _cache.add(sample["epoch"], sample)
+        self._cache = _cache
+
+    @property
+    def _samples(self):
+        return self._cache.between(self.start, self.end)[1]
+
+    def _elevation(self, t):
+        return self._cache.at(t)["elevation"]
+
+    def _sampled(self):
+        """Return (times, samples) over the transit, making sure we have at least 3 of them."""
+        self._cache.at(self.start)
+        self._cache.at(self.end)
+        ts, samples = self._cache.between(self.start, self.end)
+        if len(samples) < 3:
+            self._cache.at((self.start + self.end) / 2)
+            ts, samples = self._cache.between(self.start, self.end)
+        return ts, samples
 
     def peak(self, epsilon=0.1):
         """Return observation within epsilon seconds of maximum elevation.
 
         NOTE: Assumes elevation is strictly monotonic or concave over the [start,end] interval.
         """
-        ts = (self.end + self.start) / 2
-        step = self.end - self.start
-        while step > epsilon:
-            step /= 4
-            # Ascend the gradient at this step size
-            direction = None
-            while True:
-                mid = observe(self.tle, self.qth, ts)["elevation"]
-                left = observe(self.tle, self.qth, ts - step)["elevation"]
-                right = observe(self.tle, self.qth, ts + step)["elevation"]
-                # Break if we're at a peak
-                if left <= mid >= right:
-                    break
-                # Ascend up slope
-                slope = -1 if (left > right) else 1
-                # Break if we stepped over a peak (switched directions)
-                if direction is None:
-                    direction = slope
-                if direction != slope:
-                    break
-                # Break if stepping would take us outside of transit
-                next_ts = ts + (direction * step)
-                if (next_ts < self.start) or (next_ts > self.end):
-                    break
-                # Step towards the peak
-                ts = next_ts
-        return self.at(ts)
+        key = (self.start, self.end, epsilon)
+        if key in self._cache.peaks:
+            return self._cache.peaks[key]
+
+        # The peak lies between the neighbors of the highest sample we have so far ...
+        ts, samples = self._sampled()
+        i = max(range(len(samples)), key=lambda k: samples[k]["elevation"])
+        a = ts[max(i - 1, 0)]
+        b = ts[min(i + 1, len(ts) - 1)]
+
+        # ... so close in on it with a golden section search
+        invphi = (5 ** 0.5 - 1) / 2
+        lo, hi = a, b
+        c = hi - invphi * (hi - lo)
+        d = lo + invphi * (hi - lo)
+        fc = self._elevation(c)
+        fd = self._elevation(d)
+        while hi - lo > epsilon:
+            if fc >= fd:
+                hi, d, fd = d, c, fc
+                c = hi - invphi * (hi - lo)
+                fc = self._elevation(c)
+            else:
+                lo, c, fc = c, d, fd
+                d = lo + invphi * (hi - lo)
+                fd = self._elevation(d)
+
+        # Best of everything we've looked at
+        peak = max(self._cache.between(a, b)[1], key=lambda s: s["elevation"])
+        self._cache.peaks[key] = peak
+        return peak
+
+    def _crossing(self, a, b, elevation, tolerance):
+        """Return time between a and b where elevation is within tolerance of target elevation.
+
+        The elevation must be on opposite sides of the target at a and b.  The bracket is first
+        narrowed to the closest cached samples and then closed with regula falsi (Illinois).
+        Raises PredictException if a and b don't bracket the target elevation.
+        """
+        fa = self._elevation(a) - elevation
+        fb = self._elevation(b) - elevation
+        ts, samples = self._cache.between(a, b)
+        fs = [s["elevation"] - elevation for s in samples]
+        for k in range(len(ts) - 1):
+            if abs(fs[k + 1]) <= tolerance:
+                return ts[k + 1]
+            if (fs[k] < 0) != (fs[k + 1] < 0):
+                a, fa, b, fb = ts[k], fs[k], ts[k + 1], fs[k + 1]
+                break
+        else:
+            if abs(fa) <= tolerance:
+                return a
+            if (fa < 0) == (fb < 0):
+                raise PredictException(
+                    "elevation %f not crossed in [%f, %f]" % (elevation, a, b)
+                )
+
+        side = 0
+        while True:
+            t = (a * fb - b * fa) / (fb - fa)
+            if not a < t < b:
+                t = (a + b) / 2
+            ft = self._elevation(t) - elevation
+            if abs(ft) <= tolerance or (b - a) < 1e-6:
+                return t
+            if (ft < 0) == (fa < 0):
+                a, fa = t, ft
+                if side == -1:
+                    fb /= 2
+                side = -1
+            else:
+                b, fb = t, ft
+                if side == 1:
+                    fa /= 2
+                side = 1
 
     def above(self, elevation, tolerance=0.001):
         """Return portion of transit that lies above argument elevation.
@@ -186,68 +373,40 @@ class Transit:
 
             return limit < elevation
 
-        def add_sample(ts, samples):
-            if ts not in [s["epoch"] for s in samples]:
-                samples.append(self.at(ts))
-                samples.sort(key=lambda s: s["epoch"])
-
-        def interpolate(samples, elevation, tolerance):
-            """Interpolate between adjacent samples straddling the elevation target."""
-
-            for i in range(len(samples) - 1):
-                a, b = samples[i : i + 2]
-
-                if any(
-                    abs(sample["elevation"] - elevation) <= tolerance
-                    for sample in [a, b]
-                ):
-                    continue
-
-                if (a["elevation"] < elevation) != (b["elevation"] < elevation):
-                    p = (elevation - a["elevation"]) / (b["elevation"] - a["elevation"])
-                    t = a["epoch"] + p * (b["epoch"] - a["epoch"])
-                    add_sample(t, samples)
-                    return True
-            return False
-
         # math gets unreliable with a real small elevation tolerances (~1e-6), be safe.
         if tolerance < 0.0001:
             raise ValueError("Minimum tolerance of 0.0001")
 
-        # Ensure we've got a well formed set of samples for iterative linear interpolation
-        # We'll need at least three (2 needed for interpolating, 3 needed for filtering speedup)
+        # We need at least three samples (2 needed for interpolating, 3 needed for filtering speedup)
         if self.start == self.end:
             return self
-        samples = self._samples[:]
-        add_sample(self.start, samples)
-        add_sample(self.end, samples)
-        if len(samples) < 3:
-            add_sample((self.start + self.end) / 2, samples)
+        ts, samples = self._sampled()
 
         # We need at least one sample point in the sample set above the desired elevation
-        protrude = max(samples, key=lambda s: s["elevation"])
+        i = max(range(len(samples)), key=lambda k: samples[k]["elevation"])
+        protrude, t_protrude = samples[i], ts[i]
         if protrude["elevation"] <= elevation:
             if not capped_below(
                 elevation, samples
             ):  # prevent expensive calculation on lost causes
                 protrude = self.peak()
-                add_sample(
-                    protrude["epoch"], samples
-                )  # recalculation is wasteful, but this is rare
+                t_protrude = protrude["epoch"]
 
         if protrude["elevation"] <= elevation:
-            start = protrude["epoch"]
-            end = protrude["epoch"]
+            start = t_protrude
+            end = t_protrude
         else:
             # Aim for elevation + (tolerance / 2) +/- (tolerance / 2) to ensure we're >= elevation
-            while interpolate(
-                samples, elevation + float(tolerance) / 2, float(tolerance) / 2
-            ):
-                pass
-            samples = [s for s in samples if s["elevation"] >= elevation]
-            start = samples[0]["epoch"]
-            end = samples[-1]["epoch"]
-        return Transit(self.tle, self.qth, start, end, samples)
+            target = elevation + float(tolerance) / 2
+            if self._elevation(self.start) >= elevation:
+                start = self.start
+            else:
+                start = self._crossing(self.start, t_protrude, target, float(tolerance) / 2)
+            if self._elevation(self.end) >= elevation:
+                end = self.end
+            else:
+                end = self._crossing(t_protrude, self.end, target, float(tolerance) / 2)
+        return Transit(self.tle, self.qth, start, end, _predictor=self._predictor, _cache=self._cache)
 
     def prune(self, fx, epsilon=0.1):
         """Return section of a transit where a pruning function is valid.
@@ -299,7 +458,34 @@ class Transit:
             raise PredictException(
                 "time %f outside transit [%f, %f]" % (t, self.start, self.end)
             )
-        return observe(self.tle, self.qth, t)
+        return self._cache.at(t)
+
+
+def _eclipse_boundary(predictor, a, fa, b, fb, tol):
+    """Return time within tol after the eclipse depth changes sign between a and b.
+
+    The bracket is closed with regula falsi (Illinois) on the eclipse depth.  The end of the
+    final bracket is returned, i.e. the first time found on the far side of the boundary.
+    """
+    side = 0
+    for _ in range(50):
+        if b - a <= tol:
+            break
+        t = (a * fb - b * fa) / (fb - fa)
+        if not a < t < b:
+            t = (a + b) / 2
+        ft = predictor.observe(t)["eclipse_depth"]
+        if (ft < 0) == (fa < 0):
+            a, fa = t, ft
+            if side == -1:
+                fb /= 2
+            side = -1
+        else:
+            b, fb = t, ft
+            if side == 1:
+                fa /= 2
+            side = 1
+    return b
 
 
 def find_solar_periods(
@@ -313,40 +499,37 @@ def find_solar_periods(
 ):
     """
     Finds all sunlit (or eclipse, if eclipse is set) windows for a tle within a time range.
+
+    The whole range is sampled every large_predict_timestep secs in one call and each shadow
+    entry/exit is then closed in on to within small_predict_timestep secs by root finding on the
+    eclipse depth.  eclipse_depth_threshold is no longer needed and is ignored.
     """
+    import numpy as np
+
     qth = (
         0,
         0,
         0,
     )  # doesn't matter since we dont care about relative position from ground
 
+    predictor = get_predictor(tle, qth)
+    ts = np.arange(start, end, large_predict_timestep, dtype=float)
+    obs = predictor.observe_many(ts)
+    sunlit = obs["sunlit"]
+    depth = obs["eclipse_depth"]
+
+    # Window starts when we go into the sun, or into eclipse if eclipse is set
+    opening = 0 if eclipse else 1
     last_start = None
     ret = []
-    prev_period = -1
-    t = start
-    while t < end:
-        obs = observe(tle, qth, t)
-        if not eclipse:
-            # Check for transitioning into sun, then transitioning out
-            if prev_period == 0 and obs["sunlit"] == 1:
-                last_start = t
-            elif prev_period == 1 and obs["sunlit"] == 0:
-                if last_start is not None:
-                    ret.append(SolarWindow(last_start, t))
-                    last_start = None
-        else:
-            # Check for transitioning out of sun into eclipse
-            if prev_period == 1 and obs["sunlit"] == 0:
-                last_start = t
-            elif prev_period == 0 and obs["sunlit"] == 1:
-                if last_start is not None:
-                    ret.append(SolarWindow(last_start, t))
-                    last_start = None
-        prev_period = obs["sunlit"]
-        # Use large steps if not near an eclipse boundary
-        if abs(obs["eclipse_depth"]) > eclipse_depth_threshold:
-            t += large_predict_timestep
-        else:
-            t += small_predict_timestep
+    for k in np.nonzero(sunlit[1:] != sunlit[:-1])[0]:
+        t = _eclipse_boundary(
+            predictor, ts[k], depth[k], ts[k + 1], depth[k + 1], small_predict_timestep
+        )
+        if sunlit[k + 1] == opening:
+            last_start = t
+        elif last_start is not None:
+            ret.append(SolarWindow(last_start, t))
+            last_start = None
 
     return ret
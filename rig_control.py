@@ -31,6 +31,11 @@ from utilities import freq2band, error_trap
 
 ################################################################################
 
+LATENCY_ALPHA = 0.2         # Smoothing for rig command latency estimates
+MAX_LATENCY   = 2.          # Secs, max. look-ahead we'll ever use
+
+################################################################################
+
 # Rig control called every sec seconds
 class RigControl:
     def __init__(self,P,sec):
@@ -49,6 +54,10 @@ class RigControl:
         self.el    = None
         self.sat_map_cntr=0
 
+        # Running estimates of how long it takes to set the up & down link
+        # freqs - used to look ahead when computing Doppler
+        self.latency = {'up':0., 'down':0., 'sdr':0.}
+
         if P.PLATFORM=='Windows':
             tmpfile="satellites.log"
         else:
@@ -60,7 +69,8 @@ class RigControl:
              'fup','fdown','df','fdop1','fdop2',
              'frqA','frqB','RIT','XIT',
              'az','el','pos[0]','pos[1]','new_pos[0]','new_pos[1]','daz','de',
-             'flipper','rig_engaged','rotor_engaged','rotor_updated']
+             'flipper','rig_engaged','rotor_engaged','rotor_updated',
+             'lat_up','lat_down']
         for item in row:
             self.fp_log.write(str(item)+',')
         self.fp_log.write('\n')
@@ -253,23 +263,42 @@ class RigControl:
             
             
         # Compute Doppler shifts for up and down links
+        now = time.time()
         [self.fdop1,self.fdop2,self.az,self.el,rng,lat,lon,footprint] = \
-            P.satellite.Doppler_Shifts(self.fdown,self.fup,P.my_qth)
+            P.satellite.Doppler_Shifts(self.fdown,self.fup,P.my_qth,now)
+
+        # The freqs don't take effect until the rig gets the commands so
+        # compute the Doppler for when that will happen.  The uplink is set
+        # first, then the downlink, then the SDR.
+        fdop_sdr = self.fdop1
+        if P.LOOKAHEAD:
+            t_up   = now  + self.latency['up']
+            t_down = t_up + self.latency['down']
+            t_sdr  = t_down + self.latency['sdr']
+            self.fdop2 = P.satellite.Doppler_Shifts(self.fdown,self.fup,P.my_qth,t_up)[1]
+            self.fdop1 = P.satellite.Doppler_Shifts(self.fdown,self.fup,P.my_qth,t_down)[0]
+            fdop_sdr   = P.satellite.Doppler_Shifts(self.fdown,self.fup,P.my_qth,t_sdr)[0]
 
         # Set up link freq
         if len(self.vfos)>1:
             self.frqB = int(self.fup+self.fdop2 + gui.xit)
             if gui.rig_engaged or Force:
+                t0 = time.time()
                 P.sock.set_freq(1e-3*self.frqB,VFO=self.vfos[1],VERBOSITY=1)
+                self.update_latency('up',time.time()-t0)
 
         # Compute downlink freq at rig = frq at sat + Doppler
         self.frqA = int(self.fdown+self.fdop1 + gui.rit)
         if gui.rig_engaged or Force:
             print('\nTRACK FREQS: VFO A=',self.frqA,'\tVFO B=',self.frqB)
+            t0 = time.time()
             P.sock.set_freq(1e-3*self.frqA,VFO=self.vfos[0],VERBOSITY=1)
+            self.update_latency('down',time.time()-t0)
             if P.USE_SDR:
                 #print('Setting SDR freq to:',1e-3*self.frqA)
-                P.sock3.set_freq(1e-3*self.frqA)
+                t0 = time.time()
+                P.sock3.set_freq(1e-3*int(self.fdown+fdop_sdr + gui.rit))
+                self.update_latency('sdr',time.time()-t0)
         #print(self.frqA,self.frqB)
 
         # Form new rotor position
@@ -335,6 +364,11 @@ class RigControl:
         self.save_diagnostics(tag,df,pos,new_pos,daz,de,rotor_updated)
         
         
+    # Function to update running estimate of latency of a rig command
+    def update_latency(self,link,dt):
+        dt = min(dt,MAX_LATENCY)
+        self.latency[link] += LATENCY_ALPHA*(dt-self.latency[link])
+        
     # Save log file to assist in further development
     def save_diagnostics(self,source,df,pos,new_pos,daz,de,rotor_updated):
         P=self.P
@@ -347,7 +381,8 @@ class RigControl:
              self.fup,self.fdown,df,self.fdop1,self.fdop2,
              self.frqA,self.frqB,gui.rit,gui.xit,
              self.az,self.el,pos[0],pos[1],new_pos[0],new_pos[1],daz,de,
-             gui.flipper,gui.rig_engaged,gui.rotor_engaged,rotor_updated]
+             gui.flipper,gui.rig_engaged,gui.rotor_engaged,rotor_updated,
+             self.latency['up'],self.latency['down']]
         for item in row:
             self.fp_log.write(str(item)+',')
         self.fp_log.write('\n')
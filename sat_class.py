@@ -41,6 +41,8 @@ MIN_PEAK_EL  = 30                         # Degrees, min. elevation to identify
 USE_PYPREDICT=False                       # This also fails to converge on occastion - I think i've fixed this?
 #USE_PYPREDICT=True                       # This doesn't always converge for some reason - proably same problem as ephem, try it sometime
 SUN_UPDATE_INTERVAL = 10*60               # Only update every ten minutes
+TRACK_NPTS   = 20                         # Default no. points in sky track of a pass
+NEXT_TRANSIT_SPAN = 2*86400               # Secs, how far ahead to look for the next transit
 
 ################################################################################
 
@@ -53,7 +55,7 @@ if USE_PYPREDICT:
 from configparser import ConfigParser 
 from collections import OrderedDict
 import time
-from datetime import timedelta,datetime, timezone
+from datetime import datetime, timezone
 import ephem
 
 from widgets_qt import QTLIB
@@ -61,45 +63,32 @@ exec('from '+QTLIB+'.QtWidgets import QMainWindow,QWidget,QGridLayout')
 
 import numpy as np
 from constants import *
-from utilities import error_trap
+from body_pool import get_body,get_propagator,get_observer
+from pass_finder import find_passes,find_tca,pass_table,PASS_DTYPE
+from celestial import radiant_passes,body_azel,POSITION_CACHE
+from ephemeris import EPHEM_BODIES,body_observe,moon_lunation,unix_time
+from tle_catalog import TLE_CATALOG,ALIASES
+from track_table import TRACK_TABLE,TABLE_PRE,TABLE_POST
 from rig_io.ft_tables import CELESTIAL_BODY_LIST,METEOR_SHOWER_LIST
 
 ################################################################################
 
+POSITIONS = POSITION_CACHE(SUN_UPDATE_INTERVAL)   # Current Sun, Moon & radiant positions
+
+################################################################################
+
 # Function to assemble TLE data for a particular satellite
 def get_tle(TLE,sat):
 
-    if not hasattr(get_tle,"TLE_SHOWN"):
-        get_tle.TLE_SHOWN=False
-    
-    sat2=sat
-    if sat=='CAS-6':
-        sat2='TO-108'
-    elif sat=='AO-7':
-        sat2='AO-07'
-    elif sat=='XW-3':
-        sat2='XW 3'
-    elif sat=='FS-3':
-        sat2='Falconsat-3'
-    elif 'TEVEL' in sat:
-        sat2='Tevel'+sat[5:]
-    if sat!=sat2:
-        print('GET_TLE: Warning - name change for ',sat,' to ',sat2)
-
-    try:
-        idx  = TLE.index(sat2)
-    except: 
-        error_trap('GET TLE - Cant find TLE for sat='+sat)
-        if not get_tle.TLE_SHOWN:
-            print('TLE=',TLE)
-            get_tle.TLE_SHOWN=True
-        else:
-            print('See previous trap msg for complete TLE')
-        return None
+    if not isinstance(TLE,TLE_CATALOG):
+        TLE = TLE_CATALOG(TLE)
 
-    tle = sat + '\n' \
-        + TLE[idx+1] + '\n' \
-        + TLE[idx+2] + '\n'
+    if sat in ALIASES:
+        print('GET_TLE: Warning - name change for ',sat,' to ',ALIASES[sat])
+    tle = TLE.get(sat)
+    if tle==None:
+        print('GET TLE - Cant find TLE for sat=',sat)
+        return None
 
     if sat=='ISS':
         print('GET_TLE: sat=',sat,'\ntle=',tle)
@@ -111,43 +100,108 @@ def get_tle(TLE,sat):
 
 # Structure compatible with what comes out of Predict
 class TRANSIT:
-    def __init__(self,info,t,az,el,lats,lons,footprints):
-
-        # info:
-        # 0  Rise time
-        # 1  Rise azimuth
-        # 2  Maximum altitude time
-        # 3  Maximum altitude
-        # 4  Set time
-        # 5  Set azimuth
-        
-        self.start = ephem.localtime(info[0]).timestamp()
-        self.end   = ephem.localtime(info[4]).timestamp()
-        
-        self.t     = t
-        self.az    = az
-        self.el    = el
-
-        if info[3]==None:
-            self.max_el = 0
-        else:
-            self.max_el = info[3]*RAD2DEG
-
-        self.lats  = lats
-        self.lons  = lons
-        self.footprints  = footprints
+    def __init__(self,aos,los,tca=None,max_el=0,prop=None,qth=None,track=None):
+
+        # Times are unix secs
+        self.start  = aos
+        self.end    = los
+        self.tca    = tca
+        self.max_el = max_el
+
+        # The track is only computed when someone asks for it - see track().
+        # For the Sun, Moon & meteor showers, the track is already known.
+        self.prop   = prop
+        self.qth    = qth
+        self.tracks = {}
+        if track!=None:
+            self.tracks[None] = track
+        self.peak_obs = None
 
     def duration(self):
         return self.end-self.start
     
+    # Function to return observation at the peak of the pass, i.e. at TCA.
+    # This is computed the first time it is needed & saved.
     def peak(self):
-        return {'elevation':self.max_el,'slant_range':0}
+        if self.peak_obs!=None:
+            return self.peak_obs
+
+        if self.prop==None:
+
+            # Sun, Moon, etc. - take highest point on the track
+            track = self.track()
+            if len(track['el'])>0:
+                i = int( np.argmax(track['el']) )
+                self.max_el   = track['el'][i]
+                self.peak_obs = {'elevation':track['el'][i], 'azimuth':track['az'][i],
+                                 'epoch':track['t'][i], 'slant_range':0}
+            else:
+                self.peak_obs = {'elevation':self.max_el,'slant_range':0}
+
+        else:
+            
+            if self.tca==None:
+                tca,ends = find_tca(self.prop,self.qth,[0],[self.start],[self.end])
+                self.tca = tca[0]
+            obs = self.prop.observe_pairs([0],[self.tca],self.qth)
+            self.peak_obs = {key:float(val[0]) for key,val in obs.items()}
+            self.peak_obs['epoch'] = self.tca
+            self.max_el = self.peak_obs['elevation']
+
+        return self.peak_obs
+
+    # Function to return track for this pass with npts samples from AOS to LOS.
+    # Tracks are computed on first use & saved.
+    def track(self,npts=TRACK_NPTS):
+        if None in self.tracks:
+            return self.tracks[None]
+        if npts not in self.tracks:
+            t   = np.linspace(self.start,self.end,npts)
+            obs = self.prop.observe(t,self.qth)
+            self.tracks[npts] = {'t'          : t,
+                                 'az'         : obs['azimuth'][0],
+                                 'el'         : obs['elevation'][0],
+                                 'lats'       : obs['latitude'][0],
+                                 'lons'       : obs['longitude'][0],
+                                 'footprints' : obs['footprint'][0]}
+        return self.tracks[npts]
+
+    @property
+    def t(self):
+        return self.track()['t']
+    
+    @property
+    def az(self):
+        return self.track()['az']
+    
+    @property
+    def el(self):
+        return self.track()['el']
+    
+    @property
+    def lats(self):
+        return self.track()['lats']
+    
+    @property
+    def lons(self):
+        return self.track()['lons']
+    
+    @property
+    def footprints(self):
+        return self.track()['footprints']
+
+################################################################################
+
+# Function to convert unix times to local times for plotting
+def local_times(t):
+    offsets = [time.localtime(x).tm_gmtoff for x in t]
+    return ( np.asarray(t)+offsets ).astype('datetime64[s]')
 
 ################################################################################
 
 # Structure to contain data for a satellite
 class SATELLITE:
-    def __init__(self,isat,name,qth,date1,date2,TLE,SHOWERS):
+    def __init__(self,isat,name,qth,date1,date2,TLE,SHOWERS,passes=None):
 
         print('\n=====================================================================')
         print('SATELLITE CLASS: isat=',isat,'-\tSat:',name, \
@@ -157,24 +211,14 @@ class SATELLITE:
         self.qth  = qth
 
         self.main=None
-        self.pass_times = []
-        self.t = []
-        self.y = []
-        self.t2 = []
-        self.y2 = []
-        self.last_update = time.time() - SUN_UPDATE_INTERVAL
+        self.passes = pass_table()
+        self.track_table=None
         
         # Greenwich
-        self.greenwich = ephem.Observer()
-        self.greenwich.lat = '0'
-        self.greenwich.lon = '0'
+        self.greenwich = get_observer( (0.,0.,0.) )
         
         # Form location object
-        self.obs = ephem.Observer()
-        self.obs.lat = str( self.qth[0] )
-        self.obs.lon = str( -self.qth[1] )
-        self.obs.elevation = self.qth[2]
-        self.obs.pressure=0
+        self.obs = get_observer(self.qth)
         
         # Celestial and meteor showers are special since we don't use TLEs
         if name in CELESTIAL_BODY_LIST:
@@ -182,7 +226,7 @@ class SATELLITE:
             #self.fly_me_to_the_moon(date1,date2)
             return
         elif name in METEOR_SHOWER_LIST:
-            self.meteor_shower(SHOWERS[name],date1,date2)
+            self.meteor_shower(SHOWERS[name],date1,date2,passes)
             return
 
         # Predict transits of this (artificial) satellite over qth for the specified time span
@@ -191,110 +235,86 @@ class SATELLITE:
         self.tle = get_tle(TLE,name)
         if not self.tle:
             return
-        tle0=self.tle.split('\n')
-        self.sat = ephem.readtle(tle0[0],tle0[1],tle0[2])
-        if USE_PYPREDICT:
-            self.p   = predict.transits(self.tle, qth,
-                                        ending_after=tafter, ending_before=tbefore)
+        self.sat = get_body(name,self.tle)
 
         # Get transponder info for this sat
         self.get_transponders()
-            
-        # Look at the transits and determine times for visible sections
-        tlast=0
-        ts_old=None
-        te_old=None
-        npasses=0
-        while True:
-
-            # Move through list of passes & break if we're done
-            if USE_PYPREDICT:
-                try:
-                    transit = next(self.p)
-                except:
-                    break
-
-            else:
-                # Can get stuck here also - problem is a while loop in next_transit - see below
-                #print('HEY:',self.name,npasses,tafter,tbefore)
-                transit = self.next_transit(tafter)
-                #print('\t',transit.start,transit.end)
-                
-                #if transit==None or transit.start>tbefore:
-                    #break
-                if transit==None:
-                    tafter+=1
-                    continue
-                elif transit.start>tbefore:
-                    break
-                else:
-                    tafter=transit.end+1
-
-            # Determine start & end times for this pass
-            ts = datetime.fromtimestamp(transit.start)
-            te = datetime.fromtimestamp(transit.end)
-            npasses+=1
-            #print('Pass=',npasses,'\tts=',ts,'\tte=',te)
-            if npasses>1000:
-                print('Too many passes!')
-                return
-                sys.exit(0)
 
-            # AO-7 seems to have a problem with getting stuck in infinite loops
-            # Avoid this
-            if te_old and te<te_old:
-                print('ts_old=',ts_old,'\tte_old=',te_old)
-                print('ts    =',ts,    '\tte    =',te)
-                print('Hmmm - we seem to be going backwards here !!!')
-                break
-                sys.exit(0)
-            else:
-                ts_old=ts
-                te_old=te
-
-            # There are bug somewhere for a few sats that gets stuck in an infinite loop - kludge to avoid problem
-            if name in ['AO-07','FO-29'] and USE_PYPREDICT:
-                #print(transit.start,transit.end,tlast)
-                #print(ts,te,datetime.fromtimestamp(tafter),datetime.fromtimestamp(tbefore))
-                if tlast>=transit.end:
-                    #print('Unexpected result at',ts,'- giving up')
-                    #break
-                    print('*** Unexpected result at',ts,'- bumping by 1 hour ...')
-                    date99   = ts + timedelta(hours=1)
-                    print(date99)
-                    tafter2  = time.mktime(date99.timetuple())
-                    self.p   = predict.transits(self.tle, qth,
-                                                ending_after=tafter2, ending_before=tbefore)
-                    continue
-                else:
-                    tlast=transit.end
-
-            elif name=='FO-29' and USE_PYPREDICT:
-                print('HEY!!')
-                #print(transit.start,transit.end,transit.end-transit.start,tlast)
-                #print(ts,te,datetime.fromtimestamp(tafter),datetime.fromtimestamp(tbefore))
+        # Find passes over the specified time span - these may have already
+        # been computed in a batch with the other sats (see load_sat_data)
+        self.prop = get_propagator(name,self.tle)
+        if passes is None:
+            passes = find_passes(self.prop,qth,tafter,tbefore)[0]
+        self.set_passes(passes)
+
+    # Function to replace the passes, e.g. when the time window slides forward
+    def set_passes(self,passes):
+        self.passes = pass_table(passes)
+
+    # Function to switch to a new TLE, e.g. when fresh keps are read in.  The
+    # dense track table was made with the old TLE so it is dropped.
+    def set_tle(self,tle):
+        self.tle  = tle
+        self.sat  = get_body(self.name,tle)
+        self.prop = get_propagator(self.name,tle)
+        self.track_table = None
             
 
-            # Add this pass to list of plotting vars
-            self.t.append(ts)
-            self.y.append(None)
-            self.t.append(ts)
-            self.y.append(isat)
-            self.t.append(te)
-            self.y.append(isat)
-            self.t.append(te)
-            self.y.append(None)
-
-            # Identify passes that are well above the horizon
-            if transit.peak()['elevation'] >= MIN_PEAK_EL:
-                #print transit.start,transit.end 
-                tmid = datetime.fromtimestamp(
-                    0.5*( transit.start+transit.end ) )
-                self.t2.append( tmid )
-                self.y2.append(isat)
-
-            self.pass_times.append( 0.5*(transit.start+transit.end) )
-            
+    # The plotting vars are generated from the pass table as needed.  Each
+    # pass is drawn as a line segment from AOS to LOS with NaNs in between.
+    @property
+    def t(self):
+        aos = local_times(self.passes['aos'])
+        los = local_times(self.passes['los'])
+        return np.stack( (aos,aos,los,los), axis=1 ).ravel()
+
+    @property
+    def y(self):
+        return np.tile( [np.nan,self.isat,self.isat,np.nan], len(self.passes) )
+
+    # Same as t & y but for a subset of the passes
+    def segments(self,mask):
+        aos = local_times(self.passes['aos'][mask])
+        los = local_times(self.passes['los'][mask])
+        t   = np.stack( (aos,aos,los,los), axis=1 ).ravel()
+        y   = np.tile( [np.nan,self.isat,self.isat,np.nan], len(aos) )
+        return t,y
+
+    # Passes where the sat is in the earth's shadow the whole time or just
+    # part of the time.  Battery-dead birds (e.g. AO-07) won't work in the dark.
+    # NaN (don't know) compares False so these don't get flagged.
+    def eclipsed(self):
+        return self.passes['sunlit']<=0
+
+    def part_eclipsed(self):
+        sunlit = self.passes['sunlit']
+        return (sunlit>0) & (sunlit<1)
+
+    # Visual passes - sat is lit up while we're in the dark
+    def visual(self):
+        return (self.passes['dark']>0) & (self.passes['sunlit']>0)
+
+    # Passes that are well above the horizon are marked at mid-pass.  The
+    # Sun, Moon & meteor showers are always marked - peak elevation isn't
+    # known for the Sun & Moon and low radiants are still good for meteor
+    # scatter.
+    def overhead(self):
+        if self.name in CELESTIAL_BODY_LIST+METEOR_SHOWER_LIST:
+            return np.ones(len(self.passes),dtype=bool)
+        max_el = self.passes['max_el']
+        return (max_el>=MIN_PEAK_EL) | np.isnan(max_el)
+
+    @property
+    def t2(self):
+        return local_times( self.pass_times[self.overhead()] )
+
+    @property
+    def y2(self):
+        return np.full( np.count_nonzero(self.overhead()), self.isat )
+
+    @property
+    def pass_times(self):
+        return 0.5*( self.passes['aos'] + self.passes['los'] )
 
     # Function to read list of transponders for this sat 
     def get_transponders(self):
@@ -401,14 +421,17 @@ class SATELLITE:
 
     # Function to compute current Doppler shifts for a specific sat
     # Also returns az and el info for rotor control
-    def Doppler_Shifts(self,fdown,fup,my_qth):
+    def Doppler_Shifts(self,fdown,fup,my_qth,t=None):
         # obs.doppler is the Doppler shift for 100-MHz:
         # doppler100=-100.0e06*((sat_range_rate*1000.0)/299792458.0) = f*rdot/c
         # So to get Doppler shift @ fc (MHz):
         # fdop = doppler100*fc/100e6
 
-        # Observe sat at current time
-        now = time.mktime( datetime.now().timetuple() )
+        # Observe sat at time t - default is now
+        if t==None:
+            now = time.mktime( datetime.now().timetuple() )
+        else:
+            now = t
         if self.name=='MoonDoggy':
             # Hack hack hack!
             [az,el,lat,lon,illum]   = self.current_moon_position()
@@ -424,6 +447,9 @@ class SATELLITE:
                 #print('Doppler:',obs['doppler'],obs1['doppler'])
                 #sys.exit(0)
 
+            elif self.track_table and self.track_table.covers(now,my_qth):
+                obs=self.track_table.observe(now)
+
             else:
                 obs=self.observe(now)
                 
@@ -447,6 +473,12 @@ class SATELLITE:
 
 ################################################################################
 
+    # Function to set up an interpolation table for tracking a pass
+    def make_track_table(self,aos,los):
+        self.track_table = TRACK_TABLE(self.prop,self.qth,
+                                       aos-TABLE_PRE,los+TABLE_POST)
+        return self.track_table
+
     # Function to observe satellite at a given time
     def observe(self,t):
 
@@ -487,92 +519,14 @@ class SATELLITE:
                   '\nstart=',transit0.start,'\t',type(transit0) )
             return transit0
 
-        # Compute sat info at time t
-        tle0=self.tle.split('\n')
-        sat = ephem.readtle(tle0[0],tle0[1],tle0[2])
-        self.obs.date = datetime.fromtimestamp(t,tz=timezone.utc)
-        #print('time=',self.obs.date,datetime.utcnow())
-        sat.compute(self.obs)
-
-        # Back up in time if we're in the middle of a pass
-        if sat.alt>0 and True:
-            print('Sat IS currently visible')
-            self.obs.date = datetime.fromtimestamp(t-30*60,tz=timezone.utc)
-            sat.compute(self.obs)
-
-        # Get info for the next transit
-        try:
-            info=self.obs.next_pass(sat)
-        except: 
-            # Trap any errors that occur - not sure why this happens with ephem
-            # but seems to be an issue for passes well in the future
-            error_trap('NEXT TRANSIT - Trapped Error')
-            print('TLE=',tle0)
-            print('t=',t,'\t',self.obs.date,'\n')
-            return None
-
-        # Compute track - need to rip this mess out & use observe!
-        # We can get stuck here if dt is too low - mitigation is in progress ...
-        # The basic unit for an ephem dates is 1-day
-        # Need to take a look at the constants ephem.hour, .minute & .second
-        rise = info[0]
-        setting = info[4]
-        max_alt = info[3]
-        t =rise
-        dt=(setting-rise)/20.
-        if max_alt<=0:
-            print('NEXT TRANSIT: Skipping pseudo-pass with max alt=',max_alt,' below the horizon')
-            print('\tsetting=',setting,'\trise=',t,'\tdt=',dt,dt*20*24*3600)
-            #sys.exit(0)
+        # Find the next pass that hasn't ended yet.  Only the times are
+        # computed here - the track is computed if & when it is needed.
+        passes = find_passes(self.prop,self.qth,t,t+NEXT_TRANSIT_SPAN)[0]
+        if len(passes)==0:
+            print('NEXT TRANSIT: No passes found for',self.name,'after t=',t)
             return None
-        #print('NEXT TRANSIT: setting=',setting,'\trise=',t,'\tdt=',dt,'\tmax alt=',max_alt)
-        #print('\tdt=',dt,dt*20*24*3600)
-        
-        tt=[]
-        az=[]
-        el=[]
-        lats=[]
-        lons=[]
-        footprints=[]
-        while t<setting:
-            #print('NEXT TRANSIT: t=',t,'\tdt=',dt)
-            self.obs.date=t
-            sat.compute(self.obs)
-
-            local=ephem.localtime(t).timestamp()
-            tt.append(local)
-            az.append(sat.az*RAD2DEG)
-            el.append(sat.alt*RAD2DEG)
-
-            lon = sat.sublong*RAD2DEG    # ( sat.ra - self.greenwich.sidereal_time() )*RAD2DEG
-            lat = sat.sublat*RAD2DEG     #( sat.dec )*RAD2DEG
-            lats.append(lat)
-            lons.append(lon)
-            #print('Track: t=',self.obs.date,'\taz=',sat.az,'\tel=',sat.alt,'\tlat=',lat,'\tlon=',lon)
-
-            # These calcs came from pawing through pypredict C code
-            xkmper=6.378137E3
-            sat_alt= 1e-3*sat.elevation
-            footprint = 12756.33*np.arccos(xkmper/(xkmper+sat_alt));
-            footprints.append(footprint)
-            
-            t+=dt
-
-        transit=TRANSIT(info,tt,az,el,lats,lons,footprints)
-        transit.elevation=sat.elevation
-        transit.alt=sat.alt
-        transit.dec=sat.dec
-        ###transit.u=ephem.unrefract(self.obs.pressure, self.obs.temperature, sat.alt)
-        
-        #print('NEXT TRANSIT: Transit vars:\n', vars(transit),
-        #      '\nstart=',transit.start,'\t',type(transit) )
-        #print('long=',sat.sublong,'\tlat=',sat.sublat,'\televation=',sat.elevation)
-        #print('alt=',sat.alt,'\tdec=',sat.dec,'\trange=',sat.range,sat.a_dec,sat.g_dec,sat.a_ra,sat.g_ra,sat.ra)
-        #print('rise=',rise+0.,'\tsetting=',setting+0.,'\t',setting-rise)
-        #print('tt=',tt)
-        #print('transit.t=',transit.t)
-        #print('range=',sat.range,sat.radius)
-        #sys.exit(0)
+        p = passes[0]
+        transit=TRANSIT(p['aos'],p['los'],p['tca'],p['max_el'],self.prop,self.qth)
         
         return transit
 
@@ -583,11 +537,9 @@ class SATELLITE:
             Date=datetime.utcnow()
         print('Date=',Date)
         Date = ephem.Date(Date)
-        nnm = ephem.next_new_moon(Date)
-        pnm = ephem.previous_new_moon(Date)
         
-        # 0=new, 0.5=full, 1=new
-        lunation = (Date-pnm)/(nnm-pnm)
+        # 0=new, 0.5=full, 1=new - new moons come from the precomputed ephemeris
+        lunation = float( moon_lunation( unix_time(Date) )[0] )
         
         if lunation<0.1:
             phz='New Moon'
@@ -605,7 +557,7 @@ class SATELLITE:
         return lunation,phz
 
     # Function to handle meteor showers
-    def meteor_shower(self,shower,date1,date2):
+    def meteor_shower(self,shower,date1,date2,passes=None):
         print('\nMETEOR_SHOWER: my_qth=',self.qth,'\ndate1=',date1,'\tdate2=',date2)
 
         # Create fixed body at radiant
@@ -623,6 +575,16 @@ class SATELLITE:
             self.radiant._epoch = ephem.J2000
             #sys.exit(0)
 
+            # Rise & set of a fixed radiant are closed form (see celestial.py)
+            # - these may have already been computed in a batch with the
+            # other showers (see load_sat_data)
+            if passes is None:
+                tafter  = time.mktime(date1.timetuple())
+                tbefore = time.mktime(date2.timetuple())
+                passes  = radiant_passes(ra,decl,self.qth,tafter,tbefore)[0]
+            self.set_passes(passes)
+            return
+
         # Fake the transponders to use the weak signal portion of the 2m band
         # Not sure why I thought we needed to do this?
         #self.get_transponders()
@@ -666,32 +628,35 @@ class SATELLITE:
 
         #print('Moon transits=',transits)
 
-        # Assemble graphing data from the transits
-        isat=self.isat
-        for transit in transits:
-            ts=transit[0]
-            te=transit[1]
-                
-            self.t.append(ts)
-            self.y.append(None)
-            self.t.append(ts)
-            self.y.append(isat)
-            self.t.append(te)
-            self.y.append(isat)
-            self.t.append(te)
-            self.y.append(None)
-
-            tmid = ts + 0.5*(te-ts)
-            self.t2.append( tmid )
-            self.y2.append(isat)
-                
-            self.pass_times.append( time.mktime(tmid.timetuple()) )
+        # Assemble pass table from the transits
+        table = np.zeros(len(transits),dtype=PASS_DTYPE)
+        table['aos'] = [transit[0].timestamp() for transit in transits]
+        table['los'] = [transit[1].timestamp() for transit in transits]
+        table['tca'] = 0.5*( table['aos'] + table['los'] )
+        for key in ['max_el','az_aos','az_los','sunlit','orbit','dark']:
+            table[key] = np.nan
+        self.passes = table
                 
         return transits
 
-    # Function to return current radiantinfo
-    def current_radiant_position(self):
-        self.obs.date = datetime.utcnow()
+    # Function to return current radiantinfo.  The Sun, Moon & radiants move
+    # slowly so this is interpolated from a cache that is only updated every
+    # SUN_UPDATE_INTERVAL secs - see celestial.py
+    def current_radiant_position(self,t=None):
+        if t==None:
+            t = time.time()
+        return POSITIONS.get( (self.name,tuple(self.qth)), t, self.radiant_position )
+
+    # Function to compute radiant info at unix time t
+    def radiant_position(self,t):
+
+        # The Sun & Moon come from the precomputed ephemeris
+        if self.name in EPHEM_BODIES:
+            obs = body_observe(self.name,[t],self.qth)
+            return [float(obs[key][0]) for key in
+                    ['azimuth','elevation','latitude','longitude','illum']]
+
+        self.obs.date = datetime.fromtimestamp(t,tz=timezone.utc)
         self.radiant.compute(self.obs)
         az=self.radiant.az
         el=self.radiant.alt
@@ -710,7 +675,7 @@ class SATELLITE:
                   '\n\taz=',az,'\tel=',el, \
                   '\n\tlat=',lat,'\t','lon=',lon,
                   '\nIllumination=',illum,'%')
-        return [az*RAD2DEG, el*RAD2DEG, lat, lon, illum]
+        return [az*RAD2DEG, el*RAD2DEG, lat, lon, float(illum)]
     
     # Function to compute moon track for a single pass
     def gen_radiant_track(self,t1,t2=None,dt=10.*MINS2DAYS,VERBOSITY=0):
@@ -739,7 +704,6 @@ class SATELLITE:
             if isinstance(t2,float):
                 # Assume it local time and convert to utc
                 t2 = datetime.fromtimestamp(t2,tz=timezone.utc)
-                t2 = datetime.fromtimestamp(t2)
             t2=ephem.Date(t2)
 
         else:
@@ -760,43 +724,24 @@ class SATELLITE:
                 setting=self.obs.next_setting(self.radiant)
             except:
                 setting=self.obs.date+1
-            local2=ephem.localtime(setting)
-            #print('Next Moon setting:',setting,'\t',local2)
+            #print('Next Moon setting:',setting)
             #print('az/el=',moon.az,moon.alt)
             
             t1=rise
             t2=setting
-            #print('Rise=',t1,type(t1),local1,'\tSet=',t2,type(t2),local2)
-
-        # Compute track
-        t=t1
-        Done=False
-        tt=[]
-        az=[]
-        el=[]
-        lats=[]
-        lons=[]
-        footprints=[]
-        while not Done:
-            if t>=t2:
-                Done=True
-                t=t2
-            self.obs.date=t
-            self.radiant.compute(self.obs)
-
-            local=ephem.localtime(t).timestamp()
-            tt.append(local)
-            az.append(self.radiant.az*RAD2DEG)
-            el.append(self.radiant.alt*RAD2DEG)
-            if VERBOSITY>0:
-                print('Track: t=',self.obs.date,'\taz=',self.radiant.az,'\tel=',self.radiant.alt)
-            
-            t+=dt
-
-        local1=local1.timestamp()
-        local2=local2.timestamp()
-        info=[rise,az[0],None,None,setting,az[-1]]
-        transit=TRANSIT(info,tt,az,el,lats,lons,footprints)
+            #print('Rise=',t1,type(t1),local1,'\tSet=',t2,type(t2))
+
+        # Compute whole track in one shot (see celestial.py) - times are unix secs
+        tstart = ephem.localtime(t1).timestamp()
+        tend   = ephem.localtime(t2).timestamp()
+        tt     = np.append( np.arange(tstart,tend,dt*86400.), tend )
+        az,el  = body_azel(self.radiant,self.qth,tt)
+        if VERBOSITY>1:
+            for t,a,e in zip(tt,az,el):
+                print('Track: t=',datetime.fromtimestamp(t),'\taz=',a,'\tel=',e)
+
+        track={'t':tt,'az':az,'el':el,'lats':[],'lons':[],'footprints':[]}
+        transit=TRANSIT(tstart,tend,track=track)
         
         return transit
 
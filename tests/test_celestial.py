@@ -0,0 +1,85 @@
+################################################################################
+#
+# test_celestial.py - Rev 1.0
+# Copyright (C) 2026 by Joseph B. Attili, joe DOT aa2il AT gmail DOT com
+#
+# Checks the rises & sets of fixed radiants against ephem.
+#
+################################################################################
+
+import os
+import sys
+from datetime import datetime, timezone
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+ephem = pytest.importorskip('ephem')
+pytest.importorskip('constants')
+
+from celestial import radiant_passes
+
+################################################################################
+
+QTH = (32.98, 116.8, 602.)
+T0  = datetime(2026, 3, 3, tzinfo=timezone.utc).timestamp()
+T2  = T0 + 3*86400
+
+################################################################################
+
+# Function to find the rises & sets of a radiant between T0 & T2 with ephem
+def ephem_rise_set(ra, dec):
+    obs = ephem.Observer()
+    obs.lat  = str(QTH[0])
+    obs.lon  = str(-QTH[1])
+    obs.elevation = QTH[2]
+    obs.pressure  = 0
+    obs.date = datetime.fromtimestamp(T0, tz=timezone.utc)
+
+    body = ephem.FixedBody()
+    body._ra    = str(ra/15.)
+    body._dec   = str(dec)
+    body._epoch = ephem.J2000
+
+    rises = []
+    sets  = []
+    while True:
+        rise = obs.next_rising(body)
+        set  = obs.next_setting(body, start=rise)
+        t    = rise.datetime().replace(tzinfo=timezone.utc).timestamp()
+        if t > T2:
+            break
+        rises.append(t)
+        sets.append(set.datetime().replace(tzinfo=timezone.utc).timestamp())
+        obs.date = set
+    return np.array(rises), np.array(sets)
+
+# Rise & set times of the Geminid radiant should agree with ephem to a few
+# secs - nutation & aberration are ignored
+def test_radiant_rise_set():
+    ra, dec = 112., 33.
+    passes  = radiant_passes(ra, dec, QTH, T0, T2)[0]
+    rises, sets = ephem_rise_set(ra, dec)
+
+    assert len(passes) == len(rises) == 3
+    assert np.max(np.abs(passes['aos'] - rises)) < 5
+    assert np.max(np.abs(passes['los'] - sets)) < 5
+    assert np.all(passes['tca'] > passes['aos'])
+    assert np.all(passes['tca'] < passes['los'])
+    assert np.allclose(passes['max_el'], 90. - abs(QTH[0] - dec), atol=0.5)
+
+# A radiant far enough south never gets above the horizon
+def test_radiant_never_rises():
+    with pytest.raises(ephem.NeverUpError):
+        ephem_rise_set(0., -70.)
+    passes = radiant_passes(0., -70., QTH, T0, T2)[0]
+    assert len(passes) == 0
+
+# One far enough north never sets and gets back-to-back passes
+def test_radiant_never_sets():
+    with pytest.raises(ephem.AlwaysUpError):
+        ephem_rise_set(0., 80.)
+    passes = radiant_passes(0., 80., QTH, T0, T2)[0]
+    assert len(passes) >= 3
+    assert np.allclose(passes['aos'][1:], passes['los'][:-1])
+    assert passes['aos'][0] - T0 < 86400
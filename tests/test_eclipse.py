@@ -0,0 +1,61 @@
+################################################################################
+#
+# test_eclipse.py - Rev 1.0
+# Copyright (C) 2026 by Joseph B. Attili, joe DOT aa2il AT gmail DOT com
+#
+# Checks the shadow entry/exit times and the sunlit fractions of the passes
+# against a brute force look at the eclipse depth.
+#
+################################################################################
+
+import os
+import sys
+from datetime import datetime, timezone
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+pytest.importorskip('ephem')
+pytest.importorskip('constants')
+
+from propagator import PROPAGATOR
+from pass_finder import find_passes
+from eclipse import find_sunlit_windows
+
+################################################################################
+
+TLE = ['ISS',
+       '1 25544U 98067A   26061.93054995  .00009325  00000-0  18075-3 0  9992',
+       '2 25544  51.6319 105.7724 0008215 150.8374 209.3074 15.48408287555284']
+QTH = (32.98, 116.8, 602.)
+T0  = datetime(2026, 3, 3, tzinfo=timezone.utc).timestamp()
+
+################################################################################
+
+# The sat should go in & out of the shadow right at the ends of each window
+def test_sunlit_windows():
+    prop = PROPAGATOR([TLE])
+    t2   = T0 + 86400
+    win  = find_sunlit_windows(prop, T0, t2)[0]
+    assert len(win) > 10
+
+    edges = np.concatenate((win['start'][win['start'] > T0],
+                            win['end'][win['end'] < t2]))
+    inside  = np.concatenate((win['start'][win['start'] > T0] + 2,
+                              win['end'][win['end'] < t2] - 2))
+    outside = np.concatenate((win['start'][win['start'] > T0] - 2,
+                              win['end'][win['end'] < t2] + 2))
+    isat = np.zeros(len(edges), dtype=int)
+    assert np.all(prop.eclipse_pairs(isat, inside) < 0)
+    assert np.all(prop.eclipse_pairs(isat, outside) >= 0)
+
+# Sunlit fraction of each pass should match sampling the pass every second
+def test_pass_sunlit_fraction():
+    prop   = PROPAGATOR([TLE])
+    passes = find_passes(prop, QTH, T0, T0 + 2*86400)[0]
+    assert len(passes) > 5
+
+    for row in passes:
+        t = np.arange(row['aos'], row['los'], 1.)
+        d = prop.eclipse_pairs(np.zeros(len(t), dtype=int), t)
+        assert abs(np.mean(d < 0) - row['sunlit']) < 0.01
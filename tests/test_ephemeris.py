@@ -0,0 +1,102 @@
+################################################################################
+#
+# test_ephemeris.py - Rev 1.0
+# Copyright (C) 2026 by Joseph B. Attili, joe DOT aa2il AT gmail DOT com
+#
+# Checks the Chebyshev fits of the Sun & Moon against ephem.
+#
+################################################################################
+
+import os
+import sys
+from datetime import datetime, timezone
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+ephem = pytest.importorskip('ephem')
+pytest.importorskip('constants')
+
+import ephemeris
+from ephemeris import EPHEMERIS,EPHEM_BODIES,body_eci,body_observe,moon_lunation
+
+################################################################################
+
+QTH  = (32.98, 116.8, 602.)
+T0   = datetime(2026, 3, 3, tzinfo=timezone.utc).timestamp()
+TEST = T0 + 86400*np.linspace(0, 30, 97)
+
+################################################################################
+
+# Build this year's ephemerides in a scratch dir rather than the user's cache
+@pytest.fixture
+def ephemerides(tmp_path, monkeypatch):
+    for body in EPHEM_BODIES:
+        monkeypatch.setitem(ephemeris.EPHEMERIDES, (body, 2026),
+                            EPHEMERIS(body, 2026, cache_dir=str(tmp_path)))
+    return tmp_path
+
+# Function to return the angle (deg) between two arrays of vectors
+def angle(a, b):
+    c = np.sum(a*b, axis=-1) / np.linalg.norm(a, axis=-1) / np.linalg.norm(b, axis=-1)
+    return np.degrees(np.arccos(np.clip(c, -1., 1.)))
+
+# Geocentric positions should agree with ephem to a few thousandths of a deg
+@pytest.mark.parametrize('body', EPHEM_BODIES)
+def test_body_eci(ephemerides, body):
+    pos, vel = body_eci(body, TEST)
+
+    b   = getattr(ephem, body)()
+    ref = np.zeros((len(TEST), 3))
+    for i, t in enumerate(TEST):
+        b.compute(datetime.fromtimestamp(t, tz=timezone.utc))
+        ra, de = b.g_ra, b.g_dec
+        ref[i] = np.array([np.cos(de)*np.cos(ra), np.cos(de)*np.sin(ra), np.sin(de)]) * \
+                 b.earth_distance*ephemeris.AU
+
+    assert np.max(angle(pos, ref)) < 0.003
+    assert np.max(np.abs(np.linalg.norm(pos, axis=-1)/np.linalg.norm(ref, axis=-1) - 1)) < 1e-5
+
+    # Velocity should be the rate of change of the position
+    dt = 10.
+    p2, _ = body_eci(body, TEST + dt)
+    assert np.max(angle(vel, (p2 - pos)/dt)) < 0.01
+
+# Az & el from the qth should agree with ephem (no refraction)
+@pytest.mark.parametrize('body', EPHEM_BODIES)
+def test_body_observe(ephemerides, body):
+    obs = body_observe(body, TEST, QTH)
+
+    o = ephem.Observer()
+    o.lat  = str(QTH[0])
+    o.lon  = str(-QTH[1])
+    o.elevation = QTH[2]
+    o.pressure  = 0
+    b  = getattr(ephem, body)()
+    az = np.zeros(len(TEST))
+    el = np.zeros(len(TEST))
+    for i, t in enumerate(TEST):
+        o.date = datetime.fromtimestamp(t, tz=timezone.utc)
+        b.compute(o)
+        az[i] = np.degrees(b.az)
+        el[i] = np.degrees(b.alt)
+
+    daz = (obs['azimuth'] - az + 180.) % 360. - 180.
+    assert np.max(np.abs(obs['elevation'] - el)) < 0.005
+    assert np.max(np.abs(daz*np.cos(np.radians(el)))) < 0.005
+
+# Lunation should be 0 at new moon & 0.5 near full moon.  The fits should
+# come back unchanged from the file.
+def test_moon_lunation(ephemerides):
+    new  = ephem.next_new_moon(ephem.Date(datetime.fromtimestamp(T0, tz=timezone.utc)))
+    full = ephem.next_full_moon(new)
+    tnew  = ephemeris.unix_time(new)
+    tfull = ephemeris.unix_time(full)
+
+    assert moon_lunation(tnew + 1)[0] < 1e-4
+    assert moon_lunation(tnew - 1)[0] > 1 - 1e-4
+    assert abs(moon_lunation(tfull)[0] - 0.5) < 0.05
+
+    e = EPHEMERIS('Moon', 2026, cache_dir=str(ephemerides))
+    assert np.array_equal(e.coefs, ephemeris.EPHEMERIDES[('Moon', 2026)].coefs)
+    assert np.array_equal(e.new_moons, ephemeris.EPHEMERIDES[('Moon', 2026)].new_moons)
@@ -0,0 +1,79 @@
+################################################################################
+#
+# test_propagator.py - Rev 1.0
+# Copyright (C) 2026 by Joseph B. Attili, joe DOT aa2il AT gmail DOT com
+#
+# Checks the vectorized SGP4 port against ephem for a fixed TLE, date & qth.
+#
+################################################################################
+
+import os
+import sys
+from datetime import datetime, timezone
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+ephem = pytest.importorskip('ephem')
+pytest.importorskip('constants')
+
+from propagator import PROPAGATOR
+
+################################################################################
+
+TLE = ['ISS',
+       '1 25544U 98067A   26061.93054995  .00009325  00000-0  18075-3 0  9992',
+       '2 25544  51.6319 105.7724 0008215 150.8374 209.3074 15.48408287555284']
+QTH = (32.98, 116.8, 602.)
+T0  = datetime(2026, 3, 3, tzinfo=timezone.utc).timestamp()
+
+# Function to observe the sat with ephem at unix times t
+def ephem_track(t):
+    sat = ephem.readtle(*TLE)
+    obs = ephem.Observer()
+    obs.lat = str(QTH[0])
+    obs.lon = str(-QTH[1])
+    obs.elevation = QTH[2]
+    obs.pressure = 0
+
+    d = dict([(key, np.zeros(len(t))) for key in
+              ['azimuth', 'elevation', 'slant_range', 'range_rate', 'longitude']])
+    for j, tt in enumerate(t):
+        obs.date = datetime.fromtimestamp(tt, tz=timezone.utc)
+        sat.compute(obs)
+        d['azimuth'][j]     = np.degrees(sat.az)
+        d['elevation'][j]   = np.degrees(sat.alt)
+        d['slant_range'][j] = 1e-3*sat.range
+        d['range_rate'][j]  = 1e-3*sat.range_velocity
+        d['longitude'][j]   = np.degrees(sat.sublong)
+    return d
+
+################################################################################
+
+# A day of ISS positions every 30 secs should agree with ephem
+def test_sgp4_matches_ephem():
+    t   = T0 + np.arange(0, 86400, 30.)
+    obs = PROPAGATOR([TLE]).observe(t, QTH)
+    ref = ephem_track(t)
+
+    up = ref['elevation'] > 0
+    assert np.count_nonzero(up) > 50
+
+    daz = (obs['azimuth'][0] - ref['azimuth'] + 180.) % 360. - 180.
+    dlon = (obs['longitude'][0] - ref['longitude'] + 180.) % 360. - 180.
+    assert np.max(np.abs(obs['elevation'][0] - ref['elevation'])) < 0.02
+    assert np.max(np.abs(daz[up])) < 0.02
+    assert np.max(np.abs(obs['slant_range'][0] - ref['slant_range'])) < 0.5
+    assert np.max(np.abs(obs['range_rate'][0] - ref['range_rate'])) < 0.005
+    assert np.max(np.abs(dlon)) < 0.01
+
+# Observing (sat,time) pairs should give the same as the full grid
+def test_observe_pairs_matches_grid():
+    prop = PROPAGATOR([TLE, TLE])
+    t    = T0 + np.arange(0, 3600, 60.)
+    grid = prop.observe(t, QTH)
+    isat = np.arange(len(t)) % 2
+    pair = prop.observe_pairs(isat, t, QTH)
+
+    for key in ['azimuth', 'elevation', 'slant_range', 'range_rate']:
+        assert np.allclose(pair[key], grid[key][isat, np.arange(len(t))])
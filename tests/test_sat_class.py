@@ -0,0 +1,66 @@
+################################################################################
+#
+# test_sat_class.py - Rev 1.0
+# Copyright (C) 2026 by Joseph B. Attili, joe DOT aa2il AT gmail DOT com
+#
+# Tests for building SATELLITE objects from pass tables that were computed
+# ahead of time (e.g. pulled from the pass cache by load_sat_data).
+#
+################################################################################
+
+import os
+import sys
+import datetime
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+pytest.importorskip('ephem')
+pytest.importorskip('rig_io')
+pytest.importorskip('widgets_qt')
+
+from pass_finder import PASS_DTYPE
+import sat_class
+from sat_class import SATELLITE
+
+################################################################################
+
+TLE = ('ISS\n'
+       '1 25544U 98067A   26061.93054995  .00009325  00000-0  18075-3 0  9992\n'
+       '2 25544  51.6319 105.7724 0008215 150.8374 209.3074 15.48408287555284')
+QTH = (32.98, 116.8, 602.)
+
+# A SATELLITE built with a (cached) pass table should take it as is
+def test_satellite_with_cached_passes(monkeypatch):
+    monkeypatch.setattr(sat_class, 'get_tle', lambda TLE, name: TLE)
+    monkeypatch.setattr(SATELLITE, 'get_transponders', lambda self: None)
+
+    table = np.zeros(2, dtype=PASS_DTYPE)
+    table['aos'] = [1.7673e9, 1.7674e9]
+    table['los'] = table['aos'] + 600.
+    table['tca'] = table['aos'] + 300.
+
+    date1 = datetime.datetime(2026, 1, 1)
+    date2 = date1 + datetime.timedelta(days=1)
+    sat = SATELLITE(1, 'ISS', QTH, date1, date2, TLE, {}, passes=table)
+
+    assert sat.passes.dtype == PASS_DTYPE
+    assert np.array_equal(sat.passes['aos'], table['aos'])
+
+# Same for a meteor shower with its pass table from celestial.shower_passes.
+# Low radiants still get marked at mid-pass.
+def test_shower_with_cached_passes():
+    from celestial import radiant_passes
+
+    class SHOWER:
+        RA = '230.0'
+        DE = '-30.0'
+
+    date1 = datetime.datetime(2026, 1, 1)
+    date2 = date1 + datetime.timedelta(days=2)
+    t1 = date1.timestamp()
+    table = radiant_passes(230., -30., QTH, t1, t1+2*86400)[0]
+    sat = SATELLITE(1, 'QUA', QTH, date1, date2, None, {'QUA': SHOWER}, passes=table)
+
+    assert np.array_equal(sat.passes['aos'], table['aos'])
+    assert np.all(sat.overhead())
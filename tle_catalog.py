@@ -0,0 +1,182 @@
+################################################################################
+#
+# tle_catalog.py - Rev 1.0
+# Copyright (C) 2026 by Joseph B. Attili, joe DOT aa2il AT gmail DOT com
+#
+# Catalog of TLEs indexed by sat name, alias and NORAD catalog number.
+#
+# The keps file (e.g. nasa.txt from AMSAT or a full file from CelesTrak) is
+# parsed once when we start up.  Each TLE is checked for the correct format
+# and checksums and then put into dicts so that lookups are quick.  Names
+# are matched without regard to case.  A few sats go by different names in
+# the keps than we use - these are in the alias table below.
+#
+# When we've been running for a while, the keps are read in again (see
+# read_keps) so the passes aren't computed from stale TLEs.
+#
+################################################################################
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+################################################################################
+
+import os
+import time
+import urllib.request
+from propagator import julian_date_of_epoch,SECDAY
+from utilities import error_trap
+
+################################################################################
+
+# Names we use --> names in the keps
+ALIASES = {'CAS-6' : 'TO-108',
+           'AO-7'  : 'AO-07',
+           'XW-3'  : 'XW 3',
+           'FS-3'  : 'Falconsat-3'}
+
+KEPS_MAX_AGE = 24           # Hours, keps older than this are fetched again
+
+################################################################################
+
+# Function to compute checksum of a TLE line - sum of digits with minus
+# signs counting as 1, mod 10
+def tle_checksum(line):
+    cs=0
+    for c in line[:68]:
+        if c.isdigit():
+            cs+=int(c)
+        elif c=='-':
+            cs+=1
+    return cs % 10
+
+# Function to check a TLE line
+def valid_line(line,n):
+    return len(line)>=69 and line[0]==str(n) and line[1]==' ' and \
+        line[68].isdigit() and int(line[68])==tle_checksum(line)
+
+# Function to form key for NORAD no. - leading zeros are dropped
+def norad_key(norad):
+    norad = str(norad).strip()
+    if norad.isdigit():
+        norad = norad.lstrip('0')
+    return norad
+
+################################################################################
+
+# The catalog
+class TLE_CATALOG:
+    def __init__(self,lines):
+
+        if isinstance(lines,str):
+            lines = lines.split('\n')
+        lines = [line.rstrip() for line in lines]
+
+        self.tles   = []            # List of [name,line1,line2]
+        self.names  = {}            # Upper case name --> index into tles
+        self.norads = {}            # NORAD no. --> index into tles
+        nbad=0
+
+        # Look for pairs of element lines - the name, if any, is just before
+        i=0
+        while i<len(lines)-1:
+            line1=lines[i]
+            line2=lines[i+1]
+            if not (line1[:2]=='1 ' and line2[:2]=='2 '):
+                i+=1
+                continue
+            if not ( valid_line(line1,1) and valid_line(line2,2) and
+                     line1[2:7]==line2[2:7] ):
+                nbad+=1
+                i+=2
+                continue
+            norad = norad_key( line1[2:7] )
+            if i>0 and lines[i-1].strip() and lines[i-1][:2] not in ['1 ','2 ']:
+                name = lines[i-1].strip()
+            else:
+                name = norad
+
+            idx = len(self.tles)
+            self.tles.append([name,line1[:69],line2[:69]])
+            self.names.setdefault(name.upper(),idx)
+            self.norads.setdefault(norad,idx)
+            i+=2
+
+        print('TLE CATALOG: Loaded',len(self.tles),'TLEs -',nbad,'bad TLEs skipped')
+
+    def __len__(self):
+        return len(self.tles)
+
+    def __contains__(self,sat):
+        return self.find(sat)!=None
+
+    # Function to return index of a sat given its name, alias or NORAD no.
+    def find(self,sat):
+        sat = str(sat).strip()
+        key = sat.upper()
+        if key in self.names:
+            return self.names[key]
+        if sat in ALIASES:
+            key = ALIASES[sat].upper()
+            if key in self.names:
+                return self.names[key]
+        return self.norads.get( norad_key(sat) )
+
+    # Function to return TLE for a sat as a 3-line string.  The name line is
+    # the name we asked for so that it matches the rest of the app.
+    def get(self,sat,name=None):
+        idx = self.find(sat)
+        if idx==None:
+            return None
+        tle = self.tles[idx]
+        if name==None:
+            name = sat
+        return name + '\n' + tle[1] + '\n' + tle[2] + '\n'
+
+    # Function to return NORAD catalog no. for a sat
+    def norad(self,sat):
+        idx = self.find(sat)
+        if idx==None:
+            return None
+        norad = self.tles[idx][1][2:7].strip()
+        if norad.isdigit():
+            return int(norad)
+        return norad
+
+    # Function to return TLE epoch (unix secs) for a sat
+    def epoch(self,sat):
+        idx = self.find(sat)
+        if idx==None:
+            return None
+        line1 = self.tles[idx][1]
+        epoch = 1000.*int( line1[18:20] ) + float( line1[20:32] )
+        return ( julian_date_of_epoch(epoch) - 2440587.5 )*SECDAY
+
+################################################################################
+
+# Function to read the keps file into a catalog.  If a url is given and the
+# file is older than max_age hours, a fresh copy is fetched first.
+def read_keps(fname,url=None,max_age=KEPS_MAX_AGE):
+
+    fname = os.path.expanduser(fname)
+    if url and ( not os.path.isfile(fname) or
+                 time.time()-os.path.getmtime(fname)>max_age*3600 ):
+        print('READ KEPS: Fetching',url,'...')
+        try:
+            response = urllib.request.urlopen(url)
+            html     = response.read().decode("utf-8")
+            with open(fname,'w') as fp:
+                fp.write(html)
+        except (OSError,UnicodeDecodeError):
+            error_trap('READ KEPS: Unable to fetch '+url)
+
+    with open(fname) as fp:
+        html = fp.read()
+    return TLE_CATALOG( html.replace('\r','').replace('\n\n','\n').split('\n') )
@@ -0,0 +1,100 @@
+################################################################################
+#
+# track_table.py - Rev 1.0
+# Copyright (C) 2026 by Joseph B. Attili, joe DOT aa2il AT gmail DOT com
+#
+# Dense look-up table of a sat's position & Doppler over a pass.
+#
+# The rig & rotor are updated every second while we're tracking a pass.
+# Rather than propagate the orbit each time, the pass is propagated once,
+# in one shot, on a fine time grid when it is selected.  The tracking loop
+# then interpolates from this table with cubic Hermite polynomials.  The
+# slopes come from the range rate for the slant range and from central
+# differences for everything else.  Azimuth and longitude are unwrapped
+# before interpolating so that they behave as they cross 0/360 & +/-180.
+#
+################################################################################
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+################################################################################
+
+import numpy as np
+
+################################################################################
+
+TABLE_DT   = 10.            # Secs, time step of table
+TABLE_PRE  = 10*60.         # Secs, start table this long before AOS ...
+TABLE_POST = 5*60.          # ... and end it this long after LOS
+KEYS       = ['azimuth','elevation','slant_range','range_rate','latitude',
+              'longitude','footprint','altitude','doppler']
+
+################################################################################
+
+# Structure to hold the table for a single sat
+class TRACK_TABLE:
+    def __init__(self,prop,qth,t1,t2,isat=0,dt=TABLE_DT):
+
+        self.qth = tuple(qth)
+        self.dt  = dt
+        self.t0  = t1
+        n        = max( int( np.ceil((t2-t1)/dt) ), 1 ) + 1
+        self.t   = t1 + dt*np.arange(n)
+        self.t1  = self.t[0]
+        self.t2  = self.t[-1]
+
+        # Propagate sat over the whole table at once
+        obs = prop.observe(self.t,qth)
+        self.orbit = obs['orbit'][isat]
+        vals = np.array( [obs[key][isat] for key in KEYS] )
+        iaz  = KEYS.index('azimuth')
+        ilon = KEYS.index('longitude')
+        vals[iaz]  = np.unwrap(vals[iaz], period=360.)
+        vals[ilon] = np.unwrap(vals[ilon],period=360.)
+
+        # Slopes (per time step) for the Hermite polynomials
+        slopes = np.gradient(vals,axis=1)
+        irng   = KEYS.index('slant_range')
+        slopes[irng] = dt*vals[KEYS.index('range_rate')]
+
+        self.vals   = vals
+        self.slopes = slopes
+
+    # Function to check if table covers time t
+    def covers(self,t,qth=None):
+        if qth!=None and tuple(qth)!=self.qth:
+            return False
+        return self.t1<=t<=self.t2
+
+    # Function to interpolate table at time t.  Returns a dict with the same
+    # fields as SATELLITE.observe()
+    def observe(self,t):
+
+        x = (t-self.t0)/self.dt
+        i = min( max( int(x), 0 ), len(self.t)-2 )
+        s = x-i
+
+        # Cubic Hermite basis functions
+        s2  = s*s
+        s3  = s2*s
+        h00 = 2*s3 - 3*s2 + 1
+        h10 = s3 - 2*s2 + s
+        h01 = -2*s3 + 3*s2
+        h11 = s3 - s2
+
+        y = h00*self.vals[:,i] + h10*self.slopes[:,i] + \
+            h01*self.vals[:,i+1] + h11*self.slopes[:,i+1]
+
+        d = dict( zip(KEYS,y.tolist()) )
+        d['azimuth']   = d['azimuth'] % 360.
+        d['longitude'] = (d['longitude']+180.) % 360. - 180.
+        d['orbit']     = self.orbit[i] if s<0.5 else self.orbit[i+1]
+        return d
@@ -40,6 +40,10 @@ class WatchDog:
     def Monitor(self):
         gui=self.P.gui
         print('WatchDog...',gui.date1)
+
+        # Slide window of predicted passes as time marches on
+        gui.slide_window()
+        gui.apply_new_window()
         
         # Draw line showing current time
         if gui.now: